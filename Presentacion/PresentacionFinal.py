@@ -1,10 +1,41 @@
+import time
+INICIO_PROCESO = time.perf_counter()
+
 import sys
 import sqlite3
-from PySide6.QtWidgets import *
-from PySide6.QtCore import Qt, QDate
-from PySide6.QtGui import QAction
+from datetime import datetime
+from PySide6.QtWidgets import (
+    QAbstractItemView, QApplication, QComboBox, QDialog, QFileDialog, QFormLayout,
+    QFrame, QHBoxLayout, QHeaderView, QLabel, QLineEdit, QListWidget, QListWidgetItem,
+    QMainWindow, QMessageBox, QPlainTextEdit, QProgressDialog, QPushButton, QStackedWidget,
+    QTableView, QVBoxLayout, QWidget
+)
+from PySide6.QtCore import Qt, QDate, QTimer
+from PySide6.QtGui import QAction, QColor, QKeySequence, QShortcut
 import os
 
+from modelo_inscriptos import InscriptosTableModel
+from busqueda_en_vivo import BuscadorEnSegundoPlano
+import validaciones
+from importacion import importar_csv
+from exportacion import exportar, formato_desde_ruta, parquet_disponible
+from tareas import TareaEnSegundoPlano
+from repositorio import InscriptosRepository, EscritorAgrupado
+from paginacion import TAMANIOS_PAGINA
+from tablero import TableroReportes
+from consultas import consultas_de_pantallas, plan_de_consulta
+from asistencia import ControlAsistencia, PRESENTE, YA_PRESENTE, NO_INSCRIPTO
+import instrumentacion
+from instrumentacion import medido
+from panel_diagnostico import PanelDiagnostico
+from sincronizacion import Replicador
+from envio_registros import EnvioDeRegistros
+from registro import Inscripto
+from duplicados import detectar_duplicados
+from revision_duplicados import RevisionDuplicados
+from documentos import generar_documentos
+from notificaciones import Notificador
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -15,6 +46,19 @@ class MainWindow(QMainWindow):
         self.init_db()
         self.cargar_datos_ejemplo()
         
+        # Índice de DNI para el control de asistencia, armado en segundo plano
+        self.asistencia = ControlAsistencia(self.repo)
+        self.tarea_asistencia = TareaEnSegundoPlano(self.asistencia.cargar,
+                                                    liberar=self.repo.liberar, parent=self)
+        self.tarea_asistencia.terminado.connect(lambda _: self.actualizar_contador_asistencia())
+        self.tarea_asistencia.iniciar()
+        
+        # Las asistencias se guardan en lote cada segundo
+        self.asistencia_timer = QTimer(self)
+        self.asistencia_timer.setInterval(1000)
+        self.asistencia_timer.timeout.connect(self.guardar_asistencias)
+        self.asistencia_timer.start()
+        
         # Widget central
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -31,37 +75,59 @@ class MainWindow(QMainWindow):
         self.content_area = QStackedWidget()
         main_layout.addWidget(self.content_area, 1)
         
-        # Páginas
-        self.create_registration_page()
-        self.create_search_page()
-        self.create_list_page()
-        self.create_reports_page()
+        # Páginas: se construyen recién cuando se navega a cada una.
+        # Mientras tanto el QStackedWidget tiene un widget vacío en su lugar.
+        self.constructores_paginas = [
+            self.create_registration_page,
+            self.create_search_page,
+            self.create_list_page,
+            self.create_reports_page,
+            self.create_checkin_page
+        ]
+        self.paginas = [None] * len(self.constructores_paginas)
+        for _ in self.constructores_paginas:
+            self.content_area.addWidget(QWidget())
+        self.mostrar_seccion(0)
         
         # Barra de menú
         self.create_menu_bar()
+        
+        # Estado de la sincronización con el central, si está activa
+        if self.replicador is not None:
+            self.recibidos_mostrados = 0
+            self.sincronizacion_timer = QTimer(self)
+            self.sincronizacion_timer.setInterval(2000)
+            self.sincronizacion_timer.timeout.connect(self.actualizar_estado_sincronizacion)
+            self.sincronizacion_timer.start()
 
     def init_db(self):
         """Inicializa la base de datos SQLite"""
-        self.conn = sqlite3.connect('inscripciones.db')
-        self.cursor = self.conn.cursor()
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS inscriptos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                nombre TEXT NOT NULL,
-                apellido TEXT NOT NULL,
-                dni TEXT UNIQUE NOT NULL,
-                email TEXT NOT NULL,
-                telefono TEXT,
-                fecha_inscripcion DATE,
-                institucion TEXT
-            )
-        ''')
-        self.conn.commit()
+        # Todo el SQL vive en el repositorio; la ventana usa la conexión
+        # de su propio hilo y los hilos de trabajo piden la suya
+        self.repo = InscriptosRepository().inicializar()
+        self.conn = self.repo.conexion()
+        
+        # El formulario escribe en un hilo aparte (con group commit opcional),
+        # así el puesto puede seguir cargando mientras se guarda
+        self.escritor = EscritorAgrupado(self.repo)
+        self.envio_registros = EnvioDeRegistros(self.escritor, self)
+        self.envio_registros.registrado.connect(self.registro_confirmado)
+        self.envio_registros.rechazado.connect(self.registro_rechazado)
+        self.registros_en_curso = {}
+        
+        # Sincronización con el servidor central (varios puestos)
+        self.replicador = Replicador.desde_configuracion(self.repo)
+        if self.replicador is not None:
+            self.replicador.iniciar()
+        
+        # Emails de confirmación: el alta solo los deja en la bandeja de salida
+        self.notificador = Notificador.desde_configuracion(self.repo)
+        if self.notificador is not None:
+            self.notificador.iniciar()
 
     def cargar_datos_ejemplo(self):
         """Carga datos de ejemplo si la tabla está vacía"""
-        self.cursor.execute("SELECT COUNT(*) FROM inscriptos")
-        count = self.cursor.fetchone()[0]
+        count = self.repo.total()
         
         if count == 0:
             participantes_ejemplo = [
@@ -73,12 +139,7 @@ class MainWindow(QMainWindow):
             ]
             
             try:
-                self.cursor.executemany('''
-                    INSERT INTO inscriptos 
-                    (nombre, apellido, dni, email, telefono, fecha_inscripcion, institucion)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', participantes_ejemplo)
-                self.conn.commit()
+                self.repo.insertar_lote(participantes_ejemplo)
                 print("Datos de ejemplo cargados correctamente")
             except sqlite3.IntegrityError as e:
                 print(f"Error al cargar datos de ejemplo: {e}")
@@ -132,7 +193,8 @@ class MainWindow(QMainWindow):
             ("📝 Registrar Participante", 0),
             ("🔍 Buscar Inscriptos", 1),
             ("📋 Lista de Inscriptos", 2),
-            ("📊 Generar Reportes", 3)
+            ("📊 Generar Reportes", 3),
+            ("✅ Control de Asistencia", 4)
         ]
         
         self.menu_buttons = []
@@ -140,7 +202,7 @@ class MainWindow(QMainWindow):
             btn = QPushButton(text)
             btn.setFixedSize(240, 70)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.clicked.connect(lambda checked, idx=index: self.content_area.setCurrentIndex(idx))
+            btn.clicked.connect(lambda checked, idx=index: self.mostrar_seccion(idx))
             
             # Estilo específico para botones del menú
             btn.setStyleSheet("""
@@ -181,6 +243,20 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(side_panel)
 
+    def mostrar_seccion(self, indice):
+        """Muestra una página, construyéndola la primera vez"""
+        if self.paginas[indice] is None:
+            page = self.constructores_paginas[indice]()
+            marcador = self.content_area.widget(indice)
+            self.content_area.insertWidget(indice, page)
+            self.content_area.removeWidget(marcador)
+            marcador.deleteLater()
+            self.paginas[indice] = page
+        self.content_area.setCurrentIndex(indice)
+
+    def pagina_construida(self, indice):
+        return self.paginas[indice] is not None
+
     def create_menu_bar(self):
         """Crea la barra de menú superior"""
         menubar = self.menuBar()
@@ -188,13 +264,38 @@ class MainWindow(QMainWindow):
         # Menú Archivo
         file_menu = menubar.addMenu('Archivo')
         
+        import_action = QAction('Importar datos...', self)
+        import_action.triggered.connect(self.importar_datos)
         export_action = QAction('Exportar datos', self)
+        export_action.triggered.connect(self.exportar_datos)
+        duplicados_action = QAction('Buscar duplicados...', self)
+        duplicados_action.triggered.connect(self.buscar_duplicados)
+        credenciales_action = QAction('Generar credenciales...', self)
+        credenciales_action.triggered.connect(lambda: self.generar_documentos("credencial"))
+        certificados_action = QAction('Generar certificados de asistencia...', self)
+        certificados_action.triggered.connect(lambda: self.generar_documentos("certificado"))
         exit_action = QAction('Salir', self)
         exit_action.triggered.connect(self.close)
         
+        file_menu.addAction(import_action)
         file_menu.addAction(export_action)
+        file_menu.addAction(duplicados_action)
+        file_menu.addSeparator()
+        file_menu.addAction(credenciales_action)
+        file_menu.addAction(certificados_action)
         file_menu.addSeparator()
         file_menu.addAction(exit_action)
+        
+        # Menú Diagnóstico
+        debug_menu = menubar.addMenu('Diagnóstico')
+        plan_action = QAction('Plan de consultas', self)
+        plan_action.triggered.connect(self.mostrar_planes_de_consulta)
+        debug_menu.addAction(plan_action)
+        
+        # Panel oculto de tiempos (no está en el menú)
+        self.panel_diagnostico = None
+        atajo = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        atajo.activated.connect(self.mostrar_panel_diagnostico)
 
     def create_registration_page(self):
         """Crea la página de registro de participantes"""
@@ -308,7 +409,17 @@ class MainWindow(QMainWindow):
         nota.setWordWrap(True)
         layout.addWidget(nota)
         
-        self.content_area.addWidget(page)
+        # Resultado de los últimos registros (llega en segundo plano)
+        recientes_label = QLabel("Últimos registros (doble clic en uno rechazado para corregirlo):")
+        recientes_label.setStyleSheet("font-size: 14px; color: #2c3e50; margin-left: 120px;")
+        layout.addWidget(recientes_label)
+        self.registros_recientes = QListWidget()
+        self.registros_recientes.setMaximumHeight(160)
+        self.registros_recientes.setStyleSheet("font-size: 14px; margin: 0 120px;")
+        self.registros_recientes.itemDoubleClicked.connect(self.recuperar_registro)
+        layout.addWidget(self.registros_recientes)
+        
+        return page
 
     def create_search_page(self):
         """Crea la página de búsqueda"""
@@ -351,14 +462,29 @@ class MainWindow(QMainWindow):
         search_layout.addWidget(self.search_input)
         search_layout.addWidget(btn_buscar)
         
+        # Búsqueda mientras se escribe: espera una pausa en el tipeo y
+        # consulta en segundo plano para no trabar la interfaz
+        self.buscador = BuscadorEnSegundoPlano(self.repo, parent=self)
+        self.buscador.resultados_listos.connect(self.mostrar_resultados_en_vivo)
+        self.buscador.fallo.connect(self.busqueda_en_vivo_fallida)
+        
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(self.buscar_en_vivo)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.search_input.returnPressed.connect(self.buscar_inscriptos)
+        
         # Tabla de resultados
-        self.search_table = QTableWidget()
+        self.search_model = InscriptosTableModel(self)
+        self.search_table = QTableView()
+        self.search_table.setModel(self.search_model)
         self.configurar_tabla(self.search_table)
         
         layout.addLayout(search_layout)
         layout.addWidget(self.search_table)
 
-        self.content_area.addWidget(page)
+        return page
 
     def create_list_page(self):
         """Crea la página de listado de inscriptos"""
@@ -408,22 +534,60 @@ class MainWindow(QMainWindow):
         control_layout.addWidget(btn_ordenar_fecha)
         control_layout.addStretch()
         
+        # Controles de paginación
+        pagina_layout = QHBoxLayout()
+        pagina_layout.setContentsMargins(80, 0, 80, 10)
+        
+        self.btn_pagina_anterior = QPushButton("◀ Anterior")
+        self.btn_pagina_siguiente = QPushButton("Siguiente ▶")
+        for btn in [self.btn_pagina_anterior, self.btn_pagina_siguiente]:
+            btn.setStyleSheet(button_style)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setFixedHeight(40)
+        self.btn_pagina_anterior.clicked.connect(lambda: self.mostrar_pagina(self.paginador.anterior()))
+        self.btn_pagina_siguiente.clicked.connect(lambda: self.mostrar_pagina(self.paginador.siguiente()))
+        
+        self.tamanio_pagina = QComboBox()
+        for tamanio in TAMANIOS_PAGINA:
+            self.tamanio_pagina.addItem(f"{tamanio} por página", tamanio)
+        self.tamanio_pagina.setCurrentIndex(1)
+        self.tamanio_pagina.currentIndexChanged.connect(
+            lambda: self.mostrar_pagina(self.paginador.cambiar_tamanio(self.tamanio_pagina.currentData())))
+        
+        self.saltar_letra = QComboBox()
+        self.saltar_letra.addItem("Ir a letra...")
+        self.saltar_letra.addItems(list("ABCDEFGHIJKLMNÑOPQRSTUVWXYZ"))
+        self.saltar_letra.setEnabled(False)
+        self.saltar_letra.activated.connect(self.saltar_a_letra)
+        
+        self.info_pagina = QLabel()
+        self.info_pagina.setStyleSheet("color: #7f8c8d; font-size: 14px;")
+        
+        pagina_layout.addWidget(self.btn_pagina_anterior)
+        pagina_layout.addWidget(self.btn_pagina_siguiente)
+        pagina_layout.addWidget(self.tamanio_pagina)
+        pagina_layout.addWidget(self.saltar_letra)
+        pagina_layout.addStretch()
+        pagina_layout.addWidget(self.info_pagina)
+        
         # Tabla de inscriptos
-        self.list_table = QTableWidget()
+        self.list_model = InscriptosTableModel(self)
+        self.list_table = QTableView()
+        self.list_table.setModel(self.list_model)
         self.configurar_tabla(self.list_table)
+        self.paginador = self.repo.paginador(self.tamanio_pagina.currentData())
         
         layout.addLayout(control_layout)
+        layout.addLayout(pagina_layout)
         layout.addWidget(self.list_table)
         
-        self.actualizar_lista_inscriptos()
-        self.content_area.addWidget(page)
+        # La primera carga se hace después de mostrar la página
+        QTimer.singleShot(0, self.actualizar_lista_inscriptos)
+        return page
 
     def configurar_tabla(self, tabla):
         """Configura una tabla para mostrar información completa"""
-        tabla.setColumnCount(7)
-        tabla.setHorizontalHeaderLabels([
-            "ID", "Nombre", "Apellido", "DNI", "Email", "Teléfono", "Institución"
-        ])
+        # Los encabezados los provee el modelo (InscriptosTableModel)
         
         # Ajustar el comportamiento de las columnas
         header = tabla.horizontalHeader()
@@ -434,13 +598,16 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(4, QHeaderView.Stretch)           # Email (se expande)
         header.setSectionResizeMode(5, QHeaderView.ResizeToContents)  # Teléfono
         header.setSectionResizeMode(6, QHeaderView.Stretch)           # Institución (se expande)
+        # Medir solo las filas visibles, no toda la tabla
+        header.setResizeContentsPrecision(0)
         
-        # Permitir que el texto se envuelva en las celdas
-        tabla.setWordWrap(True)
+        tabla.setWordWrap(False)
         tabla.setAlternatingRowColors(True)
+        tabla.setSelectionBehavior(QAbstractItemView.SelectRows)
         
-        # Ajustar altura de las filas para mostrar contenido completo
-        tabla.resizeRowsToContents()
+        # Altura de fila fija: evita resizeRowsToContents() sobre miles de filas
+        tabla.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        tabla.verticalHeader().setDefaultSectionSize(36)
 
     def create_reports_page(self):
         """Crea la página de reportes"""
@@ -454,22 +621,23 @@ class MainWindow(QMainWindow):
         layout.addWidget(title)
         
         # Contenedor para centrar los botones
-        buttons_container = QVBoxLayout()
+        buttons_container = QHBoxLayout()
         buttons_container.setAlignment(Qt.AlignCenter)
-        buttons_container.setContentsMargins(150, 100, 150, 100)
-        buttons_container.setSpacing(40)
+        buttons_container.setContentsMargins(40, 10, 40, 20)
+        buttons_container.setSpacing(30)
         
         # Botones de reportes
         btn_reporte_total = QPushButton("Generar Reporte Total")
         btn_reporte_instituciones = QPushButton("Reporte por Instituciones")
+        btn_reporte_diario = QPushButton("Inscripciones por Día")
         
         # Estilo para botones de reportes
         report_button_style = """
             QPushButton {
                 background-color: #27ae60;
                 color: white;
-                padding: 25px;
-                font-size: 17px;
+                padding: 15px;
+                font-size: 16px;
                 border-radius: 8px;
                 font-weight: bold;
             }
@@ -478,30 +646,137 @@ class MainWindow(QMainWindow):
             }
         """
         
-        for btn in [btn_reporte_total, btn_reporte_instituciones]:
+        for btn in [btn_reporte_total, btn_reporte_instituciones, btn_reporte_diario]:
             btn.setStyleSheet(report_button_style)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.setFixedSize(320, 80)
+            btn.setFixedSize(280, 60)
             buttons_container.addWidget(btn, alignment=Qt.AlignCenter)
         
         btn_reporte_total.clicked.connect(self.generar_reporte_total)
         btn_reporte_instituciones.clicked.connect(self.generar_reporte_instituciones)
+        btn_reporte_diario.clicked.connect(self.generar_reporte_diario)
         
         layout.addLayout(buttons_container)
-        layout.addStretch()
         
-        self.content_area.addWidget(page)
+        # Tablero que se actualiza solo (sirve para dejarlo en un proyector)
+        self.tablero = TableroReportes()
+        layout.addWidget(self.tablero, 1)
+        
+        self.version_tablero = None
+        self.tablero_timer = QTimer(self)
+        self.tablero_timer.setInterval(5000)
+        self.tablero_timer.timeout.connect(self.refrescar_tablero)
+        self.tablero_timer.start()
+        
+        self.content_area.currentChanged.connect(lambda _: self.refrescar_tablero())
+        QTimer.singleShot(0, self.refrescar_tablero)
+        return page
+
+    def create_checkin_page(self):
+        """Crea la página de control de asistencia (ingreso al evento)"""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setAlignment(Qt.AlignTop)
+        
+        # Título
+        title = QLabel("Control de Asistencia")
+        title.setStyleSheet("font-size: 26px; font-weight: bold; margin: 25px; color: #2c3e50;")
+        title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title)
+        
+        # Campo de DNI: funciona con lector de código de barras (termina en Enter)
+        self.checkin_input = QLineEdit()
+        self.checkin_input.setPlaceholderText("Escanee o escriba el DNI y presione Enter")
+        self.checkin_input.setStyleSheet("padding: 20px; font-size: 24px; border: 2px solid #bdc3c7; border-radius: 8px;")
+        self.checkin_input.returnPressed.connect(self.marcar_asistencia)
+        
+        input_layout = QHBoxLayout()
+        input_layout.setContentsMargins(150, 10, 150, 10)
+        input_layout.addWidget(self.checkin_input)
+        layout.addLayout(input_layout)
+        
+        # Resultado del último escaneo
+        self.checkin_resultado = QLabel("")
+        self.checkin_resultado.setAlignment(Qt.AlignCenter)
+        self.checkin_resultado.setWordWrap(True)
+        self.checkin_resultado.setMinimumHeight(120)
+        layout.addWidget(self.checkin_resultado)
+        
+        # Contador de presentes
+        self.checkin_contador = QLabel("")
+        self.checkin_contador.setAlignment(Qt.AlignCenter)
+        self.checkin_contador.setStyleSheet("font-size: 18px; color: #2c3e50; margin: 10px;")
+        layout.addWidget(self.checkin_contador)
+        
+        # Últimos ingresos
+        self.checkin_historial = QListWidget()
+        self.checkin_historial.setStyleSheet("font-size: 15px; margin: 10px 150px;")
+        layout.addWidget(self.checkin_historial, 1)
+        
+        self.actualizar_contador_asistencia()
+        QTimer.singleShot(0, self.checkin_input.setFocus)
+        return page
+
+    def marcar_asistencia(self):
+        """Marca presente al DNI escaneado y deja el campo listo para el siguiente"""
+        dni = self.checkin_input.text().strip()
+        self.checkin_input.clear()
+        if not dni:
+            return
+        
+        resultado, datos = self.asistencia.marcar(dni)
+        if resultado == PRESENTE:
+            texto = f"✓ Bienvenido/a {datos.nombre} {datos.apellido}"
+            if datos.institucion:
+                texto += f"\n{datos.institucion}"
+            color = "#27ae60"
+            self.checkin_historial.insertItem(0, f"{datetime.now().strftime('%H:%M:%S')}  "
+                                                 f"{dni} - {datos.apellido}, {datos.nombre}")
+            while self.checkin_historial.count() > 20:
+                self.checkin_historial.takeItem(self.checkin_historial.count() - 1)
+        elif resultado == YA_PRESENTE:
+            texto = f"⚠ {datos.nombre} {datos.apellido} ya registró su ingreso"
+            color = "#e67e22"
+        elif resultado == NO_INSCRIPTO:
+            texto = f"✗ El DNI {dni} no está inscripto"
+            color = "#c0392b"
+        else:
+            texto = "Cargando inscriptos, intente en un momento..."
+            color = "#7f8c8d"
+        
+        self.checkin_resultado.setText(texto)
+        self.checkin_resultado.setStyleSheet(f"font-size: 28px; font-weight: bold; color: {color}; margin: 20px;")
+        self.actualizar_contador_asistencia()
+
+    def actualizar_contador_asistencia(self):
+        """Muestra cuántos inscriptos ya ingresaron"""
+        if not self.pagina_construida(4):
+            return
+        if self.asistencia.listo:
+            self.checkin_contador.setText(f"Presentes: {self.asistencia.presentes} de {self.asistencia.total}")
+        else:
+            self.checkin_contador.setText("Cargando inscriptos...")
+
+    def guardar_asistencias(self):
+        """Guarda en la base las asistencias acumuladas desde el último guardado"""
+        if not self.asistencia.hay_pendientes():
+            return
+        try:
+            self.asistencia.guardar_pendientes()
+        except sqlite3.Error as e:
+            print(f"No se pudieron guardar las asistencias (se reintenta): {e}")
 
     def validar_email(self, email):
         """Valida que el email contenga @"""
-        return '@' in email
+        return validaciones.validar_email(email)
 
     def validar_numerico(self, texto):
         """Valida que el texto contenga solo números"""
-        return texto.isdigit() if texto else True
+        return validaciones.validar_numerico(texto)
 
+    @medido("registro.formulario")
     def registrar_participante(self):
-        """Registra un nuevo participante en la base de datos con validaciones"""
+        """Valida el formulario y encola el registro; el resultado llega por señal"""
         nombre = self.nombre_input.text().strip()
         apellido = self.apellido_input.text().strip()
         dni = self.dni_input.text().strip()
@@ -532,30 +807,242 @@ class MainWindow(QMainWindow):
             self.telefono_input.setFocus()
             return
         
-        datos = (
-            nombre,
-            apellido,
-            dni,
-            email,
-            telefono,
-            QDate.currentDate().toString("yyyy-MM-dd"),
-            institucion
+        # Si el DNI ya está en el índice en memoria se avisa sin ir al disco
+        if self.asistencia.esta_inscripto(dni):
+            QMessageBox.warning(self, "Error", "El DNI ya está registrado")
+            self.dni_input.setFocus()
+            return
+        
+        inscripto = Inscripto.nuevo(nombre, apellido, dni, email, telefono,
+                                    QDate.currentDate().toString("yyyy-MM-dd"), institucion)
+        
+        # Se guarda en segundo plano: la fila aparece ya en la lista y el
+        # formulario queda libre para el siguiente participante
+        item = QListWidgetItem(f"⏳ {apellido}, {nombre} (DNI {dni}) - guardando...")
+        item.setData(Qt.UserRole, inscripto)
+        self.registros_recientes.insertItem(0, item)
+        while self.registros_recientes.count() > 20:
+            self.registros_recientes.takeItem(self.registros_recientes.count() - 1)
+        self.registros_en_curso[id(inscripto)] = (item, time.perf_counter())
+        if self.pagina_construida(2):
+            self.agregar_a_pagina(inscripto)
+        
+        self.envio_registros.enviar(inscripto)
+        self.limpiar_formulario()
+        self.nombre_input.setFocus()
+
+    def registro_confirmado(self, inscripto, id_nuevo):
+        """El escritor guardó el registro: se completa el id y el índice de asistencia"""
+        item, inicio = self.registros_en_curso.pop(id(inscripto))
+        metricas = instrumentacion.metricas()
+        if metricas is not None:
+            metricas.registrar("registro.ida_y_vuelta", (time.perf_counter() - inicio) * 1000)
+        
+        inscripto.id = id_nuevo
+        self.asistencia.agregar(id_nuevo, inscripto.dni, inscripto.nombre, inscripto.apellido,
+                                inscripto.institucion)
+        if self.pagina_construida(2):
+            self.list_model.fila_actualizada(inscripto)
+        item.setText(f"✓ {inscripto.apellido}, {inscripto.nombre} (DNI {inscripto.dni}) - registrado")
+        item.setData(Qt.UserRole, None)
+        if self.replicador is not None:
+            self.replicador.sincronizar_pronto()
+        if self.notificador is not None:
+            self.notificador.enviar_pronto()
+
+    def registro_rechazado(self, inscripto, motivo):
+        """El escritor no pudo guardar el registro: se saca de la lista y se avisa"""
+        item, _ = self.registros_en_curso.pop(id(inscripto))
+        if self.pagina_construida(2):
+            self.list_model.quitar_fila(inscripto)
+        item.setText(f"✗ {inscripto.apellido}, {inscripto.nombre} (DNI {inscripto.dni}) - {motivo}")
+        item.setForeground(QColor("#c0392b"))
+        self.statusBar().showMessage(f"No se registró a {inscripto.nombre} {inscripto.apellido}: {motivo}", 10000)
+
+    def recuperar_registro(self, item):
+        """Vuelve a cargar en el formulario un registro rechazado"""
+        inscripto = item.data(Qt.UserRole)
+        if inscripto is None or id(inscripto) in self.registros_en_curso:
+            return
+        self.nombre_input.setText(inscripto.nombre)
+        self.apellido_input.setText(inscripto.apellido)
+        self.dni_input.setText(inscripto.dni)
+        self.email_input.setText(inscripto.email)
+        self.telefono_input.setText(inscripto.telefono or "")
+        self.institucion_input.setText(inscripto.institucion or "")
+        self.registros_recientes.takeItem(self.registros_recientes.row(item))
+        self.dni_input.setFocus()
+
+    def importar_datos(self):
+        """Importa inscriptos desde un archivo CSV en segundo plano"""
+        ruta, _ = QFileDialog.getOpenFileName(
+            self, "Importar inscriptos", "", "Archivos CSV (*.csv *.txt);;Todos los archivos (*)"
         )
+        if not ruta:
+            return
         
-        try:
-            self.cursor.execute('''
-                INSERT INTO inscriptos 
-                (nombre, apellido, dni, email, telefono, fecha_inscripcion, institucion)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', datos)
-            self.conn.commit()
-            
-            QMessageBox.information(self, "Éxito", "Participante registrado correctamente")
-            self.limpiar_formulario()
+        self.progreso_importacion = self.crear_dialogo_progreso("Importar datos", "Importando inscriptos...")
+        
+        self.tarea_importacion = TareaEnSegundoPlano(importar_csv, self.repo, ruta,
+                                                     liberar=self.repo.liberar, parent=self)
+        self.tarea_importacion.progreso.connect(
+            lambda actual, total: self.actualizar_progreso(self.progreso_importacion, actual, total))
+        self.tarea_importacion.terminado.connect(self.importacion_terminada)
+        self.tarea_importacion.fallo.connect(self.importacion_fallida)
+        self.progreso_importacion.canceled.connect(self.tarea_importacion.cancelar)
+        self.tarea_importacion.iniciar()
+
+    def crear_dialogo_progreso(self, titulo, texto):
+        """Crea un diálogo de progreso cancelable para tareas largas"""
+        dialogo = QProgressDialog(texto, "Cancelar", 0, 100, self)
+        dialogo.setWindowTitle(titulo)
+        dialogo.setWindowModality(Qt.WindowModal)
+        dialogo.setMinimumDuration(0)
+        dialogo.setAutoClose(False)
+        dialogo.setAutoReset(False)
+        return dialogo
+
+    def actualizar_progreso(self, dialogo, actual, total):
+        """Actualiza la barra de progreso de una tarea en segundo plano"""
+        dialogo.setMaximum(max(total, 1))
+        dialogo.setValue(min(actual, max(total, 1)))
+
+    def importacion_terminada(self, resultado):
+        """Muestra el resumen de la importación"""
+        self.progreso_importacion.close()
+        if self.replicador is not None:
+            self.replicador.sincronizar_pronto()
+        if self.notificador is not None:
+            self.notificador.enviar_pronto()
+        
+        resumen = f"Inscriptos importados: {resultado['importados']}\n"
+        if resultado['cancelado']:
+            resumen = "Importación cancelada.\n" + resumen
+        
+        duplicados = resultado['duplicados']
+        if duplicados:
+            resumen += f"\nDNI duplicados omitidos: {len(duplicados)}\n"
+            resumen += ", ".join(duplicados[:20])
+            if len(duplicados) > 20:
+                resumen += f" ... y {len(duplicados) - 20} más"
+            resumen += "\n"
+        
+        invalidos = resultado['invalidos']
+        if invalidos:
+            resumen += f"\nFilas inválidas omitidas: {len(invalidos)}\n"
+            for linea, motivo in invalidos[:20]:
+                resumen += f"Línea {linea}: {motivo}\n"
+        
+        QMessageBox.information(self, "Importar datos", resumen)
+        self.actualizar_lista_inscriptos()
+
+    def importacion_fallida(self, mensaje):
+        """Informa un error al importar"""
+        self.progreso_importacion.close()
+        QMessageBox.warning(self, "Error", f"No se pudo importar el archivo: {mensaje}")
+
+    def exportar_datos(self):
+        """Exporta todos los inscriptos a un archivo en segundo plano"""
+        filtros = "CSV (*.csv);;JSON Lines (*.jsonl)"
+        if parquet_disponible():
+            filtros += ";;Parquet (*.parquet)"
+        ruta, _ = QFileDialog.getSaveFileName(self, "Exportar inscriptos", "inscriptos.csv", filtros)
+        if not ruta:
+            return
+        formato = formato_desde_ruta(ruta)
+        
+        self.progreso_exportacion = self.crear_dialogo_progreso("Exportar datos", "Exportando inscriptos...")
+        
+        self.tarea_exportacion = TareaEnSegundoPlano(exportar, self.repo, ruta, formato,
+                                                     liberar=self.repo.liberar, parent=self)
+        self.tarea_exportacion.progreso.connect(
+            lambda actual, total: self.actualizar_progreso(self.progreso_exportacion, actual, total))
+        self.tarea_exportacion.terminado.connect(self.exportacion_terminada)
+        self.tarea_exportacion.fallo.connect(self.exportacion_fallida)
+        self.progreso_exportacion.canceled.connect(self.tarea_exportacion.cancelar)
+        self.tarea_exportacion.iniciar()
+
+    def exportacion_terminada(self, resultado):
+        """Informa el resultado de la exportación"""
+        self.progreso_exportacion.close()
+        if resultado['cancelado']:
+            QMessageBox.information(self, "Exportar datos", "Exportación cancelada")
+        else:
+            QMessageBox.information(self, "Exportar datos",
+                                    f"Inscriptos exportados: {resultado['exportados']}")
+
+    def exportacion_fallida(self, mensaje):
+        """Informa un error al exportar"""
+        self.progreso_exportacion.close()
+        QMessageBox.warning(self, "Error", f"No se pudo exportar: {mensaje}")
+
+    def buscar_duplicados(self):
+        """Busca posibles inscriptos repetidos en segundo plano"""
+        self.progreso_duplicados = self.crear_dialogo_progreso("Buscar duplicados",
+                                                               "Buscando posibles duplicados...")
+        
+        self.tarea_duplicados = TareaEnSegundoPlano(detectar_duplicados, self.repo,
+                                                    liberar=self.repo.liberar, parent=self)
+        self.tarea_duplicados.progreso.connect(
+            lambda actual, total: self.actualizar_progreso(self.progreso_duplicados, actual, total))
+        self.tarea_duplicados.terminado.connect(self.duplicados_encontrados)
+        self.tarea_duplicados.fallo.connect(self.busqueda_duplicados_fallida)
+        self.progreso_duplicados.canceled.connect(self.tarea_duplicados.cancelar)
+        self.tarea_duplicados.iniciar()
+
+    def duplicados_encontrados(self, pares):
+        """Abre la revisión de los pares encontrados"""
+        self.progreso_duplicados.close()
+        if pares is None:
+            return
+        if not pares:
+            QMessageBox.information(self, "Buscar duplicados", "No se encontraron posibles duplicados")
+            return
+        
+        revision = RevisionDuplicados(self.repo, pares, self)
+        revision.exec()
+        for fila in revision.borrados:
+            self.asistencia.quitar(fila[3])
+        if revision.borrados:
             self.actualizar_lista_inscriptos()
-            
-        except sqlite3.IntegrityError:
-            QMessageBox.warning(self, "Error", "El DNI ya está registrado")
+
+    def busqueda_duplicados_fallida(self, mensaje):
+        """Informa un error al buscar duplicados"""
+        self.progreso_duplicados.close()
+        QMessageBox.warning(self, "Error", f"No se pudieron buscar duplicados: {mensaje}")
+
+    def generar_documentos(self, tipo):
+        """Genera credenciales o certificados en PDF en otros procesos"""
+        carpeta = QFileDialog.getExistingDirectory(self, "Carpeta para los documentos")
+        if not carpeta:
+            return
+        
+        self.progreso_documentos = self.crear_dialogo_progreso("Generar documentos",
+                                                               "Generando documentos...")
+        
+        self.tarea_documentos = TareaEnSegundoPlano(generar_documentos, self.repo, tipo, carpeta,
+                                                    liberar=self.repo.liberar, parent=self)
+        self.tarea_documentos.progreso.connect(
+            lambda actual, total: self.actualizar_progreso(self.progreso_documentos, actual, total))
+        self.tarea_documentos.terminado.connect(self.documentos_generados)
+        self.tarea_documentos.fallo.connect(self.documentos_fallidos)
+        self.progreso_documentos.canceled.connect(self.tarea_documentos.cancelar)
+        self.tarea_documentos.iniciar()
+
+    def documentos_generados(self, resultado):
+        """Informa cuántos documentos se generaron"""
+        self.progreso_documentos.close()
+        resumen = f"Documentos generados: {resultado['generados']}"
+        if resultado['ya_estaban']:
+            resumen += f"\nYa estaban de una corrida anterior: {resultado['ya_estaban']}"
+        if resultado['cancelado']:
+            resumen = "Generación cancelada; al repetirla se sigue desde donde quedó.\n" + resumen
+        QMessageBox.information(self, "Generar documentos", resumen)
+
+    def documentos_fallidos(self, mensaje):
+        """Informa un error al generar documentos"""
+        self.progreso_documentos.close()
+        QMessageBox.warning(self, "Error", f"No se pudieron generar los documentos: {mensaje}")
 
     def limpiar_formulario(self):
         """Limpia el formulario de registro"""
@@ -566,80 +1053,85 @@ class MainWindow(QMainWindow):
         self.telefono_input.clear()
         self.institucion_input.clear()
 
+    @medido("tabla.lista_actualizar")
     def actualizar_lista_inscriptos(self):
         """Actualiza la tabla de listado de inscriptos"""
-        self.cursor.execute('''
-            SELECT id, nombre, apellido, dni, email, telefono, institucion 
-            FROM inscriptos
-        ''')
-        datos = self.cursor.fetchall()
-        
-        self.list_table.setRowCount(len(datos))
-        for row, record in enumerate(datos):
-            for col, value in enumerate(record):
-                item = QTableWidgetItem(str(value))
-                # CORRECCIÓN: Eliminar la línea problemática
-                self.list_table.setItem(row, col, item)
-        
-        # Ajustar las filas al contenido
-        self.list_table.resizeRowsToContents()
+        if not self.pagina_construida(2):
+            # Se cargará al abrir la página por primera vez
+            return
+        self.mostrar_pagina(self.paginador.recargar())
+
+    def mostrar_pagina(self, filas):
+        """Muestra una página del listado y actualiza los controles"""
+        self.list_model.cargar_filas(filas)
+        self.btn_pagina_anterior.setEnabled(self.paginador.hay_anterior)
+        self.btn_pagina_siguiente.setEnabled(self.paginador.hay_siguiente)
+        if filas:
+            self.info_pagina.setText(f"Mostrando {len(filas)} inscriptos")
+        else:
+            self.info_pagina.setText("No hay inscriptos")
+
+    def agregar_a_pagina(self, inscripto):
+        """Muestra un inscripto recién registrado solo si cae en la página visible"""
+        ubicacion = self.paginador.ubicar_nuevo(inscripto)
+        if ubicacion is not None:
+            posicion, desborda = ubicacion
+            if desborda:
+                self.list_model.quitar_ultima_fila()
+            self.list_model.agregar_fila(inscripto, posicion)
+            self.info_pagina.setText(f"Mostrando {self.list_model.rowCount()} inscriptos")
+        self.btn_pagina_siguiente.setEnabled(self.paginador.hay_siguiente)
+
+    def saltar_a_letra(self, indice):
+        """Salta a la primera página que empieza con la letra elegida"""
+        if indice > 0:
+            self.mostrar_pagina(self.paginador.saltar_a(self.saltar_letra.itemText(indice)))
+        self.saltar_letra.setCurrentIndex(0)
 
+    @medido("tabla.busqueda")
     def buscar_inscriptos(self):
         """Busca inscriptos según el criterio de búsqueda"""
-        criterio = f"%{self.search_input.text()}%"
-        self.cursor.execute('''
-            SELECT id, nombre, apellido, dni, email, telefono, institucion 
-            FROM inscriptos 
-            WHERE nombre LIKE ? OR apellido LIKE ? OR dni LIKE ? OR email LIKE ?
-        ''', (criterio, criterio, criterio, criterio))
-        
-        resultados = self.cursor.fetchall()
-        
-        self.search_table.setRowCount(len(resultados))
-        for row, record in enumerate(resultados):
-            for col, value in enumerate(record):
-                item = QTableWidgetItem(str(value))
-                # CORRECCIÓN: Eliminar la línea problemática
-                self.search_table.setItem(row, col, item)
-        
-        # Ajustar las filas al contenido
-        self.search_table.resizeRowsToContents()
+        self.search_timer.stop()
+        self.buscador.cancelar()
+        # Si la búsqueda en vivo ya trajo el resultado completo sale de la
+        # caché; si no, se lee de a poco (sin esperar la consulta entera)
+        filas = self.repo.busqueda_en_cache(self.search_input.text(), self.buscador.limite)
+        if filas is None:
+            self.search_model.cargar_cursor(self.repo.cursor_busqueda(self.search_input.text()))
+        else:
+            self.search_model.cargar_filas(filas)
 
+    def buscar_en_vivo(self):
+        """Lanza la búsqueda en segundo plano con el texto actual"""
+        self.buscador.buscar(self.search_input.text())
+
+    @medido("tabla.busqueda_en_vivo")
+    def mostrar_resultados_en_vivo(self, generacion, filas):
+        """Muestra el resultado solo si corresponde a la última búsqueda pedida"""
+        if generacion == self.buscador.generacion:
+            self.search_model.cargar_filas(filas)
+
+    def busqueda_en_vivo_fallida(self, generacion, mensaje):
+        """Avisa en la barra de estado si falló la última búsqueda pedida"""
+        if generacion == self.buscador.generacion:
+            self.statusBar().showMessage(f"No se pudo buscar: {mensaje}", 10000)
+
+    @medido("tabla.lista_ordenar")
     def ordenar_inscriptos(self, criterio):
         """Ordena la lista de inscriptos según el criterio especificado"""
-        self.cursor.execute(f'''
-            SELECT id, nombre, apellido, dni, email, telefono, institucion 
-            FROM inscriptos 
-            ORDER BY {criterio}
-        ''')
-        datos = self.cursor.fetchall()
-        
-        self.list_table.setRowCount(len(datos))
-        for row, record in enumerate(datos):
-            for col, value in enumerate(record):
-                item = QTableWidgetItem(str(value))
-                # CORRECCIÓN: Eliminar la línea problemática
-                self.list_table.setItem(row, col, item)
-        
-        # Ajustar las filas al contenido
-        self.list_table.resizeRowsToContents()
+        self.mostrar_pagina(self.paginador.ordenar(criterio))
+        self.saltar_letra.setEnabled(criterio in ('nombre', 'apellido'))
 
     def generar_reporte_total(self):
         """Genera un reporte general de inscriptos"""
-        self.cursor.execute("SELECT COUNT(*) FROM inscriptos")
-        total = self.cursor.fetchone()[0]
+        total = self.repo.total()
         
         QMessageBox.information(self, "Reporte Total", 
                                f"Total de inscriptos: {total}")
 
     def generar_reporte_instituciones(self):
         """Genera un reporte agrupado por instituciones"""
-        self.cursor.execute('''
-            SELECT institucion, COUNT(*) 
-            FROM inscriptos 
-            GROUP BY institucion
-        ''')
-        datos = self.cursor.fetchall()
+        datos = self.repo.por_institucion()
         
         reporte = "Inscriptos por institución:\n\n"
         for institucion, cantidad in datos:
@@ -647,11 +1139,105 @@ class MainWindow(QMainWindow):
         
         QMessageBox.information(self, "Reporte por Instituciones", reporte)
 
+    def refrescar_tablero(self):
+        """Actualiza el tablero si está visible y la base cambió"""
+        if not self.tablero.isVisible():
+            return
+        
+        # data_version cambia con commits de otras conexiones y total_changes
+        # con los de esta; si ninguno cambió no hace falta consultar
+        version = self.repo.version_datos()
+        if version == self.version_tablero:
+            return
+        self.version_tablero = version
+        
+        self.tablero.actualizar(self.repo.total(), self.repo.por_institucion(), self.repo.por_dia())
+
+    def generar_reporte_diario(self):
+        """Genera un reporte de inscripciones por día"""
+        datos = self.repo.por_dia()
+        
+        reporte = "Inscripciones por día:\n\n"
+        for fecha, cantidad in datos:
+            reporte += f"{fecha or 'Sin fecha'}: {cantidad}\n"
+        
+        QMessageBox.information(self, "Inscripciones por Día", reporte)
+
+    def mostrar_planes_de_consulta(self):
+        """Muestra EXPLAIN QUERY PLAN de la consulta de cada pantalla"""
+        texto = ""
+        for descripcion, sql, parametros in consultas_de_pantallas(self.repo.fts_disponible):
+            texto += f"{descripcion}\n"
+            texto += "\n".join(plan_de_consulta(self.conn, sql, parametros))
+            texto += "\n\n"
+        texto += "⚠ = recorrido completo sin índice u ordenamiento en tabla temporal"
+        
+        dialogo = QDialog(self)
+        dialogo.setWindowTitle("Plan de consultas")
+        dialogo.resize(800, 600)
+        layout = QVBoxLayout(dialogo)
+        visor = QPlainTextEdit(texto)
+        visor.setReadOnly(True)
+        visor.setStyleSheet("font-family: monospace; font-size: 13px;")
+        layout.addWidget(visor)
+        dialogo.exec()
+
+    def actualizar_estado_sincronizacion(self):
+        """Muestra en la barra de estado cómo va la sincronización con el central"""
+        pendientes = self.repo.contar_cambios_pendientes()
+        if self.replicador.ultimo_error:
+            texto = f"Sin conexión con el central ({pendientes} registros esperando para enviarse)"
+        elif pendientes:
+            texto = f"Sincronizando... {pendientes} registros por enviar"
+        else:
+            texto = f"Sincronizado con el central (puesto {self.replicador.puesto})"
+        if self.replicador.conflictos:
+            texto += f" - {self.replicador.conflictos} DNI en conflicto resueltos por el central"
+        self.statusBar().showMessage(texto)
+        
+        # Llegaron inscriptos de otros puestos
+        if self.replicador.recibidos != self.recibidos_mostrados:
+            self.recibidos_mostrados = self.replicador.recibidos
+            self.actualizar_lista_inscriptos()
+
+    def mostrar_panel_diagnostico(self):
+        """Abre el panel oculto con los percentiles de cada operación"""
+        if self.panel_diagnostico is None:
+            self.panel_diagnostico = PanelDiagnostico(self, self.repo.cache)
+        self.panel_diagnostico.show()
+        self.panel_diagnostico.raise_()
+
     def closeEvent(self, event):
         """Cierra la conexión a la base de datos al salir"""
-        self.conn.close()
+        if self.pagina_construida(1):
+            self.buscador.detener()
+            self.search_model.limpiar()
+        if self.pagina_construida(2):
+            self.list_model.limpiar()
+        self.escritor.detener()
+        if self.replicador is not None:
+            self.sincronizacion_timer.stop()
+            self.replicador.detener()
+        if self.notificador is not None:
+            self.notificador.detener()
+        self.tarea_asistencia.esperar()
+        self.guardar_asistencias()
+        self.repo.cerrar()
+        
+        ruta_log = self.repo.config['diagnostico']['log_json']
+        if ruta_log and instrumentacion.metricas() is not None:
+            instrumentacion.metricas().volcar(ruta_log)
         event.accept()
 
+def registrar_tiempo_inicio(window, app, archivo="tiempos_inicio.csv"):
+    """Guarda el tiempo hasta la primera ventana en un CSV para seguirlo en el tiempo"""
+    milisegundos = (time.perf_counter() - INICIO_PROCESO) * 1000
+    inscriptos = window.repo.total()
+    print(f"Ventana visible en {milisegundos:.0f} ms ({inscriptos} inscriptos)")
+    with open(archivo, "a", encoding="utf-8") as salida:
+        salida.write(f"{datetime.now().isoformat(timespec='seconds')},{milisegundos:.1f},{inscriptos}\n")
+    app.quit()
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     
@@ -660,7 +1246,7 @@ if __name__ == "__main__":
         QMainWindow {
             background-color: #f8f9fa;
         }
-        QTableWidget {
+        QTableView {
             border: 1px solid #bdc3c7;
             border-radius: 8px;
             background-color: white;
@@ -674,14 +1260,20 @@ if __name__ == "__main__":
             font-size: 13px;
             font-weight: bold;
         }
-        QTableWidget::item {
+        QTableView::item {
             padding: 10px;
         }
-        QTableWidget::item:alternate {
+        QTableView::item:alternate {
             background-color: #f2f2f2;
         }
     """)
     
     window = MainWindow()
     window.show()
+    
+    # Modo de medición: python PresentacionFinal.py --medir-inicio
+    # Registra cuánto tardó la ventana en aparecer y cierra la aplicación
+    if "--medir-inicio" in sys.argv:
+        QTimer.singleShot(0, lambda: registrar_tiempo_inicio(window, app))
+    
     sys.exit(app.exec())
\ No newline at end of file
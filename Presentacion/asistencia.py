@@ -0,0 +1,128 @@
+import threading
+from datetime import datetime
+
+from registro import Inscripto
+
+# Resultados posibles de marcar()
+PRESENTE = "presente"
+YA_PRESENTE = "ya_presente"
+NO_INSCRIPTO = "no_inscripto"
+CARGANDO = "cargando"
+
+
+class ControlAsistencia:
+    """Índice en memoria DNI -> inscripto para el ingreso al evento.
+
+    Buscar un DNI es una consulta a un diccionario (O(1)), sin ir a la base.
+    Las asistencias se acumulan en memoria y se guardan en lote con
+    guardar_pendientes(), así cada escaneo no espera un commit. Antes de
+    marcar se relee la asistencia de ese inscripto en la base, por si ya
+    lo marcó otro puesto.
+    """
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.listo = False
+        self.presentes = 0
+        self._por_dni = {}
+        self._ultimo_id = 0
+        self._pendientes = []
+        # cargar() corre en otro hilo mientras la ventana puede agregar()
+        self._candado = threading.Lock()
+
+    def cargar(self, progreso=None, cancelado=None):
+        """Arma el índice leyendo la base de a lotes (se puede llamar desde otro hilo).
+
+        Cada lote se suma al índice que ya está en uso: lo que agregar()
+        sumó mientras tanto (un registro recién hecho) no se pierde.
+        """
+        cursor = self.repo.cursor_asistencia()
+        while True:
+            lote = cursor.fetchmany(10000)
+            if not lote:
+                break
+            inscriptos = [Inscripto.desde_asistencia(fila) for fila in lote]
+            with self._candado:
+                for inscripto in inscriptos:
+                    if inscripto.dni not in self._por_dni:
+                        self._por_dni[inscripto.dni] = inscripto
+                        self.presentes += inscripto.asistencia
+                self._ultimo_id = max(self._ultimo_id, lote[-1][0])
+            if progreso:
+                progreso(len(self._por_dni), 0)
+            if cancelado is not None and cancelado.is_set():
+                return False
+        self.listo = True
+        return True
+
+    @property
+    def total(self):
+        return len(self._por_dni)
+
+    def esta_inscripto(self, dni):
+        """Consulta en memoria; False también si el índice todavía se está cargando"""
+        return dni in self._por_dni
+
+    def agregar(self, id_inscripto, dni, nombre, apellido, institucion):
+        """Suma al índice un inscripto recién registrado en este puesto"""
+        inscripto = Inscripto.desde_asistencia((id_inscripto, dni, nombre, apellido, institucion, False))
+        with self._candado:
+            self._por_dni[dni] = inscripto
+
+    def quitar(self, dni):
+        """Saca del índice un inscripto borrado (p. ej. un duplicado)"""
+        with self._candado:
+            inscripto = self._por_dni.pop(dni, None)
+            if inscripto is not None:
+                self.presentes -= inscripto.asistencia
+
+    def sincronizar(self):
+        """Incorpora los inscriptos que otros puestos agregaron desde la última carga"""
+        filas = self.repo.cursor_asistencia(self._ultimo_id).fetchall()
+        with self._candado:
+            for fila in filas:
+                inscripto = Inscripto.desde_asistencia(fila)
+                if inscripto.dni not in self._por_dni:
+                    self._por_dni[inscripto.dni] = inscripto
+                    self.presentes += inscripto.asistencia
+                self._ultimo_id = max(self._ultimo_id, inscripto.id)
+
+    def marcar(self, dni):
+        """Marca presente a un DNI. Retorna (resultado, Inscripto o None)"""
+        if not self.listo:
+            return CARGANDO, None
+        dni = dni.strip()
+        datos = self._por_dni.get(dni)
+        if datos is None:
+            # Puede haberse inscripto recién en otro puesto
+            self.sincronizar()
+            datos = self._por_dni.get(dni)
+            if datos is None:
+                return NO_INSCRIPTO, None
+        if datos.asistencia:
+            return YA_PRESENTE, datos
+        if self.repo.asistencia_registrada(datos.id):
+            # Lo marcó otro puesto sobre la misma base
+            datos.asistencia = True
+            self.presentes += 1
+            return YA_PRESENTE, datos
+        datos.asistencia = True
+        self.presentes += 1
+        self._pendientes.append((datos.id, datetime.now().isoformat(timespec="seconds")))
+        return PRESENTE, datos
+
+    def hay_pendientes(self):
+        return bool(self._pendientes)
+
+    def guardar_pendientes(self):
+        """Escribe en la base todas las asistencias acumuladas, en una transacción"""
+        if not self._pendientes:
+            return 0
+        pendientes, self._pendientes = self._pendientes, []
+        try:
+            self.repo.marcar_asistencias(pendientes)
+        except Exception:
+            # Se reintentan en el próximo guardado
+            self._pendientes = pendientes + self._pendientes
+            raise
+        return len(pendientes)
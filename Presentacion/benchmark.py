@@ -0,0 +1,222 @@
+"""Mide cada camino de datos sobre bases sintéticas y guarda un reporte JSON.
+
+    python benchmark.py                                  (10.000, 100.000 y 1.000.000)
+    python benchmark.py --tamanios 10000 --salida actual.json
+    python benchmark.py --tamanios 10000 --comparar anterior.json
+
+Con --comparar se muestra la diferencia contra un reporte anterior y el
+programa termina con código 1 si alguna medición empeoró más que la
+tolerancia, así se puede usar para detectar regresiones entre versiones.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from busqueda import consulta_busqueda
+from cache_consultas import CacheDeConsultas
+from conexion import cargar_configuracion
+from consultas import ORDEN_LISTADO, consulta_listado
+from datos_sinteticos import APELLIDOS, NOMBRES, generar_inscriptos
+from exportacion import exportar
+from paginacion import PaginadorKeyset
+from repositorio import InscriptosRepository
+
+TAMANIOS = [10_000, 100_000, 1_000_000]
+TAMANIO_LOTE = 5000
+INSERCIONES_SUELTAS = 200
+LIMITE_BUSQUEDA = 200
+# Diferencias menores a esto son ruido de la máquina, no regresiones
+DIFERENCIA_MINIMA_MS = 0.5
+
+
+def _percentil(tiempos, p):
+    ordenados = sorted(tiempos)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def _medir(funcion, repeticiones):
+    """Ejecuta funcion varias veces; retorna p50/p95 en milisegundos"""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return {"ms": round(_percentil(tiempos, 50), 3), "p95_ms": round(_percentil(tiempos, 95), 3),
+            "repeticiones": repeticiones}
+
+
+def _medir_una_vez(funcion, filas=None):
+    inicio = time.perf_counter()
+    funcion()
+    ms = (time.perf_counter() - inicio) * 1000
+    resultado = {"ms": round(ms, 3), "repeticiones": 1}
+    if filas:
+        resultado["filas_por_s"] = round(filas / (ms / 1000))
+    return resultado
+
+
+def _poblar_modelo(repo):
+    """Carga el listado completo en InscriptosTableModel, como al desplazar la tabla"""
+    from PySide6.QtCore import QCoreApplication
+    from modelo_inscriptos import InscriptosTableModel
+
+    _ = QCoreApplication.instance() or QCoreApplication([])
+    modelo = InscriptosTableModel()
+    modelo.cargar_cursor(repo.cursor_listado())
+    while modelo.canFetchMore():
+        modelo.fetchMore()
+    return modelo.rowCount()
+
+
+def _qt_disponible():
+    try:
+        import PySide6  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def medir_tamanio(n, carpeta, repeticiones, semilla):
+    """Todas las mediciones sobre una base nueva de n inscriptos"""
+    # Se mide el SQL: con la caché, las repeticiones no llegarían a la base
+    config = cargar_configuracion()
+    config["cache_consultas"]["activa"] = "no"
+    repo = InscriptosRepository(os.path.join(carpeta, f"bench_{n}.db"), config).inicializar()
+    conn = repo.conexion()
+    resultados = {}
+    try:
+        filas = list(generar_inscriptos(n + INSERCIONES_SUELTAS, semilla))
+        sueltas = iter(filas[n:])
+
+        # --- Inserción ---
+        def insertar_en_lotes():
+            for inicio in range(0, n, TAMANIO_LOTE):
+                repo.insertar_lote(filas[inicio:inicio + TAMANIO_LOTE])
+
+        resultados["insertar_lote"] = _medir_una_vez(insertar_en_lotes, n)
+        resultados["insertar_individual"] = _medir(lambda: repo.insertar(next(sueltas)),
+                                                   INSERCIONES_SUELTAS)
+        del filas
+        conn.execute("ANALYZE")
+
+        # --- Búsqueda (misma secuencia de textos para LIKE y FTS) ---
+        textos = [random.Random(semilla + i).choice(APELLIDOS + NOMBRES)[:4] for i in range(repeticiones)]
+        for nombre, usar_fts in [("buscar_like", False), ("buscar_fts", True)]:
+            if usar_fts and not repo.fts_disponible:
+                continue
+            pendientes = iter(textos)
+
+            def buscar():
+                sql, parametros = consulta_busqueda(next(pendientes), usar_fts, LIMITE_BUSQUEDA)
+                conn.execute(sql, parametros).fetchall()
+
+            resultados[nombre] = _medir(buscar, len(textos))
+
+        # --- Orden: primera página (lo que ve la pantalla) y recorrido completo ---
+        for criterio in ORDEN_LISTADO:
+            paginador = repo.paginador(100)
+            resultados[f"ordenar_{criterio}_pagina"] = _medir(lambda: paginador.ordenar(criterio),
+                                                              repeticiones)
+            resultados[f"ordenar_{criterio}_completo"] = _medir_una_vez(
+                lambda: conn.execute(consulta_listado(criterio)).fetchall(), n)
+
+        # --- Reportes ---
+        resultados["reporte_total"] = _medir(repo.total, repeticiones)
+        resultados["reporte_instituciones"] = _medir(repo.por_institucion, repeticiones)
+        resultados["reporte_diario"] = _medir(repo.por_dia, repeticiones)
+
+        # --- Lo mismo que vuelve a pedir la pantalla, con la caché de consultas ---
+        cache = CacheDeConsultas()
+        paginador = PaginadorKeyset(conn, 100, cache)
+        resultados["ordenar_apellido_pagina_cache"] = _medir(lambda: paginador.ordenar("apellido"),
+                                                             repeticiones)
+        cache.cerrar()
+
+        # --- Tabla y exportación ---
+        if _qt_disponible():
+            resultados["poblar_tabla"] = _medir_una_vez(lambda: _poblar_modelo(repo), n)
+        ruta_csv = os.path.join(carpeta, f"bench_{n}.csv")
+        resultados["exportar_csv"] = _medir_una_vez(lambda: exportar(repo, ruta_csv, "csv"), n)
+        os.remove(ruta_csv)
+    finally:
+        repo.cerrar()
+    return resultados
+
+
+def _version_codigo():
+    try:
+        salida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return None
+    return salida.stdout.strip() or None
+
+
+def comparar(actual, anterior, tolerancia):
+    """Imprime la variación de cada medición; retorna la cantidad de regresiones"""
+    regresiones = 0
+    for tamanio, mediciones in actual["resultados"].items():
+        previas = anterior["resultados"].get(tamanio, {})
+        print(f"\n{tamanio} inscriptos (vs {anterior.get('version') or 'reporte anterior'})")
+        for nombre, medicion in mediciones.items():
+            if nombre not in previas or not previas[nombre]["ms"]:
+                continue
+            cambio = medicion["ms"] / previas[nombre]["ms"] - 1
+            marca = ""
+            if cambio > tolerancia and medicion["ms"] - previas[nombre]["ms"] > DIFERENCIA_MINIMA_MS:
+                marca = "  ⚠ REGRESIÓN"
+                regresiones += 1
+            print(f"  {nombre:<34} {previas[nombre]['ms']:10.3f} -> {medicion['ms']:10.3f} ms "
+                  f"({cambio:+.0%}){marca}")
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamanios", type=int, nargs="+", default=TAMANIOS)
+    parser.add_argument("--repeticiones", type=int, default=30)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", default="benchmark.json", help="reporte JSON a escribir")
+    parser.add_argument("--comparar", help="reporte JSON anterior para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=0.2,
+                        help="empeoramiento admitido antes de marcar regresión (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    reporte = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "version": _version_codigo(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "plataforma": platform.platform(),
+        "resultados": {},
+    }
+    with tempfile.TemporaryDirectory() as carpeta:
+        for n in args.tamanios:
+            print(f"Midiendo con {n} inscriptos...", file=sys.stderr)
+            resultados = medir_tamanio(n, carpeta, args.repeticiones, args.semilla)
+            reporte["resultados"][str(n)] = resultados
+            for nombre, medicion in resultados.items():
+                print(f"  {nombre:<34} {medicion['ms']:10.3f} ms", file=sys.stderr)
+
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(reporte, archivo, indent=2, ensure_ascii=False)
+    print(f"Reporte guardado en {args.salida}", file=sys.stderr)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            anterior = json.load(archivo)
+        if comparar(reporte, anterior, args.tolerancia):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
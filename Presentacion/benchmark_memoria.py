@@ -0,0 +1,73 @@
+"""Memoria por inscripto según cómo se lo guarda en Python.
+
+    python benchmark_memoria.py            (1.000.000 de inscriptos)
+    python benchmark_memoria.py 100000
+
+Las filas se leen de una base SQLite en memoria, igual que en la
+aplicación: cada texto llega como un objeto nuevo, aunque se repita.
+"""
+import gc
+import sqlite3
+import sys
+import tracemalloc
+
+from datos_sinteticos import generar_inscriptos
+from registro import Inscripto
+from repositorio import SQL_CREAR_TABLA, SQL_INSERTAR
+
+
+def crear_base(n):
+    conn = sqlite3.connect(":memory:")
+    conn.execute(SQL_CREAR_TABLA)
+    conn.executemany(SQL_INSERTAR, generar_inscriptos(n))
+    conn.commit()
+    return conn
+
+
+def como_dict(fila):
+    # Como registrar_participante() en los ejemplos
+    id_inscripto, nombre, apellido, dni, email, telefono, fecha, institucion = fila
+    return {"id": id_inscripto, "nombre": nombre, "apellido": apellido, "dni": dni,
+            "email": email, "telefono": telefono, "fecha_inscripcion": fecha,
+            "institucion": institucion, "asistencia": False}
+
+
+def como_inscripto(fila):
+    id_inscripto, nombre, apellido, dni, email, telefono, fecha, institucion = fila
+    inscripto = Inscripto.nuevo(nombre, apellido, dni, email, telefono, fecha, institucion)
+    inscripto.id = id_inscripto
+    return inscripto
+
+
+REPRESENTACIONES = [
+    ("dict", como_dict),
+    ("tupla (fila de sqlite3)", lambda fila: fila),
+    ("Inscripto (__slots__ + textos compartidos)", como_inscripto),
+]
+
+
+def medir(conn, convertir):
+    """Bytes retenidos por la lista de registros ya convertidos"""
+    gc.collect()
+    tracemalloc.start()
+    registros = [convertir(fila) for fila in conn.execute(
+        "SELECT id, nombre, apellido, dni, email, telefono, fecha_inscripcion, institucion FROM inscriptos"
+    )]
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del registros
+    return actual
+
+
+def main(argv):
+    n = int(argv[0]) if argv else 1_000_000
+    conn = crear_base(n)
+    print(f"{n} inscriptos")
+    for nombre, convertir in REPRESENTACIONES:
+        total = medir(conn, convertir)
+        print(f"  {nombre:<44} {total / n:8.1f} bytes/inscripto   {total / 2**20:8.1f} MiB")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,110 @@
+import re
+import sqlite3
+import sys
+
+COLUMNAS_LISTADO = "id, nombre, apellido, dni, email, telefono, institucion"
+
+
+def crear_indice_busqueda(conn):
+    """Crea el índice FTS5 de inscriptos y lo mantiene sincronizado con triggers.
+
+    Retorna True si el índice está disponible. Si la versión de SQLite no
+    trae FTS5 retorna False y la búsqueda vuelve a usar LIKE.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'inscriptos_fts'"
+    )
+    existia = cursor.fetchone() is not None
+
+    try:
+        # Tabla "external content": el texto vive en inscriptos, acá solo el índice.
+        # remove_diacritics hace que "Fernandez" encuentre "Fernández".
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS inscriptos_fts USING fts5(
+                nombre, apellido, dni, email,
+                content='inscriptos',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3 4'
+            )
+        ''')
+    except sqlite3.OperationalError as e:
+        print(f"Búsqueda de texto completo no disponible: {e}", file=sys.stderr)
+        return False
+
+    # Versiones anteriores reindexaban ante cualquier UPDATE (por ejemplo al
+    # marcar asistencia); ahora solo ante cambios en las columnas indexadas
+    cursor.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'inscriptos_fts_au'"
+    )
+    trigger_actualizacion = cursor.fetchone()
+    if trigger_actualizacion and "UPDATE OF" not in trigger_actualizacion[0]:
+        cursor.execute("DROP TRIGGER inscriptos_fts_au")
+
+    cursor.executescript('''
+        CREATE TRIGGER IF NOT EXISTS inscriptos_fts_ai AFTER INSERT ON inscriptos BEGIN
+            INSERT INTO inscriptos_fts (rowid, nombre, apellido, dni, email)
+            VALUES (new.id, new.nombre, new.apellido, new.dni, new.email);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS inscriptos_fts_ad AFTER DELETE ON inscriptos BEGIN
+            INSERT INTO inscriptos_fts (inscriptos_fts, rowid, nombre, apellido, dni, email)
+            VALUES ('delete', old.id, old.nombre, old.apellido, old.dni, old.email);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS inscriptos_fts_au
+        AFTER UPDATE OF nombre, apellido, dni, email ON inscriptos BEGIN
+            INSERT INTO inscriptos_fts (inscriptos_fts, rowid, nombre, apellido, dni, email)
+            VALUES ('delete', old.id, old.nombre, old.apellido, old.dni, old.email);
+            INSERT INTO inscriptos_fts (rowid, nombre, apellido, dni, email)
+            VALUES (new.id, new.nombre, new.apellido, new.dni, new.email);
+        END;
+    ''')
+
+    if not existia:
+        # Migración única: indexar los inscriptos que ya estaban en la base
+        cursor.execute("INSERT INTO inscriptos_fts (inscriptos_fts) VALUES ('rebuild')")
+    conn.commit()
+    return True
+
+
+def expresion_fts(texto):
+    """Convierte lo que escribe el usuario en una consulta MATCH por prefijo.
+
+    "fern ana" -> '"fern"* AND "ana"*'. Retorna None si no hay palabras.
+    """
+    palabras = re.findall(r"\w+", texto)
+    if not palabras:
+        return None
+    return " AND ".join(f'"{palabra}"*' for palabra in palabras)
+
+
+def consulta_busqueda(texto, usar_fts=True, limite=None):
+    """Arma el SQL y los parámetros para buscar inscriptos"""
+    sql, parametros = _consulta_sin_limite(texto, usar_fts)
+    if limite is not None:
+        sql += " LIMIT ?"
+        parametros += (limite,)
+    return sql, parametros
+
+
+def _consulta_sin_limite(texto, usar_fts):
+    if usar_fts:
+        expresion = expresion_fts(texto)
+        if expresion is None:
+            return f"SELECT {COLUMNAS_LISTADO} FROM inscriptos", ()
+        return f'''
+            SELECT {COLUMNAS_LISTADO}
+            FROM inscriptos
+            WHERE id IN (
+                SELECT rowid FROM inscriptos_fts WHERE inscriptos_fts MATCH ?
+            )
+        ''', (expresion,)
+
+    criterio = f"%{texto}%"
+    return f'''
+        SELECT {COLUMNAS_LISTADO}
+        FROM inscriptos
+        WHERE nombre LIKE ? OR apellido LIKE ? OR dni LIKE ? OR email LIKE ?
+    ''', (criterio, criterio, criterio, criterio)
@@ -0,0 +1,85 @@
+import queue
+import sqlite3
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+
+class BuscadorEnSegundoPlano(QObject):
+    """Ejecuta búsquedas en un hilo aparte, con su propia conexión SQLite
+    (la que el repositorio le asigna a ese hilo).
+
+    Cada pedido lleva un número de generación. Si llega un pedido nuevo
+    mientras otro se está ejecutando, el anterior se cancela con
+    interrupt() y su resultado se descarta.
+    """
+
+    # (generacion, filas)
+    resultados_listos = Signal(int, list)
+    # (generacion, mensaje): la base falló (bloqueada, error de disco...)
+    fallo = Signal(int, str)
+
+    def __init__(self, repo, limite=200, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self.limite = limite
+        self.generacion = 0
+        self._pedidos = queue.Queue()
+        self._conn = None
+        self._ocupado = threading.Event()
+        self._hilo = threading.Thread(target=self._trabajar, daemon=True)
+        self._hilo.start()
+
+    def buscar(self, texto):
+        """Encola una búsqueda y cancela la que esté en curso"""
+        self.generacion += 1
+        if self._ocupado.is_set() and self._conn is not None:
+            self._conn.interrupt()
+        self._pedidos.put((self.generacion, texto))
+        return self.generacion
+
+    def cancelar(self):
+        """Descarta cualquier búsqueda pendiente o en curso"""
+        self.generacion += 1
+        if self._ocupado.is_set() and self._conn is not None:
+            self._conn.interrupt()
+
+    def detener(self):
+        """Termina el hilo de búsqueda"""
+        if self._ocupado.is_set() and self._conn is not None:
+            self._conn.interrupt()
+        self._pedidos.put(None)
+        self._hilo.join(timeout=2)
+
+    def _trabajar(self):
+        self._conn = self.repo.conexion()
+        try:
+            while True:
+                pedido = self._pedidos.get()
+                # Si se acumularon pedidos, solo importa el último
+                while pedido is not None and not self._pedidos.empty():
+                    pedido = self._pedidos.get()
+                if pedido is None:
+                    break
+
+                generacion, texto = pedido
+                if generacion != self.generacion:
+                    continue
+
+                self._ocupado.set()
+                try:
+                    filas = self.repo.buscar(texto, self.limite)
+                except sqlite3.OperationalError as e:
+                    # interrupt() por un pedido más nuevo: no es un error
+                    if "interrupted" not in str(e):
+                        self.fallo.emit(generacion, str(e))
+                    continue
+                except sqlite3.Error as e:
+                    self.fallo.emit(generacion, str(e))
+                    continue
+                finally:
+                    self._ocupado.clear()
+
+                self.resultados_listos.emit(generacion, filas)
+        finally:
+            self.repo.liberar()
@@ -0,0 +1,116 @@
+"""Caché de resultados de consultas de lectura (listado, búsqueda, reportes).
+
+Ordenar, volver a una página o repetir una búsqueda ejecuta el mismo SQL
+con los mismos parámetros; si la base no cambió, el resultado es el
+mismo. La caché guarda los últimos resultados (LRU, por SQL y
+parámetros) y los descarta todos apenas alguien hace commit.
+
+Para saber si la base cambió lee PRAGMA data_version y total_changes en
+la misma conexión que va a hacer la consulta: data_version cambia con
+cada commit de otra conexión, de este proceso o de otro (la línea de
+comandos, la sincronización), y total_changes con los de esa conexión.
+Si alguno cambió desde la última vez que se miró en ese hilo, la caché
+pasa a una generación nueva y se vacía. Leerlos cuesta microsegundos,
+mucho menos que repetir la consulta.
+
+Una conexión con una transacción abierta no usa la caché: podría ver
+cambios que todavía no se confirmaron.
+"""
+import threading
+from collections import OrderedDict
+
+
+class CacheDeConsultas:
+    """LRU de resultados que se vacía cuando cambia la base.
+
+    Los resultados de más de `max_filas` filas no se guardan (una
+    búsqueda que trae media base no vale la memoria).
+    """
+
+    def __init__(self, max_entradas=256, max_filas=5000):
+        self.max_entradas = max_entradas
+        self.max_filas = max_filas
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+        self._entradas = OrderedDict()
+        self._generacion = 0
+        # Por hilo: (conexión, versión) de la última vez que se miró
+        self._vista = threading.local()
+        self._candado = threading.Lock()
+
+    def consultar(self, conn, sql, parametros=()):
+        """Filas de la consulta: de la caché si la base no cambió, si no de conn"""
+        if conn.in_transaction:
+            return conn.execute(sql, parametros).fetchall()
+        clave = (sql, parametros)
+        with self._candado:
+            # La versión se lee antes de consultar: si alguien escribe en el
+            # medio, la próxima lectura ve otra versión y la entrada se descarta
+            generacion = self._revisar(conn)
+            filas = self._buscar(clave)
+            if filas is not None:
+                return filas
+            self.fallos += 1
+
+        filas = conn.execute(sql, parametros).fetchall()
+        if len(filas) <= self.max_filas:
+            with self._candado:
+                if self._generacion == generacion:
+                    self._entradas[clave] = tuple(filas)
+                    self._entradas.move_to_end(clave)
+                    while len(self._entradas) > self.max_entradas:
+                        self._entradas.popitem(last=False)
+        return filas
+
+    def obtener(self, conn, sql, parametros=()):
+        """Filas guardadas de la consulta, o None si no están: conn solo se
+        usa para ver si la base cambió, nunca ejecuta la consulta"""
+        if conn.in_transaction:
+            return None
+        with self._candado:
+            self._revisar(conn)
+            return self._buscar((sql, parametros))
+
+    def _revisar(self, conn):
+        # Se llama con el candado tomado. Una conexión que el hilo no había
+        # mirado no sabe qué pasó antes: también cuenta como cambio
+        version = (conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes)
+        vista = getattr(self._vista, "conexion", None)
+        if vista is not conn or self._vista.version != version:
+            self._vista.conexion = conn
+            self._vista.version = version
+            if self._entradas:
+                self.invalidaciones += 1
+            self._entradas.clear()
+            self._generacion += 1
+        return self._generacion
+
+    def _buscar(self, clave):
+        # Se llama con el candado tomado
+        filas = self._entradas.get(clave)
+        if filas is None:
+            return None
+        self._entradas.move_to_end(clave)
+        self.aciertos += 1
+        return list(filas)
+
+    def vaciar(self):
+        with self._candado:
+            self._entradas.clear()
+            self._generacion += 1
+
+    def estadisticas(self):
+        with self._candado:
+            consultas = self.aciertos + self.fallos
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+                "invalidaciones": self.invalidaciones,
+                "entradas": len(self._entradas),
+            }
+
+    def cerrar(self):
+        with self._candado:
+            self._entradas.clear()
@@ -0,0 +1,178 @@
+"""Generador de carga para la API de preinscripción (servidor_api.py).
+
+    python carga_api.py --url http://127.0.0.1:8080 --concurrencia 50 --duracion 10
+
+Abre `concurrencia` clientes, cada uno con su conexión keep-alive, que
+piden sin pausa una mezcla de altas, búsquedas y reportes. Al terminar
+muestra pedidos por segundo y los percentiles de latencia de cada tipo.
+Las altas usan DNI a partir de --dni-inicial para no chocar con los que
+ya están en la base (un DNI repetido cuenta como 409, no como error).
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from urllib.parse import quote, urlsplit
+
+from datos_sinteticos import APELLIDOS, INSTITUCIONES, NOMBRES
+
+TIPOS = ("alta", "busqueda", "reporte")
+REPORTES = ("/reportes/total", "/reportes/instituciones", "/reportes/dias")
+
+
+def _percentil(tiempos, p):
+    ordenados = sorted(tiempos)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+class Cliente:
+    """Una conexión HTTP/1.1 que se reutiliza entre pedidos"""
+
+    def __init__(self, host, puerto):
+        self.host = host
+        self.puerto = puerto
+        self._lector = None
+        self._escritor = None
+
+    async def pedir(self, metodo, ruta, datos=None):
+        """Retorna (estado, cuerpo)"""
+        if self._escritor is None:
+            self._lector, self._escritor = await asyncio.open_connection(self.host, self.puerto)
+        cuerpo = json.dumps(datos).encode() if datos is not None else b""
+        self._escritor.write(
+            f"{metodo} {ruta} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(cuerpo)}\r\n\r\n".encode() + cuerpo
+        )
+        await self._escritor.drain()
+        encabezado = await self._lector.readuntil(b"\r\n\r\n")
+        lineas = encabezado.decode("latin-1").split("\r\n")
+        estado = int(lineas[0].split(" ", 2)[1])
+        largo = 0
+        cerrar = False
+        for linea in lineas[1:]:
+            nombre, _, valor = linea.partition(":")
+            if nombre.lower() == "content-length":
+                largo = int(valor)
+            elif nombre.lower() == "connection" and valor.strip().lower() == "close":
+                cerrar = True
+        respuesta = await self._lector.readexactly(largo)
+        if cerrar:
+            self.cerrar()
+        return estado, respuesta
+
+    def cerrar(self):
+        if self._escritor is not None:
+            self._escritor.close()
+            self._escritor = None
+
+
+class GeneradorDeCarga:
+    def __init__(self, url, concurrencia=20, duracion_s=10.0, mezcla=(0.5, 0.4, 0.1),
+                 dni_inicial=90_000_000, semilla=0):
+        partes = urlsplit(url)
+        self.host = partes.hostname or "127.0.0.1"
+        self.puerto = partes.port or 80
+        self.concurrencia = concurrencia
+        self.duracion_s = duracion_s
+        self.mezcla = mezcla
+        self.aleatorio = random.Random(semilla)
+        self._dnis = itertools.count(dni_inicial)
+        self.latencias = defaultdict(list)
+        self.estados = Counter()
+        self.errores = Counter()
+
+    def _pedido(self):
+        tipo = self.aleatorio.choices(TIPOS, weights=self.mezcla)[0]
+        if tipo == "alta":
+            nombre = self.aleatorio.choice(NOMBRES)
+            apellido = self.aleatorio.choice(APELLIDOS)
+            dni = str(next(self._dnis))
+            datos = {"nombre": nombre, "apellido": apellido, "dni": dni,
+                     "email": f"carga{dni}@example.com", "telefono": "11" + dni[-8:],
+                     "institucion": self.aleatorio.choice(INSTITUCIONES)}
+            return tipo, "POST", "/inscripciones", datos
+        if tipo == "busqueda":
+            texto = self.aleatorio.choice(APELLIDOS + NOMBRES)[:self.aleatorio.randint(3, 6)]
+            return tipo, "GET", f"/inscripciones?q={quote(texto)}&limite=20", None
+        return tipo, "GET", self.aleatorio.choice(REPORTES), None
+
+    async def _cliente(self, fin):
+        cliente = Cliente(self.host, self.puerto)
+        try:
+            while time.perf_counter() < fin:
+                tipo, metodo, ruta, datos = self._pedido()
+                inicio = time.perf_counter()
+                try:
+                    estado, _ = await cliente.pedir(metodo, ruta, datos)
+                except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                    cliente.cerrar()
+                    self.errores[type(e).__name__] += 1
+                    continue
+                self.latencias[tipo].append((time.perf_counter() - inicio) * 1000)
+                self.estados[estado] += 1
+        finally:
+            cliente.cerrar()
+
+    async def correr(self):
+        inicio = time.perf_counter()
+        fin = inicio + self.duracion_s
+        await asyncio.gather(*(self._cliente(fin) for _ in range(self.concurrencia)))
+        return self.resumen(time.perf_counter() - inicio)
+
+    def resumen(self, segundos):
+        todas = [ms for tiempos in self.latencias.values() for ms in tiempos]
+        resultado = {
+            "segundos": round(segundos, 2),
+            "concurrencia": self.concurrencia,
+            "pedidos": len(todas),
+            "pedidos_por_s": round(len(todas) / segundos, 1) if segundos else 0.0,
+            "estados": dict(sorted(self.estados.items())),
+            "errores": dict(self.errores),
+            "latencia_ms": {},
+        }
+        for tipo, tiempos in [("todos", todas)] + sorted(self.latencias.items()):
+            if tiempos:
+                resultado["latencia_ms"][tipo] = {
+                    "cantidad": len(tiempos),
+                    "p50": round(_percentil(tiempos, 50), 2),
+                    "p95": round(_percentil(tiempos, 95), 2),
+                    "p99": round(_percentil(tiempos, 99), 2),
+                    "max": round(max(tiempos), 2),
+                }
+        return resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--concurrencia", type=int, default=20, help="clientes a la vez")
+    parser.add_argument("--duracion", type=float, default=10.0, help="segundos")
+    parser.add_argument("--mezcla", type=float, nargs=3, default=[0.5, 0.4, 0.1],
+                        metavar=("ALTAS", "BUSQUEDAS", "REPORTES"), help="proporción de cada pedido")
+    parser.add_argument("--dni-inicial", type=int, default=90_000_000)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="mostrar el resultado como JSON")
+    args = parser.parse_args(argv)
+
+    generador = GeneradorDeCarga(args.url, args.concurrencia, args.duracion, args.mezcla,
+                                 args.dni_inicial, args.semilla)
+    resultado = asyncio.run(generador.correr())
+    if args.json:
+        print(json.dumps(resultado, indent=2))
+        return 0
+    print(f"{resultado['pedidos']} pedidos en {resultado['segundos']} s con {args.concurrencia} clientes: "
+          f"{resultado['pedidos_por_s']} pedidos/s")
+    print(f"Respuestas: {resultado['estados']}" + (f"  Errores: {resultado['errores']}"
+                                                   if resultado["errores"] else ""))
+    for tipo, datos in resultado["latencia_ms"].items():
+        print(f"  {tipo:<10} {datos['cantidad']:7d}  p50 {datos['p50']:7.2f} ms  p95 {datos['p95']:7.2f} ms  "
+              f"p99 {datos['p99']:7.2f} ms  máx {datos['max']:7.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+import sqlite3
+import threading
+
+SQL_CREAR_CENTRAL = '''
+    CREATE TABLE IF NOT EXISTS inscriptos_central (
+        dni TEXT PRIMARY KEY,
+        nombre TEXT NOT NULL,
+        apellido TEXT NOT NULL,
+        email TEXT NOT NULL,
+        telefono TEXT,
+        fecha_inscripcion DATE,
+        institucion TEXT,
+        puesto TEXT NOT NULL,
+        registrado_en TEXT NOT NULL,
+        hora_asistencia TEXT,
+        borrado_en TEXT,
+        secuencia INTEGER NOT NULL
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_central_secuencia ON inscriptos_central (secuencia);
+    CREATE TABLE IF NOT EXISTS secuencia_central (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        valor INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO secuencia_central (id, valor) VALUES (1, 0);
+'''
+
+
+class CentralSQLite:
+    """Servidor central de inscripciones sobre un archivo SQLite compartido.
+
+    Es el punto de encuentro de todos los puestos: recibe sus altas, bajas
+    y asistencias y decide qué registro queda para cada DNI. Cualquier otro servidor
+    (por ejemplo uno HTTP) sirve si ofrece enviar() y cambios_desde().
+
+    Regla de conflicto: para un mismo DNI gana el registro más antiguo
+    (registrado_en) y, si empatan, el puesto de nombre menor. No depende
+    del orden en que lleguen los envíos, así todos los puestos convergen.
+    La asistencia se guarda con la primera hora que llega y se conserva
+    aunque el registro sea reemplazado por uno más antiguo.
+
+    Una baja no borra la fila: la marca con borrado_en (la hora de la baja)
+    para que llegue a los demás puestos. Solo borra el registro si es
+    anterior a la baja, y después de una baja solo se acepta un alta
+    registrada más tarde.
+    """
+
+    def __init__(self, ruta, timeout=5.0):
+        self.ruta = ruta
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _conexion(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.ruta, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(SQL_CREAR_CENTRAL)
+            self._local.conn = conn
+        return conn
+
+    def cerrar(self):
+        """Cierra la conexión del hilo actual"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
+
+    def enviar(self, puesto, cambios):
+        """Recibe cambios (tipo, nombre, apellido, dni, email, telefono, fecha,
+        institucion, hora_asistencia, registrado_en) de un puesto; tipo es
+        'alta', 'baja' o 'asistencia'. En las bajas solo importan dni y
+        registrado_en.
+
+        Retorna una lista de bool: True si el cambio quedó en el central
+        (o ya estaba, si es un reenvío), False si perdió contra otro puesto
+        o no hay un registro vigente al que aplicarlo.
+        """
+        conn = self._conexion()
+        aceptados = []
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            secuencia = conn.execute("SELECT valor FROM secuencia_central WHERE id = 1").fetchone()[0]
+            for tipo, *datos, hora_asistencia, registrado_en in cambios:
+                dni = datos[2]
+                actual = conn.execute(
+                    "SELECT registrado_en, puesto, hora_asistencia, borrado_en FROM inscriptos_central "
+                    "WHERE dni = ?", (dni,)
+                ).fetchone()
+                vigente = actual is not None and actual[3] is None
+                if tipo == "asistencia":
+                    if vigente and actual[2] is None:
+                        secuencia += 1
+                        conn.execute(
+                            "UPDATE inscriptos_central SET hora_asistencia = ?, secuencia = ? WHERE dni = ?",
+                            (hora_asistencia, secuencia, dni))
+                    aceptados.append(vigente)
+                    continue
+                if tipo == "baja":
+                    if vigente and actual[0] <= registrado_en:
+                        secuencia += 1
+                        conn.execute(
+                            "UPDATE inscriptos_central SET borrado_en = ?, secuencia = ? WHERE dni = ?",
+                            (registrado_en, secuencia, dni))
+                        aceptados.append(True)
+                    else:
+                        # Ya estaba borrado, nunca llegó o se volvió a registrar después
+                        aceptados.append(actual is None or not vigente)
+                    continue
+                clave = (registrado_en, puesto)
+                if actual is not None and not vigente:
+                    if registrado_en <= actual[3]:
+                        aceptados.append(False)  # se borró después de este registro
+                        continue
+                    actual = None
+                elif actual is not None and tuple(actual[:2]) <= clave:
+                    aceptados.append(tuple(actual[:2]) == clave)
+                    continue
+                secuencia += 1
+                conn.execute('''
+                    INSERT OR REPLACE INTO inscriptos_central
+                    (nombre, apellido, dni, email, telefono, fecha_inscripcion, institucion,
+                     puesto, registrado_en, hora_asistencia, secuencia)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (*datos, puesto, registrado_en,
+                      actual[2] if actual is not None else None, secuencia))
+                aceptados.append(True)
+            conn.execute("UPDATE secuencia_central SET valor = ? WHERE id = 1", (secuencia,))
+        return aceptados
+
+    def cambios_desde(self, secuencia, limite):
+        """Registros que cambiaron después de `secuencia`, en orden"""
+        return self._conexion().execute('''
+            SELECT secuencia, nombre, apellido, dni, email, telefono, fecha_inscripcion,
+                   institucion, puesto, registrado_en, hora_asistencia, borrado_en
+            FROM inscriptos_central
+            WHERE secuencia > ?
+            ORDER BY secuencia
+            LIMIT ?
+        ''', (secuencia, limite)).fetchall()
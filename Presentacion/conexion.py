@@ -0,0 +1,145 @@
+import configparser
+import os
+import sqlite3
+from functools import lru_cache
+
+import instrumentacion
+
+RUTA_CONFIGURACION = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configuracion.ini")
+
+CONFIGURACION_POR_DEFECTO = {
+    "base_de_datos": {
+        "ruta": "inscripciones.db",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size_kb": "65536",
+        "mmap_size_mb": "256",
+        "busy_timeout_ms": "5000",
+        "cached_statements": "256",
+    },
+    "escritura_agrupada": {
+        "activa": "no",
+        "espera_ms": "5",
+        "max_lote": "200",
+    },
+    "cache_consultas": {
+        "activa": "si",
+        "max_entradas": "256",
+        "max_filas": "5000",
+    },
+    "sincronizacion": {
+        "activa": "no",
+        "central": "central.db",
+        "puesto": "",
+        "intervalo_s": "2",
+        "max_lote": "500",
+    },
+    "diagnostico": {
+        "activo": "no",
+        "log_json": "",
+    },
+    "notificaciones": {
+        "activa": "no",
+        "servidor": "localhost",
+        "puerto": "25",
+        "seguridad": "ninguna",
+        "usuario": "",
+        "clave": "",
+        "remitente": "inscripciones@localhost",
+        "concurrencia": "4",
+        "por_segundo": "10",
+        "max_intentos": "6",
+        "intervalo_s": "5",
+    },
+    "api": {
+        "host": "127.0.0.1",
+        "puerto": "8080",
+        "espera_ms": "5",
+        "hilos_lectura": "4",
+        "limite_busqueda": "100",
+        "max_cuerpo_kb": "16",
+    },
+    "documentos": {
+        "evento": "Evento Académico",
+        "fecha": "",
+        "procesos": "0",
+    },
+}
+
+# Letras del español que se cambian al armar la clave de orden (cada una
+# es un replace() anidado: con muchas más, SQLite no puede analizar la
+# expresión). La ñ no es una n con tilde: "n~" queda entre "nz" y "o",
+# como en el diccionario.
+EQUIVALENCIAS_ORDEN = {"á": "a", "é": "e", "í": "i", "ó": "o", "ú": "u", "ü": "u", "ñ": "n~"}
+EQUIVALENCIAS_ORDEN.update({letra.upper(): reemplazo for letra, reemplazo in EQUIVALENCIAS_ORDEN.items()})
+
+
+def expresion_orden(columna):
+    """Clave de orden en SQL puro: sin tildes y en minúsculas.
+
+    Solo usa funciones de SQLite (replace, lower), así la columna
+    calculada y su índice se pueden escribir desde cualquier conexión,
+    también desde el cliente sqlite3 u otras herramientas.
+    """
+    expresion = columna
+    for letra, reemplazo in EQUIVALENCIAS_ORDEN.items():
+        expresion = f"replace({expresion}, '{letra}', '{reemplazo}')"
+    return f"lower({expresion})"
+
+
+# Lo mismo que expresion_orden en una sola pasada: las equivalencias y
+# después lower() de SQLite, que solo cambia las letras ASCII
+TABLA_ORDEN = str.maketrans({**EQUIVALENCIAS_ORDEN,
+                             **{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}})
+
+
+@lru_cache(maxsize=65536)
+def clave_sin_tildes(texto):
+    """'Fernández' -> 'fernandez', 'Núñez' -> 'nun~ez': la misma clave que
+    calcula expresion_orden en SQL ('Àlex' queda 'Àlex', como en SQLite)"""
+    return texto.translate(TABLA_ORDEN)
+
+
+def cargar_configuracion(ruta=RUTA_CONFIGURACION):
+    """Lee configuracion.ini; lo que falte toma el valor por defecto"""
+    config = configparser.ConfigParser()
+    # Además de yes/no, true/false, on/off y 1/0
+    config.BOOLEAN_STATES = {**config.BOOLEAN_STATES, "si": True, "sí": True}
+    config.read_dict(CONFIGURACION_POR_DEFECTO)
+    config.read(ruta, encoding="utf-8")
+    return config
+
+
+def abrir_conexion(ruta_db=None, config=None, check_same_thread=True):
+    """Abre una conexión SQLite con los PRAGMA de la configuración.
+
+    WAL permite que varias lecturas convivan con una escritura, y
+    busy_timeout hace que una escritura espere en vez de fallar con
+    "database is locked" cuando otro puesto está escribiendo.
+    """
+    if config is None:
+        config = cargar_configuracion()
+    db = config["base_de_datos"]
+    if ruta_db is None:
+        ruta_db = db["ruta"]
+
+    # Con el diagnóstico activo cada sentencia se mide (ver instrumentacion.py)
+    factory = sqlite3.Connection
+    if config["diagnostico"].getboolean("activo"):
+        instrumentacion.activar()
+        factory = instrumentacion.ConexionMedida
+
+    conn = sqlite3.connect(
+        ruta_db,
+        timeout=db.getint("busy_timeout_ms") / 1000,
+        cached_statements=db.getint("cached_statements"),
+        check_same_thread=check_same_thread,
+        factory=factory,
+    )
+    conn.execute(f"PRAGMA journal_mode = {db['journal_mode']}")
+    conn.execute(f"PRAGMA synchronous = {db['synchronous']}")
+    # cache_size negativo = tamaño en KiB
+    conn.execute(f"PRAGMA cache_size = -{db.getint('cache_size_kb')}")
+    conn.execute(f"PRAGMA mmap_size = {db.getint('mmap_size_mb') * 1024 * 1024}")
+    conn.execute(f"PRAGMA busy_timeout = {db.getint('busy_timeout_ms')}")
+    return conn
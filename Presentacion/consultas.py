@@ -0,0 +1,64 @@
+from busqueda import COLUMNAS_LISTADO, consulta_busqueda
+
+# Criterio de ordenamiento -> columna del ORDER BY, que coincide con su
+# índice. Nombre y apellido se ordenan por su clave sin tildes (migración 7)
+ORDEN_LISTADO = {
+    'nombre': 'nombre_orden',
+    'apellido': 'apellido_orden',
+    'fecha_inscripcion': 'fecha_inscripcion',
+}
+
+# Los reportes leen las tablas de resumen que mantienen los triggers
+# (ver esquema.py), así cuestan O(cantidad de instituciones/días).
+SQL_REPORTE_TOTAL = "SELECT cantidad FROM resumen_total WHERE id = 1"
+
+SQL_REPORTE_INSTITUCIONES = '''
+    SELECT NULLIF(institucion, ''), cantidad
+    FROM resumen_instituciones
+    ORDER BY institucion
+'''
+
+SQL_REPORTE_DIARIO = '''
+    SELECT NULLIF(fecha, ''), cantidad
+    FROM resumen_diario
+    ORDER BY fecha
+'''
+
+
+def consulta_listado(criterio=None):
+    """SQL del listado de inscriptos, opcionalmente ordenado"""
+    sql = f"SELECT {COLUMNAS_LISTADO} FROM inscriptos"
+    if criterio is not None:
+        sql += f" ORDER BY {ORDEN_LISTADO[criterio]}"
+    return sql
+
+
+def consultas_de_pantallas(usar_fts=True):
+    """Las consultas que ejecuta cada pantalla, para revisar sus planes"""
+    consultas = [("Lista de inscriptos", consulta_listado(), ())]
+    for criterio in ORDEN_LISTADO:
+        consultas.append((f"Lista ordenada por {criterio}", consulta_listado(criterio), ()))
+    sql, parametros = consulta_busqueda("gomez", usar_fts)
+    consultas.append(("Búsqueda ('gomez')", sql, parametros))
+    consultas.append(("Reporte total", SQL_REPORTE_TOTAL, ()))
+    consultas.append(("Reporte por instituciones", SQL_REPORTE_INSTITUCIONES, ()))
+    consultas.append(("Reporte por día", SQL_REPORTE_DIARIO, ()))
+    return consultas
+
+
+def plan_de_consulta(conn, sql, parametros=()):
+    """Retorna las líneas de EXPLAIN QUERY PLAN con sangría según su nivel.
+
+    Las líneas que recorren una tabla completa sin índice se marcan con ⚠.
+    """
+    filas = conn.execute(f"EXPLAIN QUERY PLAN {sql}", parametros).fetchall()
+    niveles = {0: 0}
+    lineas = []
+    for id_nodo, padre, _, detalle in filas:
+        nivel = niveles.get(padre, 0) + 1
+        niveles[id_nodo] = nivel
+        sin_indice = (detalle.startswith("SCAN") and "INDEX" not in detalle
+                      and "VIRTUAL TABLE" not in detalle) or "TEMP B-TREE" in detalle
+        marca = "⚠ " if sin_indice else ""
+        lineas.append("  " * nivel + marca + detalle)
+    return lineas
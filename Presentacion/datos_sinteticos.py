@@ -0,0 +1,75 @@
+"""Generador reproducible de inscriptos ficticios para pruebas y mediciones.
+
+    from datos_sinteticos import generar_inscriptos
+    repo.insertar_lote(list(generar_inscriptos(10000)))
+
+Con la misma semilla siempre se generan las mismas filas.
+"""
+import itertools
+import random
+import unicodedata
+from datetime import date, timedelta
+
+NOMBRES = [
+    "María", "Juan", "Ana", "José", "Lucía", "Carlos", "Sofía", "Martín", "Valentina", "Diego",
+    "Camila", "Mateo", "Florencia", "Joaquín", "Agustina", "Nicolás", "Micaela", "Santiago",
+    "Julieta", "Tomás", "Paula", "Facundo", "Victoria", "Gonzalo", "Rocío", "Matías", "Carolina",
+    "Federico", "Milagros", "Ignacio", "Laura", "Pedro", "Belén", "Lautaro", "Romina", "Ezequiel",
+    "Natalia", "Franco", "Brenda", "Emiliano", "Gabriela", "Sebastián", "Antonella", "Marcos",
+    "Daniela", "Maximiliano", "Josefina", "Ramiro", "Candela", "Bruno",
+]
+
+APELLIDOS = [
+    "González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez", "Pérez",
+    "García", "Sánchez", "Romero", "Sosa", "Álvarez", "Torres", "Ruiz", "Ramírez", "Flores",
+    "Acosta", "Benítez", "Medina", "Suárez", "Herrera", "Aguirre", "Pereyra", "Gutiérrez",
+    "Giménez", "Molina", "Silva", "Castro", "Rojas", "Ortiz", "Núñez", "Luna", "Juárez",
+    "Cabrera", "Ríos", "Ferreyra", "Godoy", "Morales", "Domínguez", "Moreno", "Peralta",
+    "Vega", "Carrizo", "Quiroga", "Castillo", "Ledesma", "Muñoz", "Ojeda", "Ponce",
+]
+
+INSTITUCIONES = [
+    "Universidad Nacional", "Universidad Tecnológica", "Instituto Superior",
+    "Universidad Privada", "Colegio Profesional", "Instituto del Profesorado",
+    "Escuela Técnica N° 1", "Universidad Católica", "Instituto de Formación Docente",
+    "Centro de Estudios Terciarios", "Escuela Normal Superior", "Instituto Politécnico",
+    "Universidad del Centro", "Academia de Ciencias", "Colegio Nacional",
+]
+
+DOMINIOS = ["gmail.com", "hotmail.com", "yahoo.com.ar", "outlook.com", "email.com"]
+
+# DNI argentinos de personas adultas jóvenes
+DNI_DESDE = 20_000_000
+DNI_HASTA = 50_000_000
+
+
+def _pesos_zipf(cantidad, exponente=1.2):
+    """Pocas instituciones concentran la mayoría de los inscriptos"""
+    return list(itertools.accumulate(1 / (k ** exponente) for k in range(1, cantidad + 1)))
+
+
+def _sin_tildes(texto):
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).lower()
+
+
+def generar_inscriptos(n, semilla=0, inicio=date(2024, 1, 1), dias=90):
+    """Genera n filas en el orden de SQL_INSERTAR, con DNI únicos.
+
+    Las fechas se reparten en `dias` días a partir de `inicio`, con más
+    inscripciones hacia el final (como pasa antes de un cierre).
+    """
+    aleatorio = random.Random(semilla)
+    dnis = aleatorio.sample(range(DNI_DESDE, DNI_HASTA), n)
+    pesos_instituciones = _pesos_zipf(len(INSTITUCIONES))
+    pesos_dias = list(itertools.accumulate(1 + d for d in range(dias)))
+    fechas = [(inicio + timedelta(days=d)).isoformat() for d in range(dias)]
+    for dni in dnis:
+        nombre = aleatorio.choice(NOMBRES)
+        apellido = aleatorio.choice(APELLIDOS)
+        email = f"{_sin_tildes(nombre)}.{_sin_tildes(apellido)}{dni % 10000}@{aleatorio.choice(DOMINIOS)}"
+        # Algunos no dejan teléfono
+        telefono = f"11{aleatorio.randrange(10**8):08d}" if aleatorio.random() < 0.9 else ""
+        institucion = aleatorio.choices(INSTITUCIONES, cum_weights=pesos_instituciones)[0]
+        fecha = aleatorio.choices(fechas, cum_weights=pesos_dias)[0]
+        yield (nombre, apellido, str(dni), email, telefono, fecha, institucion)
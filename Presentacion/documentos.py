@@ -0,0 +1,272 @@
+"""Credenciales y certificados de asistencia para todos los inscriptos.
+
+Cada documento es un archivo (PDF o PNG) en la carpeta de destino. Se
+reparten en lotes entre varios procesos: dibujar con Qt es trabajo de
+CPU y un solo proceso tardaría horas con miles de inscriptos.
+
+- Los inscriptos se leen de a lotes, nunca todos juntos.
+- Cada proceso dibuja una sola vez lo que no cambia (marco, título,
+  texto del evento) en un QPicture y para cada inscripto solo agrega su
+  nombre e institución.
+- Cada archivo se escribe con otro nombre y se renombra al terminar: si
+  se corta a mitad de camino, al volver a correrlo se saltean los que ya
+  están y se sigue con el resto (los temporales que quedaron se borran).
+
+Qt se importa solo dentro de los procesos que dibujan, así la línea de
+comandos sigue sin cargar Qt.
+"""
+import atexit
+import os
+import re
+import unicodedata
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from multiprocessing import get_context
+
+FORMATOS = ("pdf", "png")
+TAMANIO_LOTE = 50
+RESOLUCION_DPI = 300
+
+# Tamaño de página en milímetros; se dibuja en décimas de milímetro
+TIPOS = {
+    "credencial": {"mm": (90, 55), "solo_presentes": False},
+    "certificado": {"mm": (297, 210), "solo_presentes": True},
+}
+
+COLOR_PRINCIPAL = "#1f4e79"
+COLOR_TEXTO = "#222222"
+
+# Estado de cada proceso que dibuja (ver _iniciar_proceso)
+_proceso = {}
+
+
+def nombre_archivo(tipo, formato, id_inscripto, nombre, apellido):
+    """'certificado_0000042_fernandez_maria.pdf'"""
+    texto = unicodedata.normalize("NFKD", f"{apellido} {nombre}")
+    texto = "".join(c for c in texto if not unicodedata.combining(c)).lower()
+    texto = "_".join(re.findall(r"[a-z0-9]+", texto))[:40]
+    return f"{tipo}_{id_inscripto:07d}_{texto}.{formato}"
+
+
+def ya_generados(carpeta, tipo, formato):
+    """Ids de los documentos que ya están en la carpeta (para retomar).
+
+    Borra los temporales a medio escribir que dejó una corrida cortada.
+    """
+    prefijo = tipo + "_"
+    extension = "." + formato
+    hechos = set()
+    with os.scandir(carpeta) as entradas:
+        for entrada in entradas:
+            if not entrada.name.startswith(prefijo):
+                continue
+            if entrada.name.endswith(extension + ".tmp"):
+                os.remove(entrada.path)
+            elif entrada.name.endswith(extension):
+                numero = entrada.name[len(prefijo):].split("_", 1)[0]
+                if numero.isdigit():
+                    hechos.add(int(numero))
+    return hechos
+
+
+def generar_documentos(repo, tipo, carpeta, formato="pdf", procesos=None, progreso=None, cancelado=None):
+    """Genera el documento `tipo` de cada inscripto (certificados: solo presentes).
+
+    Retorna un dict con 'generados', 'ya_estaban' y 'cancelado'.
+    """
+    if tipo not in TIPOS:
+        raise ValueError(f"Tipo de documento desconocido: {tipo}")
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconocido: {formato}")
+    seccion = repo.config["documentos"]
+    procesos = procesos or seccion.getint("procesos") or os.cpu_count() or 1
+    solo_presentes = TIPOS[tipo]["solo_presentes"]
+
+    os.makedirs(carpeta, exist_ok=True)
+    hechos = ya_generados(carpeta, tipo, formato)
+    total = repo.contar_presentes() if solo_presentes else repo.total()
+    resultado = {"generados": 0, "ya_estaban": 0, "cancelado": False}
+
+    # spawn y no fork: el proceso que llama puede tener Qt y otros hilos andando
+    pool = ProcessPoolExecutor(
+        max_workers=procesos,
+        mp_context=get_context("spawn"),
+        initializer=_iniciar_proceso,
+        initargs=(tipo, formato, carpeta, seccion["evento"], seccion["fecha"]),
+    )
+    en_curso = set()
+
+    def avisar():
+        if progreso:
+            progreso(resultado["generados"] + resultado["ya_estaban"], total)
+
+    def esperar(cuantos_quedan):
+        # Como mucho dos lotes por proceso en vuelo: la lectura no se adelanta
+        nonlocal en_curso
+        while len(en_curso) > cuantos_quedan:
+            listos, en_curso = wait(en_curso, return_when=FIRST_COMPLETED)
+            for futuro in listos:
+                resultado["generados"] += futuro.result()
+            avisar()
+
+    try:
+        for lote in repo.recorrer_para_documentos(solo_presentes, TAMANIO_LOTE):
+            pendientes = [fila for fila in lote if fila[0] not in hechos]
+            resultado["ya_estaban"] += len(lote) - len(pendientes)
+            if cancelado is not None and cancelado.is_set():
+                resultado["cancelado"] = True
+                break
+            if pendientes:
+                esperar(procesos * 2 - 1)
+                en_curso.add(pool.submit(_generar_lote, pendientes))
+            else:
+                avisar()
+        if not resultado["cancelado"]:
+            esperar(0)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    # Los lotes que ya estaban dibujándose al cancelar también quedaron en disco
+    for futuro in en_curso:
+        if not futuro.cancelled() and futuro.exception() is None:
+            resultado["generados"] += futuro.result()
+    avisar()
+    return resultado
+
+
+# --- Lo que sigue corre en los procesos que dibujan ---
+
+def _iniciar_proceso(tipo, formato, carpeta, evento, fecha):
+    """Prepara Qt sin pantalla y dibuja la plantilla una sola vez"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtGui import QGuiApplication
+
+    _proceso["app"] = QGuiApplication.instance() or QGuiApplication([])
+    _proceso["tipo"] = tipo
+    _proceso["formato"] = formato
+    _proceso["carpeta"] = carpeta
+    _proceso["plantilla"] = _dibujar_plantilla(tipo, evento, fecha)
+    atexit.register(_terminar_proceso)
+
+
+def _terminar_proceso():
+    """Suelta los objetos de Qt antes de que Python empiece a cerrarse.
+
+    Si la QGuiApplication y el QPicture quedan vivos hasta la limpieza
+    final del intérprete, PySide6 puede abortar el proceso con
+    "Fatal Python error: none_dealloc".
+    """
+    _fuente.cache_clear()
+    _proceso.clear()
+
+
+def _generar_lote(filas):
+    for id_inscripto, nombre, apellido, institucion in filas:
+        ruta = os.path.join(_proceso["carpeta"], nombre_archivo(
+            _proceso["tipo"], _proceso["formato"], id_inscripto, nombre, apellido))
+        temporal = ruta + ".tmp"
+        _dibujar_documento(temporal, nombre, apellido, institucion)
+        os.replace(temporal, ruta)
+    return len(filas)
+
+
+def _medidas(tipo):
+    ancho_mm, alto_mm = TIPOS[tipo]["mm"]
+    return ancho_mm * 10, alto_mm * 10
+
+
+@lru_cache(maxsize=256)
+def _fuente(pixeles, negrita=False, cursiva=False):
+    from PySide6.QtGui import QFont
+
+    fuente = QFont("Sans")
+    fuente.setPixelSize(pixeles)
+    fuente.setBold(negrita)
+    fuente.setItalic(cursiva)
+    return fuente
+
+
+def _texto_ajustado(pintor, rectangulo, texto, pixeles, negrita=False):
+    """Escribe texto centrado achicando la letra hasta que entre a lo ancho"""
+    from PySide6.QtCore import Qt
+
+    while True:
+        pintor.setFont(_fuente(pixeles, negrita))
+        if pixeles <= 20 or pintor.boundingRect(rectangulo, Qt.AlignCenter, texto).width() <= rectangulo.width():
+            break
+        pixeles = int(pixeles * 0.9)
+    pintor.drawText(rectangulo, Qt.AlignCenter, texto)
+
+
+def _dibujar_plantilla(tipo, evento, fecha):
+    from PySide6.QtCore import QRectF, Qt
+    from PySide6.QtGui import QColor, QPainter, QPen, QPicture
+
+    ancho, alto = _medidas(tipo)
+    plantilla = QPicture()
+    pintor = QPainter(plantilla)
+    pintor.setPen(QPen(QColor(COLOR_PRINCIPAL), 8 if tipo == "credencial" else 20))
+    if tipo == "credencial":
+        pintor.drawRoundedRect(QRectF(10, 10, ancho - 20, alto - 20), 30, 30)
+        pintor.fillRect(QRectF(14, 14, ancho - 28, 110), QColor(COLOR_PRINCIPAL))
+        pintor.setPen(QColor("white"))
+        _texto_ajustado(pintor, QRectF(40, 14, ancho - 80, 110), evento, 50, negrita=True)
+        pintor.setPen(QColor(COLOR_PRINCIPAL))
+        pintor.setFont(_fuente(30))
+        pintor.drawText(QRectF(40, alto - 90, ancho - 80, 60), Qt.AlignCenter, fecha)
+    else:
+        pintor.drawRect(QRectF(60, 60, ancho - 120, alto - 120))
+        pintor.setPen(QPen(QColor(COLOR_PRINCIPAL), 4))
+        pintor.drawRect(QRectF(100, 100, ancho - 200, alto - 200))
+        pintor.setFont(_fuente(140, negrita=True))
+        pintor.drawText(QRectF(0, 250, ancho, 200), Qt.AlignCenter, "CERTIFICADO DE ASISTENCIA")
+        pintor.setPen(QColor(COLOR_TEXTO))
+        pintor.setFont(_fuente(70, cursiva=True))
+        pintor.drawText(QRectF(0, 600, ancho, 120), Qt.AlignCenter, "Se certifica que")
+        texto = f"asistió a {evento}" + (f" el {fecha}" if fecha else "")
+        _texto_ajustado(pintor, QRectF(200, 1250, ancho - 400, 120), texto, 70)
+        pintor.setPen(QPen(QColor(COLOR_TEXTO), 3))
+        pintor.drawLine(ancho - 900, alto - 350, ancho - 300, alto - 350)
+        pintor.setFont(_fuente(45))
+        pintor.drawText(QRectF(ancho - 900, alto - 340, 600, 80), Qt.AlignCenter, "Organización")
+    pintor.end()
+    return plantilla
+
+
+def _dibujar_documento(ruta, nombre, apellido, institucion):
+    from PySide6.QtCore import QMarginsF, QRectF, QSizeF, Qt
+    from PySide6.QtGui import QColor, QImage, QPageSize, QPainter, QPdfWriter
+
+    tipo = _proceso["tipo"]
+    ancho, alto = _medidas(tipo)
+    if _proceso["formato"] == "pdf":
+        dispositivo = QPdfWriter(ruta)
+        dispositivo.setResolution(RESOLUCION_DPI)
+        dispositivo.setPageSize(QPageSize(QSizeF(*TIPOS[tipo]["mm"]), QPageSize.Millimeter))
+        dispositivo.setPageMargins(QMarginsF(0, 0, 0, 0))
+        pixeles = (dispositivo.width(), dispositivo.height())
+    else:
+        pixeles = tuple(round(mm / 25.4 * RESOLUCION_DPI) for mm in TIPOS[tipo]["mm"])
+        dispositivo = QImage(*pixeles, QImage.Format_RGB32)
+        dispositivo.fill(Qt.white)
+
+    pintor = QPainter(dispositivo)
+    pintor.setRenderHint(QPainter.Antialiasing)
+    pintor.setRenderHint(QPainter.TextAntialiasing)
+    pintor.setWindow(0, 0, ancho, alto)
+    pintor.setViewport(0, 0, *pixeles)
+    pintor.drawPicture(0, 0, _proceso["plantilla"])
+    pintor.setPen(QColor(COLOR_TEXTO))
+    if tipo == "credencial":
+        _texto_ajustado(pintor, QRectF(40, 150, ancho - 80, 130), nombre, 90, negrita=True)
+        _texto_ajustado(pintor, QRectF(40, 270, ancho - 80, 90), apellido.upper(), 60)
+        pintor.setPen(QColor(COLOR_PRINCIPAL))
+        _texto_ajustado(pintor, QRectF(40, 370, ancho - 80, 70), institucion or "", 40)
+    else:
+        _texto_ajustado(pintor, QRectF(200, 760, ancho - 400, 220), f"{nombre} {apellido}", 160, negrita=True)
+        if institucion:
+            _texto_ajustado(pintor, QRectF(200, 1020, ancho - 400, 120), f"de {institucion}", 70)
+    pintor.end()
+
+    if _proceso["formato"] == "png":
+        if not dispositivo.save(ruta, "PNG"):
+            raise OSError(f"No se pudo guardar {ruta}")
@@ -0,0 +1,286 @@
+"""Detección de inscriptos duplicados (la misma persona cargada dos veces).
+
+Comparar todos contra todos es O(n²): con 500.000 inscriptos serían
+más de cien mil millones de pares. En cambio, cada inscripto se reparte
+en "bloques" según claves baratas de calcular y solo se comparan los
+que comparten algún bloque:
+
+- DNI: el DNI y sus variantes con un dígito borrado. Dos DNI a un error
+  de tipeo (un dígito cambiado, de más, de menos o dos invertidos)
+  comparten alguna de esas claves. Con cientos de miles de DNI reales
+  sobran los que están a un dígito de otro, así que la clave lleva
+  también el apellido fonético: con solo el DNI parecido, el nombre
+  tiene que coincidir casi entero para llegar al umbral.
+- Email: la parte local normalizada (sin mayúsculas, sin "+etiqueta" y,
+  en Gmail, sin puntos). Para el puntaje de "mismo email" también tiene
+  que coincidir el dominio: ana@gmail.com y ana@yahoo.com no son la
+  misma casilla.
+- Teléfono, solo los dígitos.
+- Apellido fonético + inicial del nombre ("Gómez"/"Gomes", "Vázquez"/
+  "Basques"). Junta a quienes tienen el email a un error de tipeo.
+
+Los bloques demasiado grandes (un apellido muy común) no se comparan
+completos: se ordenan y cada uno se compara solo con sus vecinos.
+"""
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from itertools import compress, cycle
+
+UMBRAL = 0.75
+MAX_BLOQUE = 50
+VENTANA = 4
+
+DOMINIOS_SIN_PUNTOS = {"gmail.com", "googlemail.com"}
+SIN_DIGITOS = str.maketrans("", "", "0123456789")
+
+# Reglas del español rioplatense que suenan igual, en orden de aplicación
+REGLAS_FONETICAS = [
+    (r"ch", "x"),
+    (r"qu", "k"),
+    (r"c(?=[eiy])", "s"),
+    (r"c", "k"),
+    (r"z", "s"),
+    (r"g(?=[eiy])", "j"),
+    (r"gu(?=[eiy])", "g"),
+    (r"ü", "u"),
+    (r"ll", "y"),
+    (r"v", "b"),
+    (r"w", "b"),
+    (r"h", ""),
+    (r"y$", "i"),
+    (r"(.)\1+", r"\1"),
+]
+REGLAS_FONETICAS = [(re.compile(patron), reemplazo) for patron, reemplazo in REGLAS_FONETICAS]
+
+
+@lru_cache(maxsize=65536)
+def normalizar_texto(texto):
+    """'  María  José ' -> 'maria jose'"""
+    descompuesto = unicodedata.normalize("NFKD", texto or "")
+    sin_tildes = "".join(c for c in descompuesto if not unicodedata.combining(c)).lower()
+    return " ".join(re.sub(r"[^a-zñ ]", " ", sin_tildes).split())
+
+
+def normalizar_email(email):
+    """(parte local, dominio) del email, tal como los entiende el servidor de correo"""
+    local, _, dominio = (email or "").strip().lower().partition("@")
+    local = local.split("+", 1)[0]
+    if dominio in DOMINIOS_SIN_PUNTOS:
+        local = local.replace(".", "")
+    return local, dominio
+
+
+@lru_cache(maxsize=65536)
+def clave_fonetica(texto):
+    """'Vázquez' y 'Basques' -> 'baskes'"""
+    clave = normalizar_texto(texto).replace(" ", "")
+    for patron, reemplazo in REGLAS_FONETICAS:
+        clave = patron.sub(reemplazo, clave)
+    return clave
+
+
+def claves_dni(dnis):
+    """Para cada DNI, él mismo y sus variantes con un dígito borrado (sin repetir).
+
+    Se arman por columnas (todos los DNI sin el dígito 0, todos sin el 1,
+    ...) en vez de inscripto por inscripto: son listas por comprensión,
+    mucho más rápidas con cientos de miles de DNI.
+    """
+    claves = list(dnis)
+    for p in range(max(map(len, dnis), default=0)):
+        # Borrar uno de dos dígitos iguales seguidos da la misma clave dos
+        # veces; la segunda (y las de DNI más cortos) quedan vacías
+        claves.extend([dni[:p] + dni[p + 1:] if p < len(dni) and dni[p - 1:p] != dni[p] else ""
+                       for dni in dnis])
+    return claves
+
+
+def distancia(a, b):
+    """Distancia de edición con transposiciones (Damerau-Levenshtein restringida)"""
+    if a == b:
+        return 0
+    anterior_previa = None
+    anterior = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        actual = [i] + [0] * len(b)
+        for j, cb in enumerate(b, start=1):
+            costo = ca != cb
+            actual[j] = min(anterior[j] + 1, actual[j - 1] + 1, anterior[j - 1] + costo)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                actual[j] = min(actual[j], anterior_previa[j - 2] + 1)
+        anterior_previa, anterior = anterior, actual
+    return anterior[-1]
+
+
+def a_un_error(a, b):
+    """True si b sale de a con a lo sumo un cambio, agregado, borrado o
+    intercambio de dos vecinos (como distancia(a, b) <= 1, pero sin la tabla)"""
+    if len(a) < len(b):
+        a, b = b, a
+    if len(a) - len(b) > 1:
+        return False
+    # Con un solo error, el principio o el final quedan intactos: así se
+    # descartan enseguida casi todos los pares sin recorrerlos
+    mitad = (len(b) - 2) // 2
+    if mitad > 0 and a[:mitad] != b[:mitad] and a[-mitad:] != b[-mitad:]:
+        return False
+    i = 0
+    while i < len(b) and a[i] == b[i]:
+        i += 1
+    if len(a) != len(b):
+        return a[i + 1:] == b[i:]
+    if a[i + 1:] == b[i + 1:]:
+        return True
+    return a[i + 1:i + 2] == b[i:i + 1] and a[i:i + 1] == b[i + 1:i + 2] and a[i + 2:] == b[i + 2:]
+
+
+class _Candidato:
+    """Lo que hace falta de cada inscripto para comparar, ya normalizado"""
+
+    __slots__ = ("fila", "nombre", "dni", "email", "dominio", "letras", "telefono", "fonetica")
+
+    def __init__(self, fila):
+        _, nombre, apellido, dni, email, telefono, _, _ = fila
+        self.fila = fila
+        # Nombres y apellidos se repiten mucho: se normalizan por separado (con
+        # caché). El apellido se compara por cómo suena: "Gómez" = "Gomes"
+        apellido_fonetico = clave_fonetica(apellido)
+        self.nombre = f"{normalizar_texto(nombre)} {apellido_fonetico}".strip()
+        self.fonetica = apellido_fonetico + self.nombre[:1]
+        self.dni = dni
+        # La parte local es la clave de bloque; el dominio solo se usa al comparar
+        self.email, self.dominio = normalizar_email(email)
+        self.letras = self.email.translate(SIN_DIGITOS)
+        self.telefono = re.sub(r"\D", "", telefono or "")
+
+
+def comparar(a, b, umbral=UMBRAL):
+    """Puntaje entre 0 y 1 y motivos, o None si no alcanza el umbral.
+
+    puntaje = 0.6 * similitud del nombre completo (con el apellido
+    fonético) + 0.2 por cada dato
+    que coincide (DNI o email a un error de tipeo, teléfono), hasta dos.
+    """
+    motivos = []
+    if a.dni != b.dni and a_un_error(a.dni, b.dni):
+        motivos.append("DNI casi igual")
+    if a.email and a.email == b.email and a.dominio == b.dominio:
+        motivos.append("mismo email")
+    elif a.email and b.email and a_un_error(a.email, b.email) and a.letras != b.letras:
+        # "ana.perez12" y "ana.perez13" suelen ser dos personas; "ana.perze12", un error
+        motivos.append("email casi igual")
+    if a.telefono and a.telefono == b.telefono:
+        motivos.append("mismo teléfono")
+    datos = 0.2 * min(len(motivos), 2)
+    # Similitud mínima del nombre para llegar al umbral, pasada a cantidad de
+    # errores permitidos: casi siempre 0 o 1, y eso se ve sin calcular la tabla
+    largo = max(len(a.nombre), len(b.nombre))
+    if not largo:
+        return None
+    errores = int(largo * (1 - (umbral - datos) / 0.6) + 1e-9)
+    if errores < 0 or abs(len(a.nombre) - len(b.nombre)) > errores:
+        return None
+    if errores == 0:
+        errores_nombre = 0 if a.nombre == b.nombre else 1
+    elif errores == 1:
+        errores_nombre = 0 if a.nombre == b.nombre else 1 if a_un_error(a.nombre, b.nombre) else 2
+    else:
+        errores_nombre = distancia(a.nombre, b.nombre)
+    if errores_nombre > errores:
+        return None
+    puntaje = 0.6 * (1 - errores_nombre / largo) + datos
+    return round(puntaje, 3), motivos
+
+
+def _agrupar(claves, cantidad):
+    """Bloques (listas de índices) de las claves repetidas.
+
+    claves puede traer varias columnas seguidas de `cantidad` elementos
+    (como las de claves_dni): el índice del inscripto es la posición
+    módulo `cantidad`. Casi ninguna clave se repite, así que primero se
+    cuentan y se filtran en C, y en Python solo se recorren las repetidas.
+    """
+    repetidas = {clave for clave, veces in Counter(claves).items() if veces > 1 and clave}
+    bloques = {}
+    for posicion in compress(range(len(claves)), map(repetidas.__contains__, claves)):
+        bloques.setdefault(claves[posicion], []).append(posicion % cantidad)
+    return bloques.values()
+
+
+def _pares_del_bloque(indices, candidatos):
+    if len(indices) <= MAX_BLOQUE:
+        for posicion, i in enumerate(indices):
+            for j in indices[posicion + 1:]:
+                yield i, j
+        return
+    # Bloque grande: vecindario ordenado (cada uno con los VENTANA siguientes)
+    ordenados = sorted(indices, key=lambda i: (candidatos[i].nombre, candidatos[i].letras))
+    for posicion, i in enumerate(ordenados):
+        for j in ordenados[posicion + 1:posicion + 1 + VENTANA]:
+            yield i, j
+
+
+def detectar_duplicados(repo, umbral=UMBRAL, progreso=None, cancelado=None):
+    """Recorre todos los inscriptos y retorna los pares sospechosos.
+
+    Retorna una lista de dicts con 'a' y 'b' (filas completas), 'puntaje'
+    y 'motivos', del más probable al menos probable. Se omiten los pares
+    que ya se revisaron y se marcaron como personas distintas. Si se
+    cancela, retorna None.
+    """
+    total = repo.total()
+    candidatos = []
+    for lote in repo.recorrer_todos(10000):
+        candidatos.extend(_Candidato(fila) for fila in lote)
+        if progreso:
+            progreso(len(candidatos), total * 2)
+        if cancelado is not None and cancelado.is_set():
+            return None
+
+    cantidad = len(candidatos)
+    foneticas = [c.fonetica for c in candidatos]
+    bloques = [
+        _agrupar([clave and clave + fonetica for clave, fonetica
+                  in zip(claves_dni([c.dni for c in candidatos]), cycle(foneticas))], cantidad),
+        _agrupar([c.email for c in candidatos], cantidad),
+        _agrupar([c.telefono for c in candidatos], cantidad),
+        _agrupar(foneticas, cantidad),
+    ]
+    por_fonetica = bloques[-1]
+
+    descartados = repo.pares_descartados()
+    # Solo se recuerdan los pares encontrados: un par que comparte dos
+    # bloques se compara dos veces, pero anotar todos costaría más memoria
+    encontrados = set()
+    resultado = []
+    cantidad_bloques = sum(len(bloque) for bloque in bloques)
+    todos = ((bloque is por_fonetica, indices) for bloque in bloques for indices in bloque)
+    for numero, (fonetico, indices) in enumerate(todos):
+        for i, j in _pares_del_bloque(indices, candidatos):
+            if i > j:
+                i, j = j, i
+            # Lo único que solo encuentra el bloque fonético es un email con
+            # un error de tipeo: DNI, email y teléfono tienen sus propios bloques
+            if fonetico and (candidatos[i].letras == candidatos[j].letras
+                             or not a_un_error(candidatos[i].email, candidatos[j].email)):
+                continue
+            comparacion = comparar(candidatos[i], candidatos[j], umbral)
+            if comparacion is None or (i, j) in encontrados:
+                continue
+            encontrados.add((i, j))
+            a, b = candidatos[i], candidatos[j]
+            if (a.fila[0], b.fila[0]) not in descartados:
+                puntaje, motivos = comparacion
+                resultado.append({"a": a.fila, "b": b.fila, "puntaje": puntaje, "motivos": motivos})
+        if numero % 50000 == 0:
+            if progreso:
+                progreso(total + total * numero // cantidad_bloques, total * 2)
+            if cancelado is not None and cancelado.is_set():
+                return None
+
+    if progreso:
+        progreso(total * 2, total * 2)
+    resultado.sort(key=lambda par: par["puntaje"], reverse=True)
+    return resultado
@@ -0,0 +1,34 @@
+import sqlite3
+
+from PySide6.QtCore import QObject, Signal
+
+
+class EnvioDeRegistros(QObject):
+    """Manda los registros del formulario al EscritorAgrupado sin esperar.
+
+    enviar() vuelve enseguida; el resultado llega después por señales,
+    ya en el hilo de la interfaz (Qt encola la señal emitida desde el
+    hilo escritor).
+    """
+
+    # (inscripto, id nuevo)
+    registrado = Signal(object, int)
+    # (inscripto, motivo)
+    rechazado = Signal(object, str)
+
+    def __init__(self, escritor, parent=None):
+        super().__init__(parent)
+        self.escritor = escritor
+
+    def enviar(self, inscripto):
+        futuro = self.escritor.insertar(inscripto.como_fila())
+        futuro.add_done_callback(lambda f: self._terminado(inscripto, f))
+
+    def _terminado(self, inscripto, futuro):
+        error = futuro.exception()
+        if error is None:
+            self.registrado.emit(inscripto, futuro.result())
+        elif isinstance(error, sqlite3.IntegrityError):
+            self.rechazado.emit(inscripto, "El DNI ya está registrado")
+        else:
+            self.rechazado.emit(inscripto, f"No se pudo guardar: {error}")
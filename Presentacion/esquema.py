@@ -0,0 +1,222 @@
+import sys
+
+from conexion import expresion_orden
+
+# Cada paso de migración se aplica una sola vez; la versión aplicada
+# queda guardada en PRAGMA user_version.
+MIGRACIONES = [
+    # 1: índices para ordenar el listado y agrupar reportes. Nombre y
+    # apellido se ordenan por una clave sin tildes calculada con SQL puro
+    # (ver expresion_orden), así cualquier conexión puede escribir en la
+    # tabla, también el cliente sqlite3. Las columnas son VIRTUAL: no
+    # ocupan lugar en la tabla, solo en el índice.
+    f'''
+    ALTER TABLE inscriptos ADD COLUMN nombre_orden TEXT
+        GENERATED ALWAYS AS ({expresion_orden("nombre")}) VIRTUAL;
+    ALTER TABLE inscriptos ADD COLUMN apellido_orden TEXT
+        GENERATED ALWAYS AS ({expresion_orden("apellido")}) VIRTUAL;
+    CREATE INDEX idx_inscriptos_nombre_orden ON inscriptos (nombre_orden);
+    CREATE INDEX idx_inscriptos_apellido_orden ON inscriptos (apellido_orden);
+    CREATE INDEX IF NOT EXISTS idx_inscriptos_fecha
+        ON inscriptos (fecha_inscripcion);
+    CREATE INDEX IF NOT EXISTS idx_inscriptos_institucion
+        ON inscriptos (institucion);
+    ''',
+
+    # 2: resúmenes para reportes, mantenidos por triggers.
+    # institucion y fecha NULL se guardan como '' para poder ser clave.
+    '''
+    CREATE TABLE resumen_total (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        cantidad INTEGER NOT NULL
+    );
+    CREATE TABLE resumen_instituciones (
+        institucion TEXT PRIMARY KEY,
+        cantidad INTEGER NOT NULL
+    ) WITHOUT ROWID;
+    CREATE TABLE resumen_diario (
+        fecha TEXT PRIMARY KEY,
+        cantidad INTEGER NOT NULL
+    ) WITHOUT ROWID;
+
+    INSERT INTO resumen_total (id, cantidad) SELECT 1, COUNT(*) FROM inscriptos;
+    INSERT INTO resumen_instituciones (institucion, cantidad)
+        SELECT COALESCE(institucion, ''), COUNT(*) FROM inscriptos GROUP BY 1;
+    INSERT INTO resumen_diario (fecha, cantidad)
+        SELECT COALESCE(fecha_inscripcion, ''), COUNT(*) FROM inscriptos GROUP BY 1;
+
+    CREATE TRIGGER resumen_ai AFTER INSERT ON inscriptos BEGIN
+        UPDATE resumen_total SET cantidad = cantidad + 1 WHERE id = 1;
+        INSERT INTO resumen_instituciones (institucion, cantidad)
+            VALUES (COALESCE(new.institucion, ''), 1)
+            ON CONFLICT (institucion) DO UPDATE SET cantidad = cantidad + 1;
+        INSERT INTO resumen_diario (fecha, cantidad)
+            VALUES (COALESCE(new.fecha_inscripcion, ''), 1)
+            ON CONFLICT (fecha) DO UPDATE SET cantidad = cantidad + 1;
+    END;
+
+    CREATE TRIGGER resumen_ad AFTER DELETE ON inscriptos BEGIN
+        UPDATE resumen_total SET cantidad = cantidad - 1 WHERE id = 1;
+        UPDATE resumen_instituciones SET cantidad = cantidad - 1
+            WHERE institucion = COALESCE(old.institucion, '');
+        DELETE FROM resumen_instituciones
+            WHERE institucion = COALESCE(old.institucion, '') AND cantidad <= 0;
+        UPDATE resumen_diario SET cantidad = cantidad - 1
+            WHERE fecha = COALESCE(old.fecha_inscripcion, '');
+        DELETE FROM resumen_diario
+            WHERE fecha = COALESCE(old.fecha_inscripcion, '') AND cantidad <= 0;
+    END;
+
+    CREATE TRIGGER resumen_au_institucion AFTER UPDATE OF institucion ON inscriptos
+    WHEN COALESCE(old.institucion, '') <> COALESCE(new.institucion, '') BEGIN
+        UPDATE resumen_instituciones SET cantidad = cantidad - 1
+            WHERE institucion = COALESCE(old.institucion, '');
+        DELETE FROM resumen_instituciones
+            WHERE institucion = COALESCE(old.institucion, '') AND cantidad <= 0;
+        INSERT INTO resumen_instituciones (institucion, cantidad)
+            VALUES (COALESCE(new.institucion, ''), 1)
+            ON CONFLICT (institucion) DO UPDATE SET cantidad = cantidad + 1;
+    END;
+
+    CREATE TRIGGER resumen_au_fecha AFTER UPDATE OF fecha_inscripcion ON inscriptos
+    WHEN COALESCE(old.fecha_inscripcion, '') <> COALESCE(new.fecha_inscripcion, '') BEGIN
+        UPDATE resumen_diario SET cantidad = cantidad - 1
+            WHERE fecha = COALESCE(old.fecha_inscripcion, '');
+        DELETE FROM resumen_diario
+            WHERE fecha = COALESCE(old.fecha_inscripcion, '') AND cantidad <= 0;
+        INSERT INTO resumen_diario (fecha, cantidad)
+            VALUES (COALESCE(new.fecha_inscripcion, ''), 1)
+            ON CONFLICT (fecha) DO UPDATE SET cantidad = cantidad + 1;
+    END;
+    ''',
+
+    # 3: control de asistencia el día del evento
+    '''
+    ALTER TABLE inscriptos ADD COLUMN asistencia INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE inscriptos ADD COLUMN hora_asistencia TEXT;
+    ''',
+
+    # 4: sincronización entre puestos (ver sincronizacion.py).
+    # origen NULL = registrado en este puesto; si no, el puesto de donde vino.
+    # Con la sincronización activa (estado_sincronizacion.registrar), cada
+    # alta local y cada asistencia quedan en cambios_locales hasta que el
+    # servidor central las confirma. Apagada no se anota nada. Al aplicar lo
+    # que llega del central, registrar se pone en 0 dentro de la misma
+    # transacción, así esos cambios no se vuelven a enviar.
+    '''
+    ALTER TABLE inscriptos ADD COLUMN origen TEXT;
+
+    CREATE TABLE estado_sincronizacion (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        ultima_secuencia INTEGER NOT NULL,
+        registrar INTEGER NOT NULL DEFAULT 0
+    );
+    INSERT INTO estado_sincronizacion (id, ultima_secuencia) VALUES (1, 0);
+
+    CREATE TABLE cambios_locales (
+        id INTEGER PRIMARY KEY,
+        tipo TEXT NOT NULL,
+        id_inscripto INTEGER NOT NULL,
+        dni TEXT NOT NULL,
+        registrado_en TEXT NOT NULL
+    );
+    CREATE INDEX idx_cambios_inscripto ON cambios_locales (id_inscripto);
+
+    CREATE TRIGGER cambios_ai AFTER INSERT ON inscriptos
+    WHEN new.origen IS NULL AND (SELECT registrar FROM estado_sincronizacion) BEGIN
+        INSERT INTO cambios_locales (tipo, id_inscripto, dni, registrado_en)
+            VALUES ('alta', new.id, new.dni, strftime('%Y-%m-%dT%H:%M:%f', 'now'));
+    END;
+
+    CREATE TRIGGER cambios_au_asistencia AFTER UPDATE OF asistencia ON inscriptos
+    WHEN new.asistencia AND NOT old.asistencia AND (SELECT registrar FROM estado_sincronizacion) BEGIN
+        INSERT INTO cambios_locales (tipo, id_inscripto, dni, registrado_en)
+            VALUES ('asistencia', new.id, new.dni, strftime('%Y-%m-%dT%H:%M:%f', 'now'));
+    END;
+
+    CREATE TABLE conflictos_sincronizacion (
+        id INTEGER PRIMARY KEY,
+        dni TEXT NOT NULL,
+        descartado TEXT NOT NULL,
+        puesto_ganador TEXT NOT NULL,
+        fecha TEXT NOT NULL
+    );
+    ''',
+
+    # 5: revisión de duplicados (ver duplicados.py). Los pares revisados y
+    # marcados como personas distintas no se vuelven a proponer. Con la
+    # sincronización activa, borrar un registro que ya se envió al central
+    # anota una baja para que se borre también en los demás puestos.
+    '''
+    CREATE TABLE duplicados_descartados (
+        id_a INTEGER NOT NULL,
+        id_b INTEGER NOT NULL,
+        PRIMARY KEY (id_a, id_b)
+    ) WITHOUT ROWID;
+
+    CREATE TRIGGER cambios_ad AFTER DELETE ON inscriptos BEGIN
+        INSERT INTO cambios_locales (tipo, id_inscripto, dni, registrado_en)
+            SELECT 'baja', old.id, old.dni, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+            FROM estado_sincronizacion
+            WHERE registrar AND NOT EXISTS (
+                SELECT 1 FROM cambios_locales WHERE id_inscripto = old.id AND tipo = 'alta');
+        DELETE FROM cambios_locales WHERE id_inscripto = old.id AND tipo <> 'baja';
+        DELETE FROM duplicados_descartados WHERE id_a = old.id OR id_b = old.id;
+    END;
+    ''',
+
+    # 6: bandeja de salida de emails (ver notificaciones.py). El trigger
+    # encola el aviso en la misma transacción del alta: si el registro se
+    # guarda, el aviso también. UNIQUE: un solo aviso de cada tipo por
+    # inscripto. No se encolan avisos para los inscriptos que ya estaban ni
+    # para las cargas masivas (importación, datos de ejemplo), que insertan
+    # con notificar = 0. reclamado_en es cuándo un enviador tomó el aviso;
+    # al arrancar solo se devuelven los reclamos vencidos, no los que otro
+    # proceso está enviando en ese momento.
+    '''
+    ALTER TABLE inscriptos ADD COLUMN notificar INTEGER NOT NULL DEFAULT 1;
+
+    CREATE TABLE notificaciones (
+        id INTEGER PRIMARY KEY,
+        id_inscripto INTEGER NOT NULL,
+        tipo TEXT NOT NULL,
+        email TEXT NOT NULL,
+        estado TEXT NOT NULL DEFAULT 'pendiente',
+        intentos INTEGER NOT NULL DEFAULT 0,
+        proximo_intento TEXT NOT NULL,
+        ultimo_error TEXT,
+        enviado_en TEXT,
+        reclamado_en TEXT,
+        UNIQUE (id_inscripto, tipo)
+    );
+    CREATE INDEX idx_notificaciones_pendientes ON notificaciones (estado, proximo_intento);
+
+    CREATE TRIGGER notificaciones_ai AFTER INSERT ON inscriptos
+    WHEN new.origen IS NULL AND new.notificar AND new.email <> '' BEGIN
+        INSERT OR IGNORE INTO notificaciones (id_inscripto, tipo, email, proximo_intento)
+            VALUES (new.id, 'confirmacion', new.email, strftime('%Y-%m-%dT%H:%M:%f', 'now'));
+    END;
+
+    CREATE TRIGGER notificaciones_ad AFTER DELETE ON inscriptos BEGIN
+        DELETE FROM notificaciones WHERE id_inscripto = old.id AND estado <> 'enviado';
+    END;
+    ''',
+]
+
+
+def version_esquema(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrar(conn):
+    """Aplica las migraciones pendientes, cada una en su propia transacción"""
+    version = version_esquema(conn)
+    for numero, script in enumerate(MIGRACIONES[version:], start=version + 1):
+        try:
+            conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {numero};\nCOMMIT;")
+        except Exception:
+            conn.rollback()
+            raise
+        print(f"Migración {numero} aplicada", file=sys.stderr)
+    if version < len(MIGRACIONES):
+        conn.execute("ANALYZE")
@@ -0,0 +1,134 @@
+import csv
+import json
+import os
+
+COLUMNAS = ["id", "nombre", "apellido", "dni", "email", "telefono", "fecha_inscripcion", "institucion"]
+TAMANIO_LOTE = 10000
+TAMANIO_BUFFER = 1 << 20
+
+FORMATOS = {
+    "csv": ".csv",
+    "jsonl": ".jsonl",
+    "parquet": ".parquet",
+}
+
+
+def parquet_disponible():
+    """Parquet es opcional: necesita pyarrow instalado"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def formato_desde_ruta(ruta):
+    """Deduce el formato a partir de la extensión del archivo"""
+    extension = os.path.splitext(ruta)[1].lower()
+    for formato, ext in FORMATOS.items():
+        if extension == ext:
+            return formato
+    return "csv"
+
+
+class _EscritorCSV:
+    def __init__(self, ruta):
+        self.archivo = open(ruta, "w", newline="", encoding="utf-8", buffering=TAMANIO_BUFFER)
+        self.csv = csv.writer(self.archivo)
+        self.csv.writerow(COLUMNAS)
+
+    def escribir(self, lote):
+        self.csv.writerows(lote)
+
+    def cerrar(self):
+        self.archivo.close()
+
+
+class _EscritorJSONL:
+    def __init__(self, ruta):
+        self.archivo = open(ruta, "w", encoding="utf-8", buffering=TAMANIO_BUFFER)
+
+    def escribir(self, lote):
+        self.archivo.writelines(
+            json.dumps(dict(zip(COLUMNAS, fila)), ensure_ascii=False) + "\n" for fila in lote
+        )
+
+    def cerrar(self):
+        self.archivo.close()
+
+
+class _EscritorParquet:
+    """Formato columnar para análisis: cada lote es un row group"""
+
+    def __init__(self, ruta):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.pa = pa
+        campos = [pa.field("id", pa.int64())]
+        # institucion se repite mucho: se guarda con diccionario
+        campos += [pa.field(c, pa.dictionary(pa.int32(), pa.string()) if c == "institucion" else pa.string())
+                   for c in COLUMNAS[1:]]
+        self.esquema = pa.schema(campos)
+        self.escritor = pq.ParquetWriter(ruta, self.esquema, compression="zstd")
+
+    def escribir(self, lote):
+        columnas = list(zip(*lote))
+        tabla = self.pa.Table.from_arrays(
+            [self.pa.array(columna).cast(campo.type) for columna, campo in zip(columnas, self.esquema)],
+            schema=self.esquema,
+        )
+        self.escritor.write_table(tabla)
+
+    def cerrar(self):
+        self.escritor.close()
+
+
+ESCRITORES = {
+    "csv": _EscritorCSV,
+    "jsonl": _EscritorJSONL,
+    "parquet": _EscritorParquet,
+}
+
+
+def exportar(repo, ruta, formato="csv", tamanio_lote=TAMANIO_LOTE, progreso=None, cancelado=None):
+    """Exporta todos los inscriptos recorriendo el cursor de a lotes.
+
+    La memoria usada depende del tamaño de lote, no de la cantidad de
+    inscriptos. Se escribe con otro nombre y se renombra al terminar: si
+    se cancela o falla, el archivo parcial se borra y nunca queda uno
+    cortado con el nombre pedido.
+
+    Retorna un dict con 'exportados' y 'cancelado'.
+    """
+    if formato == "parquet" and not parquet_disponible():
+        raise RuntimeError("Para exportar a Parquet hay que instalar pyarrow (pip install pyarrow)")
+
+    total = repo.total()
+    lotes = repo.recorrer_todos(tamanio_lote)
+
+    temporal = ruta + ".tmp"
+    exportados = 0
+    cancelar = False
+    terminado = False
+    try:
+        escritor = ESCRITORES[formato](temporal)
+        try:
+            for lote in lotes:
+                escritor.escribir(lote)
+                exportados += len(lote)
+                if progreso:
+                    progreso(exportados, total)
+                if cancelado is not None and cancelado.is_set():
+                    cancelar = True
+                    break
+        finally:
+            escritor.cerrar()
+        if not cancelar:
+            os.replace(temporal, ruta)
+            terminado = True
+    finally:
+        lotes.close()
+        if not terminado and os.path.exists(temporal):
+            os.remove(temporal)
+    return {"exportados": exportados, "cancelado": cancelar}
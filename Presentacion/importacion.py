@@ -0,0 +1,147 @@
+import csv
+import unicodedata
+from datetime import date
+
+from registro import Inscripto
+from validaciones import validar_email, validar_numerico
+
+COLUMNAS = ["nombre", "apellido", "dni", "email", "telefono", "fecha_inscripcion", "institucion"]
+
+# Nombres alternativos que aparecen en los archivos de las instituciones
+ALIAS_COLUMNAS = {
+    "fecha": "fecha_inscripcion",
+    "mail": "email",
+    "correo": "email",
+    "tel": "telefono",
+}
+
+TAMANIO_LOTE = 5000
+
+
+def _normalizar_encabezado(nombre):
+    sin_tildes = unicodedata.normalize("NFKD", nombre or "").encode("ascii", "ignore").decode()
+    clave = sin_tildes.strip().lower().replace(" ", "_")
+    return ALIAS_COLUMNAS.get(clave, clave)
+
+
+def contar_lineas(ruta):
+    """Cuenta las líneas del archivo leyéndolo en bloques (para la barra de progreso)"""
+    total = 0
+    with open(ruta, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(1 << 20), b""):
+            total += bloque.count(b"\n")
+    return total
+
+
+def _filas_desde_csv(archivo, hoy):
+    """Recorre el CSV fila por fila y arma un Inscripto con cada una.
+
+    Acepta también archivos con el nombre completo en una sola columna
+    (sin "apellido"): se separa en nombre y apellido. El número que se
+    informa es el de la línea del archivo donde empieza el registro (un
+    campo entre comillas puede ocupar varias líneas).
+    """
+    muestra = archivo.read(4096)
+    archivo.seek(0)
+    try:
+        dialecto = csv.Sniffer().sniff(muestra, delimiters=",;\t")
+    except csv.Error:
+        dialecto = csv.excel
+
+    lector = csv.reader(archivo, dialecto)
+    encabezados = [_normalizar_encabezado(h) for h in next(lector, [])]
+    separar_nombre = "apellido" not in encabezados
+
+    while True:
+        numero_linea = lector.line_num + 1
+        valores = next(lector, None)
+        if valores is None:
+            return
+        if not any(valores):
+            continue
+        registro = dict(zip(encabezados, (v.strip() for v in valores)))
+        if separar_nombre:
+            partes = registro.get("nombre", "").rsplit(" ", 1)
+            registro["nombre"] = partes[0]
+            registro["apellido"] = partes[1] if len(partes) > 1 else ""
+        if not registro.get("fecha_inscripcion"):
+            registro["fecha_inscripcion"] = hoy
+        inscripto = Inscripto.nuevo(*(registro.get(columna, "") for columna in COLUMNAS))
+        yield numero_linea, inscripto
+
+
+def _validar_lote(lote):
+    """Aplica las mismas reglas que el formulario a todo un lote.
+
+    Retorna (validas, invalidas) donde invalidas es una lista de
+    (numero_linea, motivo).
+    """
+    validas = []
+    invalidas = []
+    for numero_linea, inscripto in lote:
+        if not all([inscripto.nombre, inscripto.apellido, inscripto.dni, inscripto.email]):
+            invalidas.append((numero_linea, "faltan campos obligatorios"))
+        elif not validar_email(inscripto.email):
+            invalidas.append((numero_linea, "email sin @"))
+        elif not validar_numerico(inscripto.dni):
+            invalidas.append((numero_linea, "DNI no numérico"))
+        elif not validar_numerico(inscripto.telefono):
+            invalidas.append((numero_linea, "teléfono no numérico"))
+        else:
+            validas.append((numero_linea, inscripto))
+    return validas, invalidas
+
+
+def importar_csv(repo, ruta, tamanio_lote=TAMANIO_LOTE, progreso=None, cancelado=None):
+    """Importa inscriptos desde un CSV en lotes, un lote por transacción.
+
+    Los DNI repetidos (en el archivo o ya cargados en la base) no cortan la
+    importación: se informan todos juntos al final.
+
+    progreso(lineas_leidas, lineas_totales) se llama después de cada lote y
+    cancelado (threading.Event) permite frenar entre lotes.
+
+    Retorna un dict con 'importados', 'duplicados' (lista de DNI),
+    'invalidos' (lista de (linea, motivo)) y 'cancelado'.
+    """
+    total = contar_lineas(ruta)
+    resultado = {"importados": 0, "duplicados": [], "invalidos": [], "cancelado": False}
+    vistos = set()
+    hoy = date.today().isoformat()
+
+    def procesar(lote):
+        validas, invalidas = _validar_lote(lote)
+        resultado["invalidos"].extend(invalidas)
+
+        ya_cargados = repo.dnis_existentes([inscripto.dni for _, inscripto in validas])
+        a_insertar = []
+        for _, inscripto in validas:
+            dni = inscripto.dni
+            if dni in vistos or dni in ya_cargados:
+                resultado["duplicados"].append(dni)
+                continue
+            vistos.add(dni)
+            a_insertar.append(inscripto.como_fila())
+
+        resultado["importados"] += repo.insertar_lote(a_insertar)
+
+    with open(ruta, newline="", encoding="utf-8-sig") as archivo:
+        lote = []
+        ultima_linea = 1
+        for registro in _filas_desde_csv(archivo, hoy):
+            lote.append(registro)
+            ultima_linea = registro[0]
+            if len(lote) >= tamanio_lote:
+                procesar(lote)
+                lote = []
+                if progreso:
+                    progreso(ultima_linea, total)
+                if cancelado is not None and cancelado.is_set():
+                    resultado["cancelado"] = True
+                    return resultado
+        if lote:
+            procesar(lote)
+        if progreso:
+            progreso(total, total)
+
+    return resultado
@@ -0,0 +1,264 @@
+"""Línea de comandos del sistema de inscripciones (sin interfaz gráfica).
+
+Ejemplos:
+    python inscripciones.py import inscriptos.csv
+    python inscripciones.py export salida.csv
+    python inscripciones.py search fernandez
+    python inscripciones.py report instituciones
+    python inscripciones.py bench
+    python inscripciones.py sync --central /red/central.db
+    python inscripciones.py documentos certificado certificados/
+    python inscripciones.py notificaciones
+    python inscripciones.py api --puerto 8080
+
+No importa ningún módulo de Qt, así que arranca rápido y sirve para cron.
+"""
+import argparse
+import random
+import socket
+import sqlite3
+import sys
+import time
+
+from repositorio import InscriptosRepository
+
+
+def comando_import(repo, args):
+    from importacion import importar_csv
+
+    def progreso(actual, total):
+        if not args.silencioso:
+            print(f"\r{actual}/{total} líneas", end="", file=sys.stderr)
+
+    resultado = importar_csv(repo, args.archivo, tamanio_lote=args.lote, progreso=progreso)
+    if not args.silencioso:
+        print(file=sys.stderr)
+    print(f"Importados: {resultado['importados']}")
+    print(f"DNI duplicados: {len(resultado['duplicados'])}")
+    for dni in resultado['duplicados']:
+        print(f"  duplicado {dni}")
+    print(f"Filas inválidas: {len(resultado['invalidos'])}")
+    for linea, motivo in resultado['invalidos']:
+        print(f"  línea {linea}: {motivo}")
+    return 0
+
+
+def comando_export(repo, args):
+    from exportacion import exportar, formato_desde_ruta
+
+    formato = args.formato or formato_desde_ruta(args.archivo)
+    resultado = exportar(repo, args.archivo, formato)
+    print(f"Exportados: {resultado['exportados']} ({formato})")
+    return 0
+
+
+def comando_search(repo, args):
+    import csv
+
+    escritor = csv.writer(sys.stdout)
+    escritor.writerow(["id", "nombre", "apellido", "dni", "email", "telefono", "institucion"])
+    cursor = repo.cursor_busqueda(args.texto, args.limite)
+    try:
+        for fila in cursor:
+            escritor.writerow(fila)
+    finally:
+        cursor.connection.close()
+    return 0
+
+
+def comando_report(repo, args):
+    if args.tipo == "total":
+        print(f"Total de inscriptos: {repo.total()}")
+    elif args.tipo == "instituciones":
+        for institucion, cantidad in repo.por_institucion():
+            print(f"{institucion or 'Sin institución'}: {cantidad}")
+    else:
+        for fecha, cantidad in repo.por_dia():
+            print(f"{fecha or 'Sin fecha'}: {cantidad}")
+    return 0
+
+
+def _percentil(tiempos, p):
+    ordenados = sorted(tiempos)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def _medir(nombre, funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    print(f"{nombre:<32} p50 {_percentil(tiempos, 50):8.2f} ms   p95 {_percentil(tiempos, 95):8.2f} ms")
+
+
+def comando_bench(repo, args):
+    """Mide las consultas de cada pantalla sobre la base actual"""
+    cache = repo.cache
+    if not args.cache:
+        # Con la caché, después de la primera repetición no se mide el SQL
+        repo.cache = None
+    conn = repo.conexion()
+    apellidos = [a for (a,) in conn.execute("SELECT apellido FROM inscriptos ORDER BY random() LIMIT 200")]
+    if not apellidos:
+        print("La base está vacía: no hay nada que medir")
+        return 1
+    print(f"Inscriptos: {repo.total()}")
+
+    aleatorio = random.Random(0)
+    _medir("búsqueda (prefijo apellido)", lambda: repo.buscar(aleatorio.choice(apellidos)[:4], 200),
+           args.repeticiones)
+    for criterio in ["nombre", "apellido", "fecha_inscripcion"]:
+        paginador = repo.paginador(100)
+        paginador.criterio = criterio
+        _medir(f"página 1 por {criterio}", paginador.primera, args.repeticiones)
+    _medir("reporte total", repo.total, args.repeticiones)
+    _medir("reporte por institución", repo.por_institucion, args.repeticiones)
+    _medir("reporte por día", repo.por_dia, args.repeticiones)
+    if args.cache and cache is not None:
+        datos = cache.estadisticas()
+        print(f"Caché: {datos['aciertos']} aciertos, {datos['fallos']} fallos ({datos['tasa_aciertos']:.0%})")
+    repo.cache = cache
+    return 0
+
+
+def comando_sync(repo, args):
+    """Una ronda de sincronización con el central (para correr desde cron)"""
+    from central import CentralSQLite
+    from sincronizacion import Replicador
+
+    seccion = repo.config["sincronizacion"]
+    central = CentralSQLite(args.central or seccion["central"])
+    puesto = args.puesto or seccion["puesto"] or socket.gethostname()
+    try:
+        replicador = Replicador(repo, central, puesto, max_lote=seccion.getint("max_lote"))
+        enviados, rechazados, recibidos = replicador.sincronizar()
+    finally:
+        central.cerrar()
+    print(f"Enviados: {enviados} ({rechazados} DNI ya registrados en otro puesto)")
+    print(f"Recibidos de otros puestos: {recibidos}")
+    print(f"Conflictos resueltos en este puesto: {replicador.conflictos}")
+    return 0
+
+
+def comando_documentos(repo, args):
+    """Credenciales o certificados en paralelo; si se corta, se retoma"""
+    from documentos import generar_documentos
+
+    def progreso(actual, total):
+        if not args.silencioso:
+            print(f"\r{actual}/{total} documentos", end="", file=sys.stderr)
+
+    resultado = generar_documentos(repo, args.tipo, args.carpeta, args.formato,
+                                   procesos=args.procesos, progreso=progreso)
+    if not args.silencioso:
+        print(file=sys.stderr)
+    print(f"Generados: {resultado['generados']}")
+    print(f"Ya estaban de una corrida anterior: {resultado['ya_estaban']}")
+    return 0
+
+
+def comando_notificaciones(repo, args):
+    """Envía los emails pendientes una vez (para correr desde cron)"""
+    import asyncio
+
+    from notificaciones import EnviadorDeNotificaciones
+
+    enviador = EnviadorDeNotificaciones.desde_configuracion(repo)
+    enviados, reintentos, fallidos = asyncio.run(enviador.drenar())
+    print(f"Enviados: {enviados}")
+    print(f"Para reintentar más tarde: {reintentos}")
+    print(f"Fallidos: {fallidos}")
+    for estado, cantidad in sorted(repo.estado_notificaciones().items()):
+        print(f"  {estado}: {cantidad}")
+    return 0
+
+
+def comando_api(repo, args):
+    """Atiende la API HTTP de preinscripción hasta Ctrl+C"""
+    import asyncio
+
+    from servidor_api import ServidorAPI
+
+    servidor = ServidorAPI.desde_configuracion(repo, args.host, args.puerto)
+    print(f"API escuchando en http://{servidor.host}:{servidor.puerto} (Ctrl+C para terminar)",
+          file=sys.stderr)
+    try:
+        asyncio.run(servidor.servir())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.detener()
+    return 0
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="inscripciones",
+                                     description="Sistema de inscripciones (modo consola)")
+    parser.add_argument("--db", help="archivo de base de datos (por defecto, el de configuracion.ini)")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("import", help="importar inscriptos desde un CSV")
+    p.add_argument("archivo")
+    p.add_argument("--lote", type=int, default=5000, help="filas por transacción")
+    p.add_argument("-q", "--silencioso", action="store_true", help="no mostrar el progreso")
+    p.set_defaults(funcion=comando_import)
+
+    p = sub.add_parser("export", help="exportar todos los inscriptos")
+    p.add_argument("archivo")
+    p.add_argument("--formato", choices=["csv", "jsonl", "parquet"],
+                   help="por defecto se deduce de la extensión")
+    p.set_defaults(funcion=comando_export)
+
+    p = sub.add_parser("search", help="buscar inscriptos (salida CSV)")
+    p.add_argument("texto")
+    p.add_argument("--limite", type=int, default=None)
+    p.set_defaults(funcion=comando_search)
+
+    p = sub.add_parser("report", help="mostrar un reporte")
+    p.add_argument("tipo", nargs="?", default="total", choices=["total", "instituciones", "dias"])
+    p.set_defaults(funcion=comando_report)
+
+    p = sub.add_parser("bench", help="medir las consultas sobre la base actual")
+    p.add_argument("--repeticiones", type=int, default=50)
+    p.add_argument("--cache", action="store_true", help="medir pasando por la caché de consultas")
+    p.set_defaults(funcion=comando_bench)
+
+    p = sub.add_parser("sync", help="sincronizar con el servidor central")
+    p.add_argument("--central", help="base central (por defecto, la de configuracion.ini)")
+    p.add_argument("--puesto", help="nombre de este puesto (por defecto, el de la máquina)")
+    p.set_defaults(funcion=comando_sync)
+
+    p = sub.add_parser("documentos", help="generar credenciales o certificados de asistencia")
+    p.add_argument("tipo", choices=["credencial", "certificado"])
+    p.add_argument("carpeta")
+    p.add_argument("--formato", choices=["pdf", "png"], default="pdf")
+    p.add_argument("--procesos", type=int, help="por defecto, el de configuracion.ini")
+    p.add_argument("-q", "--silencioso", action="store_true", help="no mostrar el progreso")
+    p.set_defaults(funcion=comando_documentos)
+
+    p = sub.add_parser("notificaciones", help="enviar los emails de confirmación pendientes")
+    p.set_defaults(funcion=comando_notificaciones)
+
+    p = sub.add_parser("api", help="atender la API HTTP de preinscripción")
+    p.add_argument("--host", help="por defecto, el de configuracion.ini")
+    p.add_argument("--puerto", type=int, help="por defecto, el de configuracion.ini")
+    p.set_defaults(funcion=comando_api)
+
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    repo = InscriptosRepository(args.db).inicializar()
+    try:
+        return args.funcion(repo, args)
+    except (OSError, sqlite3.Error, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        repo.cerrar()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""Mediciones opcionales de consultas SQL y de refrescos de pantalla.
+
+Se activa con [diagnostico] activo = si en configuracion.ini. Desactivada,
+las conexiones son sqlite3.Connection comunes y @medido solo agrega una
+comparación por llamada.
+"""
+import contextlib
+import functools
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+# Cuántas mediciones recientes se guardan por nombre (percentiles "móviles")
+VENTANA = 1000
+LARGO_MAXIMO_SQL = 120
+
+_metricas = None
+_SIN_MEDIR = contextlib.nullcontext()
+
+
+class Metricas:
+    """Últimos tiempos de cada operación, agrupados por nombre"""
+
+    def __init__(self, ventana=VENTANA):
+        self.ventana = ventana
+        self._tiempos = {}
+        self._filas = {}
+        self._cantidad = {}
+        self._candado = threading.Lock()
+
+    def registrar(self, nombre, ms, filas=None):
+        with self._candado:
+            if nombre not in self._tiempos:
+                self._tiempos[nombre] = deque(maxlen=self.ventana)
+                self._filas[nombre] = 0
+                self._cantidad[nombre] = 0
+            self._tiempos[nombre].append(ms)
+            self._cantidad[nombre] += 1
+            if filas is not None:
+                self._filas[nombre] += filas
+
+    def reiniciar(self):
+        with self._candado:
+            self._tiempos.clear()
+            self._filas.clear()
+            self._cantidad.clear()
+
+    def resumen(self):
+        """Lista de dicts con cantidad, filas y p50/p95/p99/máximo en ms,
+        de la operación que más tiempo acumula a la que menos"""
+        with self._candado:
+            copia = [(nombre, sorted(tiempos), self._cantidad[nombre], self._filas[nombre])
+                     for nombre, tiempos in self._tiempos.items()]
+        filas = []
+        for nombre, tiempos, cantidad, total_filas in copia:
+            filas.append({
+                "nombre": nombre,
+                "cantidad": cantidad,
+                "filas": total_filas,
+                "p50_ms": _percentil(tiempos, 50),
+                "p95_ms": _percentil(tiempos, 95),
+                "p99_ms": _percentil(tiempos, 99),
+                "max_ms": tiempos[-1],
+                "total_ms": sum(tiempos),
+            })
+        filas.sort(key=lambda fila: fila["total_ms"], reverse=True)
+        return filas
+
+    def volcar(self, ruta):
+        """Guarda el resumen en un archivo JSON"""
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"fecha": datetime.now().isoformat(timespec="seconds"),
+                       "mediciones": self.resumen()}, archivo, indent=2, ensure_ascii=False)
+
+
+def _percentil(ordenados, p):
+    return round(ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))], 3)
+
+
+def activar(ventana=VENTANA):
+    """Empieza a medir; retorna las Metricas compartidas"""
+    global _metricas
+    if _metricas is None:
+        _metricas = Metricas(ventana)
+    return _metricas
+
+
+def metricas():
+    """Metricas activas, o None si la instrumentación está apagada"""
+    return _metricas
+
+
+def medido(nombre):
+    """Decorador: mide cada llamada a la función bajo `nombre`"""
+    def decorador(funcion):
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if _metricas is None:
+                return funcion(*args, **kwargs)
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                _metricas.registrar(nombre, (time.perf_counter() - inicio) * 1000)
+        return envoltura
+    return decorador
+
+
+class _Medicion:
+    def __init__(self, nombre):
+        self.nombre = nombre
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excepcion):
+        _metricas.registrar(self.nombre, (time.perf_counter() - self.inicio) * 1000)
+        return False
+
+
+def medir(nombre):
+    """Context manager que mide un bloque (no hace nada si está apagada)"""
+    if _metricas is None:
+        return _SIN_MEDIR
+    return _Medicion(nombre)
+
+
+def _nombre_sentencia(sql):
+    texto = "SQL " + re.sub(r"\s+", " ", sql).strip()
+    return texto if len(texto) <= LARGO_MAXIMO_SQL else texto[:LARGO_MAXIMO_SQL - 1] + "…"
+
+
+class CursorMedido(sqlite3.Cursor):
+    """Cursor que suma el tiempo de execute y de cada fetch hasta agotarse.
+
+    Como las filas se leen de a poco, la medición se registra recién
+    cuando el cursor se agota, se cierra, se descarta o ejecuta otra
+    sentencia.
+    """
+
+    _sql = None
+
+    def _iniciar(self, sql):
+        self._terminar()
+        self._sql = sql
+        self._ms = 0.0
+        self._leidas = 0
+
+    def _terminar(self):
+        if self._sql is not None and _metricas is not None:
+            filas = self._leidas if self.description is not None else max(self.rowcount, 0)
+            _metricas.registrar(_nombre_sentencia(self._sql), self._ms, filas)
+        self._sql = None
+
+    def execute(self, sql, parametros=()):
+        self._iniciar(sql)
+        inicio = time.perf_counter()
+        super().execute(sql, parametros)
+        self._ms += (time.perf_counter() - inicio) * 1000
+        if self.description is None:
+            self._terminar()
+        return self
+
+    def executemany(self, sql, secuencia):
+        self._iniciar(sql)
+        inicio = time.perf_counter()
+        super().executemany(sql, secuencia)
+        self._ms += (time.perf_counter() - inicio) * 1000
+        self._terminar()
+        return self
+
+    def _leer(self, funcion, *args):
+        inicio = time.perf_counter()
+        resultado = funcion(*args)
+        if self._sql is not None:
+            self._ms += (time.perf_counter() - inicio) * 1000
+        return resultado
+
+    def fetchone(self):
+        fila = self._leer(super().fetchone)
+        if fila is None:
+            self._terminar()
+        elif self._sql is not None:
+            self._leidas += 1
+        return fila
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        filas = self._leer(super().fetchmany, size)
+        if self._sql is not None:
+            self._leidas += len(filas)
+        if len(filas) < size:
+            self._terminar()
+        return filas
+
+    def fetchall(self):
+        filas = self._leer(super().fetchall)
+        if self._sql is not None:
+            self._leidas += len(filas)
+        self._terminar()
+        return filas
+
+    def __next__(self):
+        try:
+            fila = self._leer(super().__next__)
+        except StopIteration:
+            self._terminar()
+            raise
+        if self._sql is not None:
+            self._leidas += 1
+        return fila
+
+    def close(self):
+        self._terminar()
+        super().close()
+
+    def __del__(self):
+        # Cursores que no se leen hasta el final (p. ej. execute().fetchone())
+        try:
+            self._terminar()
+        except Exception:
+            pass
+
+
+class ConexionMedida(sqlite3.Connection):
+    """Conexión cuyos cursores miden cada sentencia (factory de sqlite3.connect)"""
+
+    def cursor(self, factory=CursorMedido):
+        return super().cursor(factory)
+
+    def execute(self, sql, parametros=()):
+        return self.cursor().execute(sql, parametros)
+
+    def executemany(self, sql, secuencia):
+        return self.cursor().executemany(sql, secuencia)
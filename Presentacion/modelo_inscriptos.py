@@ -0,0 +1,139 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from registro import Inscripto, CAMPOS_LISTADO
+
+
+class InscriptosTableModel(QAbstractTableModel):
+    """Modelo de tabla perezoso: solo materializa las filas que la vista pide.
+
+    Cada fila se guarda como un Inscripto (ver registro.py), no como tupla
+    ni como un QTableWidgetItem por celda.
+    """
+
+    ENCABEZADOS = ["ID", "Nombre", "Apellido", "DNI", "Email", "Teléfono", "Institución"]
+    TAMANIO_LOTE = 256
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cursor = None
+        self._filas = []
+        self._agotado = True
+
+    def cargar_cursor(self, cursor):
+        """Reemplaza el contenido del modelo por el resultado de una consulta.
+
+        No se hace fetchall(): el cursor queda abierto y las filas se van
+        leyendo de a lotes a medida que la vista se desplaza. El cursor
+        tiene que tener su propia conexión (como los de cursor_listado y
+        cursor_busqueda): al terminar, el modelo la cierra.
+        """
+        self.beginResetModel()
+        self._cerrar_cursor()
+        self._filas = []
+        self._cursor = cursor
+        self._agotado = False
+        self.endResetModel()
+
+        # Primer lote para que la vista tenga algo que mostrar enseguida
+        self.fetchMore(QModelIndex())
+
+    def cargar_filas(self, filas):
+        """Reemplaza el contenido por filas ya leídas (p. ej. desde otro hilo)"""
+        self.beginResetModel()
+        self._cerrar_cursor()
+        self._filas = [Inscripto.desde_listado(fila) for fila in filas]
+        self.endResetModel()
+
+    def limpiar(self):
+        """Deja el modelo vacío"""
+        self.beginResetModel()
+        self._cerrar_cursor()
+        self._filas = []
+        self.endResetModel()
+
+    def agregar_fila(self, inscripto, posicion=None):
+        """Agrega un inscripto sin recargar el resto (p. ej. uno recién registrado)"""
+        if posicion is None:
+            posicion = len(self._filas)
+        self.beginInsertRows(QModelIndex(), posicion, posicion)
+        self._filas.insert(posicion, inscripto)
+        self.endInsertRows()
+
+    def quitar_ultima_fila(self):
+        """Saca la última fila (la que pasó a la página siguiente)"""
+        if self._filas:
+            ultima = len(self._filas) - 1
+            self.beginRemoveRows(QModelIndex(), ultima, ultima)
+            del self._filas[ultima]
+            self.endRemoveRows()
+
+    def _posicion(self, inscripto):
+        for posicion, fila in enumerate(self._filas):
+            if fila is inscripto:
+                return posicion
+        return None
+
+    def fila_actualizada(self, inscripto):
+        """Avisa a la vista que cambiaron los datos de un inscripto (si sigue en el modelo)"""
+        posicion = self._posicion(inscripto)
+        if posicion is not None:
+            self.dataChanged.emit(self.index(posicion, 0),
+                                  self.index(posicion, len(self.ENCABEZADOS) - 1))
+
+    def quitar_fila(self, inscripto):
+        """Saca un inscripto del modelo (si sigue ahí)"""
+        posicion = self._posicion(inscripto)
+        if posicion is not None:
+            self.beginRemoveRows(QModelIndex(), posicion, posicion)
+            del self._filas[posicion]
+            self.endRemoveRows()
+
+    def _cerrar_cursor(self):
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor.connection.close()
+            self._cursor = None
+        self._agotado = True
+
+    # --- Interfaz de QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._filas)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.ENCABEZADOS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        valor = getattr(self._filas[index.row()], CAMPOS_LISTADO[index.column()])
+        return "" if valor is None else str(valor)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.ENCABEZADOS[section]
+        return str(section + 1)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return not self._agotado
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._agotado:
+            return
+        lote = self._cursor.fetchmany(self.TAMANIO_LOTE)
+        if len(lote) < self.TAMANIO_LOTE:
+            self._cerrar_cursor()
+        if not lote:
+            return
+        inicio = len(self._filas)
+        self.beginInsertRows(QModelIndex(), inicio, inicio + len(lote) - 1)
+        self._filas.extend(map(Inscripto.desde_listado, lote))
+        self.endInsertRows()
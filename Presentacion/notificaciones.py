@@ -0,0 +1,343 @@
+"""Envío de los emails de confirmación de inscripción.
+
+El alta no manda nada: un trigger deja el aviso en la tabla
+notificaciones (la bandeja de salida) en la misma transacción. Este
+módulo la vacía en segundo plano con asyncio:
+
+- `concurrencia` conexiones SMTP, cada una reutilizada para muchos emails.
+- Un límite de emails por segundo compartido entre todas.
+- Los errores temporales (4xx, conexión caída) se reintentan cada vez más
+  espaciados; los permanentes (5xx), un mensaje que no se puede armar (p.
+  ej. una dirección mal formada) o demasiados intentos dejan el aviso
+  como 'fallido'.
+- Cada aviso se envía una sola vez por inscripto (UNIQUE en la tabla) y
+  con un Message-ID fijo, así un reenvío después de un corte se puede
+  reconocer como repetido.
+- Un aviso tomado queda 'enviando' con la hora del reclamo. Si el
+  enviador se corta, vuelve a la bandeja cuando vence el reclamo
+  (RECLAMO_VENCE_S); mientras tanto otro proceso no lo manda de nuevo.
+
+No usa bibliotecas externas: el cliente SMTP de abajo alcanza para un
+servidor común. Para probar sin mandar emails reales está smtp_de_prueba.py.
+"""
+import asyncio
+import base64
+import random
+import sqlite3
+import ssl
+import sys
+import threading
+import traceback
+from email.message import EmailMessage
+from email.policy import SMTP
+
+ESPERA_BASE_S = 30
+ESPERA_MAXIMA_S = 3600
+TIMEOUT_S = 30
+# Más de lo que puede tardar un lote, aun con el servidor lento
+RECLAMO_VENCE_S = 3600
+
+
+class ErrorSMTP(Exception):
+    def __init__(self, codigo, texto):
+        super().__init__(f"{codigo} {texto}")
+        self.codigo = codigo
+
+    @property
+    def permanente(self):
+        return 500 <= self.codigo < 600
+
+
+class ClienteSMTP:
+    """Una conexión SMTP que se reutiliza para varios mensajes"""
+
+    def __init__(self, servidor, puerto, seguridad="ninguna", usuario="", clave="", timeout=TIMEOUT_S):
+        self.servidor = servidor
+        self.puerto = puerto
+        self.seguridad = seguridad
+        self.usuario = usuario
+        self.clave = clave
+        self.timeout = timeout
+        self._lector = None
+        self._escritor = None
+
+    @property
+    def conectado(self):
+        return self._escritor is not None and not self._escritor.is_closing()
+
+    async def conectar(self):
+        contexto = ssl.create_default_context() if self.seguridad in ("ssl", "starttls") else None
+        self._lector, self._escritor = await asyncio.wait_for(
+            asyncio.open_connection(self.servidor, self.puerto,
+                                    ssl=contexto if self.seguridad == "ssl" else None),
+            self.timeout)
+        await self._esperar(220)
+        await self._comando("EHLO inscripciones", 250)
+        if self.seguridad == "starttls":
+            await self._comando("STARTTLS", 220)
+            await self._escritor.start_tls(contexto, server_hostname=self.servidor)
+            await self._comando("EHLO inscripciones", 250)
+        if self.usuario:
+            credencial = base64.b64encode(f"\0{self.usuario}\0{self.clave}".encode()).decode()
+            await self._comando(f"AUTH PLAIN {credencial}", 235)
+
+    async def enviar(self, mensaje):
+        """Envía un EmailMessage; si el servidor lo rechaza, la conexión sigue lista para el próximo"""
+        datos = mensaje.as_bytes(policy=SMTP)
+        # Una línea que empieza con "." se duplica para no cortar el DATA
+        datos = datos.replace(b"\r\n.", b"\r\n..")
+        if datos.startswith(b"."):
+            datos = b"." + datos
+        try:
+            await self._comando(f"MAIL FROM:<{mensaje['From']}>", 250)
+            await self._comando(f"RCPT TO:<{mensaje['To']}>", 250, 251)
+            await self._comando("DATA", 354)
+            self._escritor.write(datos + (b"" if datos.endswith(b"\r\n") else b"\r\n") + b".\r\n")
+            await self._esperar(250)
+        except ErrorSMTP:
+            try:
+                await self._comando("RSET", 250)
+            except ErrorSMTP:
+                self.abortar()
+            raise
+
+    async def cerrar(self):
+        if not self.conectado:
+            return
+        try:
+            await self._comando("QUIT", 221)
+        except (ErrorSMTP, OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            pass
+        self._escritor.close()
+        self._escritor = None
+
+    def abortar(self):
+        """Cierra sin despedirse (después de un error de conexión)"""
+        if self._escritor is not None:
+            self._escritor.close()
+            self._escritor = None
+
+    async def _comando(self, linea, *esperados):
+        self._escritor.write(linea.encode() + b"\r\n")
+        return await self._esperar(*esperados)
+
+    async def _esperar(self, *esperados):
+        await self._escritor.drain()
+        lineas = []
+        while True:
+            linea = await asyncio.wait_for(self._lector.readuntil(b"\r\n"), self.timeout)
+            lineas.append(linea[4:].decode(errors="replace").strip())
+            if linea[3:4] != b"-":
+                break
+        codigo = int(linea[:3])
+        if codigo not in esperados:
+            raise ErrorSMTP(codigo, " ".join(lineas))
+        return codigo
+
+
+class LimiteDeEnvio:
+    """Espacia los envíos para no pasar de `por_segundo` (0 = sin límite)"""
+
+    def __init__(self, por_segundo):
+        self.intervalo = 1 / por_segundo if por_segundo else 0
+        self._proximo = 0.0
+
+    async def esperar(self):
+        if not self.intervalo:
+            return
+        ahora = asyncio.get_running_loop().time()
+        espera = self._proximo - ahora
+        self._proximo = max(ahora, self._proximo) + self.intervalo
+        if espera > 0:
+            await asyncio.sleep(espera)
+
+
+def espera_reintento(intentos):
+    """Segundos hasta el próximo intento: 30 s, 1 min, 2 min, ... hasta 1 h, con algo de azar"""
+    espera = min(ESPERA_BASE_S * 2 ** intentos, ESPERA_MAXIMA_S)
+    return round(espera * random.uniform(0.9, 1.1), 1)
+
+
+def armar_mensaje(remitente, evento, fila):
+    id_notificacion, id_inscripto, email, _, nombre, apellido, dni = fila
+    mensaje = EmailMessage()
+    mensaje["From"] = remitente
+    mensaje["To"] = email
+    mensaje["Subject"] = f"Confirmación de inscripción - {evento}"
+    dominio = remitente.rpartition("@")[2] or "localhost"
+    mensaje["Message-ID"] = f"<confirmacion-{id_inscripto}-{dni}@{dominio}>"
+    mensaje.set_content(
+        f"Hola {nombre} {apellido}:\n\n"
+        f"Tu inscripción a {evento} quedó registrada con el DNI {dni}.\n"
+        f"Presentá el DNI en la acreditación.\n\n"
+        f"Este es un mensaje automático, no hace falta responderlo.\n"
+    )
+    return mensaje
+
+
+class EnviadorDeNotificaciones:
+    """Vacía la bandeja de salida con varias conexiones SMTP a la vez"""
+
+    def __init__(self, repo, servidor, puerto, seguridad="ninguna", usuario="", clave="",
+                 remitente="inscripciones@localhost", evento="el evento",
+                 concurrencia=4, por_segundo=10, max_intentos=6):
+        self.repo = repo
+        self.datos_conexion = (servidor, puerto, seguridad, usuario, clave)
+        self.remitente = remitente
+        self.evento = evento
+        self.concurrencia = concurrencia
+        self.por_segundo = por_segundo
+        self.max_intentos = max_intentos
+        self.detenido = threading.Event()
+
+    @classmethod
+    def desde_configuracion(cls, repo):
+        seccion = repo.config["notificaciones"]
+        return cls(repo, seccion["servidor"], seccion.getint("puerto"), seccion["seguridad"],
+                   seccion["usuario"], seccion["clave"], seccion["remitente"],
+                   repo.config["documentos"]["evento"],
+                   concurrencia=seccion.getint("concurrencia"),
+                   por_segundo=seccion.getfloat("por_segundo"),
+                   max_intentos=seccion.getint("max_intentos"))
+
+    async def drenar(self):
+        """Envía todo lo pendiente que ya está en turno. Retorna (enviados, reintentos, fallidos)."""
+        limite = LimiteDeEnvio(self.por_segundo)
+        clientes = [ClienteSMTP(*self.datos_conexion) for _ in range(self.concurrencia)]
+        enviados = reintentos = fallidos = 0
+        # Lo que dejó a mitad un enviador que se cortó (este u otro proceso)
+        self.repo.devolver_reclamos_vencidos(RECLAMO_VENCE_S)
+        try:
+            while not self.detenido.is_set():
+                lote = self.repo.reclamar_notificaciones(self.concurrencia * 20)
+                if not lote:
+                    break
+                cola = asyncio.Queue()
+                for fila in lote:
+                    cola.put_nowait(fila)
+                ok, errores, devueltos = [], [], []
+                await asyncio.gather(*(self._trabajar(cliente, cola, limite, ok, errores, devueltos)
+                                       for cliente in clientes))
+                # Lo que quedó en la cola (todas las conexiones fallaron) vuelve sin contar intento
+                while not cola.empty():
+                    devueltos.append((cola.get_nowait()[0], "sin conexión"))
+                # Un commit por lote, no por email
+                self.repo.confirmar_notificaciones(ok)
+                self.repo.reprogramar_notificaciones(errores)
+                self.repo.devolver_notificaciones([id_notificacion for id_notificacion, _ in devueltos])
+                enviados += len(ok)
+                reintentos += sum(1 for _, espera, _ in errores if espera is not None)
+                fallidos += sum(1 for _, espera, _ in errores if espera is None)
+                if devueltos and not ok and not self.detenido.is_set():
+                    # Sin servidor no tiene sentido seguir: se reintenta en la próxima ronda
+                    raise ConnectionError(f"No se pudo conectar al servidor SMTP: {devueltos[0][1]}")
+        finally:
+            await asyncio.gather(*(cliente.cerrar() for cliente in clientes))
+        return enviados, reintentos, fallidos
+
+    async def _trabajar(self, cliente, cola, limite, ok, errores, devueltos):
+        while not cola.empty():
+            fila = cola.get_nowait()
+            id_notificacion, intentos = fila[0], fila[3]
+            if self.detenido.is_set():
+                devueltos.append((id_notificacion, "envío interrumpido"))
+                continue
+            try:
+                mensaje = armar_mensaje(self.remitente, self.evento, fila)
+            except Exception as e:
+                # Los datos del aviso no sirven (p. ej. "a@"): reintentar no lo arregla
+                errores.append((id_notificacion, None, f"Mensaje inválido: {e or type(e).__name__}"))
+                continue
+            if not cliente.conectado:
+                try:
+                    await cliente.conectar()
+                except (ErrorSMTP, OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                    # No es culpa del mensaje: vuelve a la bandeja sin contar el intento
+                    cliente.abortar()
+                    devueltos.append((id_notificacion, str(e) or type(e).__name__))
+                    return
+            try:
+                await limite.esperar()
+                await cliente.enviar(mensaje)
+            except ErrorSMTP as e:
+                if e.codigo == 421:
+                    # El servidor cierra la conexión
+                    cliente.abortar()
+                definitivo = e.permanente or intentos + 1 >= self.max_intentos
+                errores.append((id_notificacion, None if definitivo else espera_reintento(intentos), str(e)))
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                # Conexión caída a mitad del envío: la próxima vez se abre otra
+                cliente.abortar()
+                definitivo = intentos + 1 >= self.max_intentos
+                errores.append((id_notificacion, None if definitivo else espera_reintento(intentos),
+                                f"Conexión: {e or type(e).__name__}"))
+            else:
+                ok.append(id_notificacion)
+
+
+class Notificador:
+    """Hilo que vacía la bandeja de salida cada `intervalo` segundos o cuando se lo avisa"""
+
+    def __init__(self, enviador, intervalo=5.0):
+        self.enviador = enviador
+        self.intervalo = intervalo
+        self.enviados = 0
+        self.ultimo_error = None
+        self._despertar = threading.Event()
+        self._hilo = None
+
+    @classmethod
+    def desde_configuracion(cls, repo):
+        """Notificador según [notificaciones] de configuracion.ini, o None si está apagado"""
+        seccion = repo.config["notificaciones"]
+        if not seccion.getboolean("activa"):
+            return None
+        return cls(EnviadorDeNotificaciones.desde_configuracion(repo), seccion.getfloat("intervalo_s"))
+
+    def iniciar(self):
+        self._hilo = threading.Thread(target=self._trabajar, daemon=True)
+        self._hilo.start()
+
+    def detener(self, espera_s=TIMEOUT_S):
+        """Termina el lote en curso (sin empezar emails nuevos) y el hilo.
+
+        Espera como mucho `espera_s`: un servidor SMTP que no responde no
+        traba el cierre. Lo que quede 'enviando' vuelve cuando vence el reclamo.
+        """
+        if self._hilo is None:
+            return
+        self.enviador.detenido.set()
+        self._despertar.set()
+        self._hilo.join(espera_s)
+        if self._hilo.is_alive():
+            print("Notificaciones: el envío en curso no terminó a tiempo", file=sys.stderr)
+        self._hilo = None
+
+    def enviar_pronto(self):
+        """Adelanta la próxima ronda (p. ej. después de un registro)"""
+        self._despertar.set()
+
+    def _trabajar(self):
+        espera = self.intervalo
+        try:
+            while not self.enviador.detenido.is_set():
+                try:
+                    enviados, _, _ = asyncio.run(self.enviador.drenar())
+                    self.enviados += enviados
+                    self.ultimo_error = None
+                    espera = self.intervalo
+                except (OSError, sqlite3.Error) as e:
+                    # La bandeja queda como estaba y se reintenta cada vez más espaciado
+                    self.ultimo_error = str(e)
+                    espera = min(espera * 2, ESPERA_MAXIMA_S)
+                    print(f"Notificaciones: {e}", file=sys.stderr)
+                except Exception as e:
+                    # Un error de programación no debe dejar de vaciar la bandeja
+                    self.ultimo_error = str(e) or type(e).__name__
+                    espera = min(espera * 2, ESPERA_MAXIMA_S)
+                    print("Notificaciones: error inesperado", file=sys.stderr)
+                    traceback.print_exc()
+                self._despertar.wait(espera)
+                self._despertar.clear()
+        finally:
+            self.enviador.repo.liberar()
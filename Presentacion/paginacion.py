@@ -0,0 +1,206 @@
+from bisect import bisect_right
+
+from busqueda import COLUMNAS_LISTADO
+from conexion import clave_sin_tildes
+from consultas import ORDEN_LISTADO
+
+TAMANIOS_PAGINA = [50, 100, 200, 500]
+
+# Id provisorio de un registro que todavía no se guardó: va a recibir un id
+# mayor que todos los existentes, así que queda último entre sus empatados
+ID_PENDIENTE = 2 ** 63 - 1
+
+
+class PaginadorKeyset:
+    """Paginación por clave (keyset / seek) sobre el criterio de orden activo.
+
+    En lugar de OFFSET, cada página arranca donde terminó la anterior:
+    clave >= última clave, desempatando por id. Con el índice del criterio
+    ir a la página 1000 cuesta lo mismo que ir a la primera.
+    """
+
+    def __init__(self, conn, tamanio=TAMANIOS_PAGINA[1], cache=None):
+        self.conn = conn
+        self.tamanio = tamanio
+        # Con caché, volver a una página u orden ya visto no consulta la base
+        self.cache = cache
+        self.criterio = None
+        self.hay_anterior = False
+        self.hay_siguiente = False
+        self._primera_clave = None
+        self._ultima_clave = None
+        # Claves (valor de orden, id) de las filas visibles
+        self._claves = []
+        # Columnas que pueden ser NULL: solo para ellas hace falta el tramo aparte
+        self._admiten_null = {
+            nombre for _, nombre, _, no_nulo, _, _ in conn.execute("PRAGMA table_info(inscriptos)")
+            if not no_nulo
+        }
+
+    # --- Armado de SQL ---
+
+    def _columna(self):
+        """Columna de orden (la del índice): para nombre y apellido, su clave sin tildes"""
+        return ORDEN_LISTADO[self.criterio] if self.criterio else "id"
+
+    def _consultar(self, tramos, descendente=False):
+        """Lee una página recorriendo los tramos (condicion, parametros) en orden.
+
+        Hay más de un tramo solo cuando la clave puede ser NULL: los NULL
+        se leen aparte para que cada tramo sea un rango simple del índice.
+        """
+        direccion = "DESC" if descendente else "ASC"
+        orden = f"{self._columna()} {direccion}"
+        if self.criterio:
+            orden += f", id {direccion}"
+        # Se pide una fila de más para saber si hay otra página
+        faltan = self.tamanio + 1
+        filas = []
+        for condicion, parametros in tramos:
+            sql = f'''
+                SELECT {COLUMNAS_LISTADO}, {self._columna()}
+                FROM inscriptos
+                {"WHERE " + condicion if condicion else ""}
+                ORDER BY {orden}
+                LIMIT ?
+            '''
+            filas += self._leer(sql, parametros + (faltan,))
+            faltan = self.tamanio + 1 - len(filas)
+            if faltan <= 0:
+                break
+        hay_mas = len(filas) > self.tamanio
+        return filas[:self.tamanio], hay_mas
+
+    def _leer(self, sql, parametros):
+        if self.cache is None:
+            return self.conn.execute(sql, parametros).fetchall()
+        return self.cache.consultar(self.conn, sql, parametros)
+
+    def _tramos_despues(self, clave, incluir=False):
+        valor, id_fila = clave
+        comparador = ">=" if incluir else ">"
+        if not self.criterio:
+            return [(f"id {comparador} ?", (id_fila,))]
+        columna = self._columna()
+        if valor is None:
+            # En orden ascendente los NULL van primero
+            return [(f"{columna} IS NULL AND id {comparador} ?", (id_fila,)),
+                    (f"{columna} IS NOT NULL", ())]
+        # "clave >= ?" es el rango que usa el índice; el resto desempata por id
+        return [(f"{columna} >= ? AND ({columna} > ? OR id {comparador} ?)",
+                 (valor, valor, id_fila))]
+
+    def _tramos_antes(self, clave):
+        valor, id_fila = clave
+        if not self.criterio:
+            return [("id < ?", (id_fila,))]
+        columna = self._columna()
+        if valor is None:
+            return [(f"{columna} IS NULL AND id < ?", (id_fila,))]
+        tramos = [(f"{columna} <= ? AND ({columna} < ? OR id < ?)", (valor, valor, id_fila))]
+        if columna in self._admiten_null:
+            tramos.append((f"{columna} IS NULL", ()))
+        return tramos
+
+    # --- Navegación ---
+
+    def _mostrar(self, filas, hay_anterior, hay_siguiente):
+        self.hay_anterior = hay_anterior
+        self.hay_siguiente = hay_siguiente
+        self._claves = [(fila[-1], fila[0]) for fila in filas]
+        if filas:
+            self._primera_clave = (filas[0][-1], filas[0][0])
+            self._ultima_clave = (filas[-1][-1], filas[-1][0])
+        # La última columna es la clave de orden; no se muestra
+        return [fila[:-1] for fila in filas]
+
+    def _clave_de(self, inscripto):
+        """La misma clave de orden que calcula SQLite, pero en Python"""
+        if not self.criterio:
+            return ID_PENDIENTE
+        if self.criterio == "fecha_inscripcion":
+            return inscripto.fecha_inscripcion or ""
+        return clave_sin_tildes(getattr(inscripto, self.criterio) or "")
+
+    def ubicar_nuevo(self, inscripto):
+        """Lugar de un inscripto recién registrado (sin id) en la página visible.
+
+        Retorna (posicion, desborda) o None si el inscripto cae en otra
+        página. `desborda` indica que la página estaba llena y su última
+        fila pasa a la página siguiente. Si cae justo después de una
+        página llena, solo se habilita la página siguiente.
+        """
+        valor = self._clave_de(inscripto)
+        posicion = bisect_right([clave for clave, _ in self._claves], valor)
+        if posicion == 0 and self.hay_anterior:
+            return None
+        if posicion == len(self._claves) and (self.hay_siguiente or posicion >= self.tamanio):
+            self.hay_siguiente = True
+            return None
+        self._claves.insert(posicion, (valor, ID_PENDIENTE))
+        desborda = len(self._claves) > self.tamanio
+        if desborda:
+            del self._claves[-1]
+            self.hay_siguiente = True
+        if posicion == 0:
+            # Es la primera fila del listado: recargar vuelve a empezar de arriba
+            self._primera_clave = None
+        self._ultima_clave = self._claves[-1]
+        return posicion, desborda
+
+    def ordenar(self, criterio):
+        """Cambia el criterio de orden y vuelve a la primera página"""
+        self.criterio = criterio
+        self._primera_clave = None
+        self._ultima_clave = None
+        return self.primera()
+
+    def cambiar_tamanio(self, tamanio):
+        self.tamanio = tamanio
+        return self.recargar()
+
+    def primera(self):
+        filas, hay_mas = self._consultar([("", ())])
+        return self._mostrar(filas, False, hay_mas)
+
+    def siguiente(self):
+        if self._ultima_clave is None:
+            return self.primera()
+        filas, hay_mas = self._consultar(self._tramos_despues(self._ultima_clave))
+        if not filas:
+            return self.recargar()
+        return self._mostrar(filas, True, hay_mas)
+
+    def anterior(self):
+        if self._primera_clave is None:
+            return self.primera()
+        filas, hay_mas = self._consultar(self._tramos_antes(self._primera_clave), descendente=True)
+        if not filas:
+            return self.primera()
+        filas.reverse()
+        return self._mostrar(filas, hay_mas, True)
+
+    def recargar(self):
+        """Vuelve a leer la página actual (p. ej. después de registrar a alguien)"""
+        if self._primera_clave is None:
+            return self.primera()
+        filas, hay_mas = self._consultar(self._tramos_despues(self._primera_clave, incluir=True))
+        hay_anterior = self.hay_anterior
+        return self._mostrar(filas, hay_anterior, hay_mas)
+
+    def saltar_a(self, letra):
+        """Va a la primera página cuyo valor de orden empieza en letra o después"""
+        if not self.criterio or self.criterio == "fecha_inscripcion":
+            return self.primera()
+        filas, hay_mas = self._consultar([(f"{self._columna()} >= ?", (clave_sin_tildes(letra),))])
+        if not filas:
+            return self.ultima()
+        antes, _ = self._consultar(self._tramos_antes((filas[0][-1], filas[0][0])),
+                                   descendente=True)
+        return self._mostrar(filas, bool(antes), hay_mas)
+
+    def ultima(self):
+        """Última página del listado"""
+        filas, hay_mas = self._consultar([("", ())], descendente=True)
+        filas.reverse()
+        return self._mostrar(filas, hay_mas, False)
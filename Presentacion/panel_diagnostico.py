@@ -0,0 +1,101 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QLabel,
+    QFileDialog, QHeaderView
+)
+
+import instrumentacion
+
+COLUMNAS = [("Operación", "nombre"), ("Cantidad", "cantidad"), ("Filas", "filas"),
+            ("p50 ms", "p50_ms"), ("p95 ms", "p95_ms"), ("p99 ms", "p99_ms"), ("Máx ms", "max_ms")]
+
+
+class PanelDiagnostico(QDialog):
+    """Percentiles de consultas SQL, refrescos de tablas y registro.
+
+    No figura en los menús: se abre con Ctrl+Shift+D. Se actualiza cada
+    segundo mientras está visible. Si se le pasa la caché de consultas,
+    muestra también sus aciertos y fallos.
+    """
+
+    def __init__(self, parent=None, cache=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.setWindowTitle("Diagnóstico de rendimiento")
+        self.resize(1000, 500)
+        layout = QVBoxLayout(self)
+
+        self.estado = QLabel()
+        layout.addWidget(self.estado)
+        self.estado_cache = QLabel()
+        layout.addWidget(self.estado_cache)
+
+        self.tabla = QTableWidget(0, len(COLUMNAS))
+        self.tabla.setHorizontalHeaderLabels([titulo for titulo, _ in COLUMNAS])
+        self.tabla.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.tabla.verticalHeader().setVisible(False)
+        self.tabla.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.tabla)
+
+        botones = QHBoxLayout()
+        reiniciar_btn = QPushButton("Reiniciar")
+        reiniciar_btn.clicked.connect(self.reiniciar)
+        guardar_btn = QPushButton("Guardar JSON...")
+        guardar_btn.clicked.connect(self.guardar)
+        botones.addStretch()
+        botones.addWidget(reiniciar_btn)
+        botones.addWidget(guardar_btn)
+        layout.addLayout(botones)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.actualizar)
+
+    def showEvent(self, event):
+        self.actualizar()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def actualizar(self):
+        self.actualizar_cache()
+        metricas = instrumentacion.metricas()
+        if metricas is None:
+            self.estado.setText("La medición está apagada. Para activarla: [diagnostico] activo = si "
+                                "en configuracion.ini y reiniciar la aplicación.")
+            self.tabla.setRowCount(0)
+            return
+        resumen = metricas.resumen()
+        self.estado.setText(f"Últimas {metricas.ventana} mediciones de cada operación")
+        self.tabla.setRowCount(len(resumen))
+        for fila, medicion in enumerate(resumen):
+            for columna, (_, clave) in enumerate(COLUMNAS):
+                valor = medicion[clave]
+                texto = f"{valor:.2f}" if isinstance(valor, float) else str(valor)
+                self.tabla.setItem(fila, columna, QTableWidgetItem(texto))
+
+    def actualizar_cache(self):
+        if self.cache is None:
+            self.estado_cache.setText("Caché de consultas apagada ([cache_consultas] en configuracion.ini)")
+            return
+        datos = self.cache.estadisticas()
+        self.estado_cache.setText(
+            f"Caché de consultas: {datos['aciertos']} aciertos, {datos['fallos']} fallos "
+            f"({datos['tasa_aciertos']:.0%}), {datos['invalidaciones']} invalidaciones, "
+            f"{datos['entradas']} resultados guardados")
+
+    def reiniciar(self):
+        if instrumentacion.metricas() is not None:
+            instrumentacion.metricas().reiniciar()
+        self.actualizar()
+
+    def guardar(self):
+        if instrumentacion.metricas() is None:
+            return
+        ruta, _ = QFileDialog.getSaveFileName(self, "Guardar mediciones", "diagnostico.json",
+                                              "JSON (*.json)")
+        if ruta:
+            instrumentacion.metricas().volcar(ruta)
@@ -0,0 +1,56 @@
+import sys
+from dataclasses import dataclass
+
+# Orden de las columnas de COLUMNAS_LISTADO (lo que muestran las tablas)
+CAMPOS_LISTADO = ("id", "nombre", "apellido", "dni", "email", "telefono", "institucion")
+
+
+def _compartido(texto):
+    """Una sola copia en memoria de cada valor repetido (institución, nombre...)"""
+    return sys.intern(texto) if texto else texto
+
+
+@dataclass(slots=True)
+class Inscripto:
+    """Un inscripto en memoria.
+
+    Con __slots__ no hay un dict por objeto, y los textos que se repiten
+    mucho (nombres, apellidos, instituciones, fechas) se guardan una sola
+    vez. Lo usan la importación, el control de asistencia y los modelos de
+    tabla; ver benchmark_memoria.py para el consumo por registro.
+    """
+
+    id: int | None
+    nombre: str
+    apellido: str
+    dni: str
+    email: str = ""
+    telefono: str | None = None
+    fecha_inscripcion: str | None = None
+    institucion: str | None = None
+    asistencia: bool = False
+
+    @classmethod
+    def nuevo(cls, nombre, apellido, dni, email, telefono, fecha_inscripcion, institucion):
+        """Inscripto todavía sin id (p. ej. una fila de un CSV)"""
+        return cls(None, _compartido(nombre), _compartido(apellido), dni, email, telefono,
+                   _compartido(fecha_inscripcion), _compartido(institucion))
+
+    @classmethod
+    def desde_listado(cls, fila):
+        """Desde una fila con las columnas de COLUMNAS_LISTADO"""
+        id_inscripto, nombre, apellido, dni, email, telefono, institucion = fila
+        return cls(id_inscripto, _compartido(nombre), _compartido(apellido), dni, email, telefono,
+                   None, _compartido(institucion))
+
+    @classmethod
+    def desde_asistencia(cls, fila):
+        """Desde una fila de InscriptosRepository.cursor_asistencia()"""
+        id_inscripto, dni, nombre, apellido, institucion, asistencia = fila
+        return cls(id_inscripto, _compartido(nombre), _compartido(apellido), dni, "", None,
+                   None, _compartido(institucion), bool(asistencia))
+
+    def como_fila(self):
+        """Valores en el orden de SQL_INSERTAR"""
+        return (self.nombre, self.apellido, self.dni, self.email, self.telefono,
+                self.fecha_inscripcion, self.institucion)
@@ -0,0 +1,620 @@
+import json
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+
+from busqueda import crear_indice_busqueda, consulta_busqueda
+from cache_consultas import CacheDeConsultas
+from conexion import cargar_configuracion, abrir_conexion
+from consultas import (consulta_listado, SQL_REPORTE_TOTAL, SQL_REPORTE_INSTITUCIONES,
+                       SQL_REPORTE_DIARIO)
+from esquema import migrar
+from paginacion import PaginadorKeyset
+
+SQL_CREAR_TABLA = '''
+    CREATE TABLE IF NOT EXISTS inscriptos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nombre TEXT NOT NULL,
+        apellido TEXT NOT NULL,
+        dni TEXT UNIQUE NOT NULL,
+        email TEXT NOT NULL,
+        telefono TEXT,
+        fecha_inscripcion DATE,
+        institucion TEXT
+    )
+'''
+
+SQL_INSERTAR = '''
+    INSERT INTO inscriptos
+    (nombre, apellido, dni, email, telefono, fecha_inscripcion, institucion)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Cargas masivas (importación, datos de ejemplo): no encolan el email de confirmación
+SQL_INSERTAR_SIN_AVISO = '''
+    INSERT INTO inscriptos
+    (nombre, apellido, dni, email, telefono, fecha_inscripcion, institucion, notificar)
+    VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+'''
+
+# Filas que llegan de otro puesto: no pasan por cambios_locales
+SQL_INSERTAR_REMOTO = '''
+    INSERT INTO inscriptos
+    (nombre, apellido, dni, email, telefono, fecha_inscripcion, institucion, origen)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+COLUMNAS_COMPLETAS = "id, nombre, apellido, dni, email, telefono, fecha_inscripcion, institucion"
+
+
+class PoolDeConexiones:
+    """Lo que el repositorio necesita de un motor de base de datos.
+
+    InscriptosRepository recibe el pool por parámetro y solo usa esto:
+    `config`, `ruta_db` (para los procesos que abren su propia conexión)
+    y conexion() / conexion_aparte() / liberar() / cerrar(). Las conexiones tienen
+    que seguir la DB-API (execute, executemany, commit, `with conn:`) y
+    entender el SQL de este módulo.
+    """
+
+    config = None
+    ruta_db = None
+
+    def conexion(self):
+        """Conexión del hilo actual"""
+        raise NotImplementedError
+
+    def conexion_aparte(self):
+        """Conexión nueva que no es la de ningún hilo; la cierra quien la pidió"""
+        raise NotImplementedError
+
+    def liberar(self):
+        """Suelta la conexión del hilo actual"""
+        raise NotImplementedError
+
+    def cerrar(self):
+        """Cierra todas las conexiones"""
+        raise NotImplementedError
+
+
+class PoolSQLite(PoolDeConexiones):
+    """Una conexión por hilo: SQLite no permite compartir una conexión
+    entre hilos, pero sí varias conexiones al mismo archivo (con WAL,
+    las lecturas no esperan a las escrituras).
+    """
+
+    def __init__(self, ruta_db=None, config=None):
+        self.config = config or cargar_configuracion()
+        self.ruta_db = ruta_db or self.config["base_de_datos"]["ruta"]
+        self._local = threading.local()
+        self._todas = []
+        self._candado = threading.Lock()
+
+    def conexion(self):
+        """Conexión del hilo actual (se crea la primera vez)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False solo para poder cerrarla desde cerrar();
+            # cada conexión se usa únicamente en el hilo que la creó
+            conn = abrir_conexion(self.ruta_db, self.config, check_same_thread=False)
+            self._local.conn = conn
+            with self._candado:
+                self._todas.append(conn)
+        return conn
+
+    def conexion_aparte(self):
+        return abrir_conexion(self.ruta_db, self.config)
+
+    def liberar(self):
+        """Cierra la conexión del hilo actual (al terminar un hilo de trabajo)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            with self._candado:
+                self._todas.remove(conn)
+            conn.close()
+
+    def cerrar(self):
+        """Cierra todas las conexiones abiertas por el pool"""
+        with self._candado:
+            todas, self._todas = self._todas, []
+        for conn in todas:
+            conn.close()
+
+
+class InscriptosRepository:
+    """Acceso a los datos de inscriptos, sin depender de la interfaz.
+
+    Lo pueden usar a la vez la ventana, las importaciones y cualquier otro
+    servicio: cada hilo trabaja con su propia conexión del pool. El pool es
+    intercambiable: cualquier PoolDeConexiones sirve. Hoy solo existe
+    PoolSQLite porque el SQL de búsqueda, columnas calculadas y triggers es
+    propio de SQLite.
+    """
+
+    def __init__(self, ruta_db=None, config=None, pool=None):
+        self.pool = pool or PoolSQLite(ruta_db, config)
+        self.ruta_db = self.pool.ruta_db
+        self.config = self.pool.config
+        self.fts_disponible = False
+        # Listado, búsquedas y reportes repetidos salen de memoria mientras
+        # la base no cambie (ver cache_consultas.py)
+        seccion = self.config["cache_consultas"]
+        self.cache = None
+        if seccion.getboolean("activa"):
+            self.cache = CacheDeConsultas(seccion.getint("max_entradas"), seccion.getint("max_filas"))
+
+    def conexion(self):
+        return self.pool.conexion()
+
+    def liberar(self):
+        self.pool.liberar()
+
+    def cerrar(self):
+        if self.cache is not None:
+            self.cache.cerrar()
+        self.pool.cerrar()
+
+    def inicializar(self):
+        """Crea la tabla y aplica migraciones e índices pendientes"""
+        conn = self.conexion()
+        conn.execute(SQL_CREAR_TABLA)
+        conn.commit()
+        migrar(conn)
+        self.fts_disponible = crear_indice_busqueda(conn)
+        self.registrar_cambios(self.config["sincronizacion"].getboolean("activa"))
+        return self
+
+    # --- Escritura ---
+
+    def insertar(self, datos):
+        """Inserta un inscripto y retorna su id. Un DNI repetido lanza
+        sqlite3.IntegrityError y no deja la transacción abierta."""
+        conn = self.conexion()
+        with conn:
+            return conn.execute(SQL_INSERTAR, datos).lastrowid
+
+    def insertar_lote(self, filas):
+        """Inserta muchas filas en una sola transacción (todo o nada).
+
+        Es para cargas masivas: no se manda email de confirmación.
+        """
+        conn = self.conexion()
+        with conn:
+            conn.executemany(SQL_INSERTAR_SIN_AVISO, filas)
+        return len(filas)
+
+    def insertar_varios(self, filas):
+        """Inserta varias filas con un único commit; un DNI repetido solo
+        descarta su propia fila. Retorna una lista de (id, error)."""
+        conn = self.conexion()
+        resultados = []
+        with conn:
+            for datos in filas:
+                try:
+                    resultados.append((conn.execute(SQL_INSERTAR, datos).lastrowid, None))
+                except sqlite3.IntegrityError as e:
+                    resultados.append((None, e))
+        return resultados
+
+    def eliminar(self, id_inscripto):
+        """Borra un inscripto (p. ej. un duplicado); los triggers ajustan índices y
+        resúmenes y, con la sincronización activa, anotan la baja para los demás puestos"""
+        conn = self.conexion()
+        with conn:
+            conn.execute("DELETE FROM inscriptos WHERE id = ?", (id_inscripto,))
+
+    # --- Lectura ---
+
+    def dnis_existentes(self, dnis):
+        """De los DNI dados, retorna el conjunto de los que ya están cargados"""
+        if not dnis:
+            return set()
+        marcadores = ",".join("?" * len(dnis))
+        cursor = self.conexion().execute(
+            f"SELECT dni FROM inscriptos WHERE dni IN ({marcadores})", list(dnis)
+        )
+        return {dni for (dni,) in cursor}
+
+    def cursor_listado(self, criterio=None):
+        """Cursor abierto sobre el listado (para leerlo de a poco)"""
+        return self._cursor_propio(consulta_listado(criterio))
+
+    def cursor_busqueda(self, texto, limite=None):
+        """Cursor abierto sobre el resultado de una búsqueda"""
+        sql, parametros = consulta_busqueda(texto, self.fts_disponible, limite)
+        return self._cursor_propio(sql, parametros)
+
+    def _cursor_propio(self, sql, parametros=()):
+        """Cursor sobre una conexión nueva, solo para él.
+
+        Mientras un SELECT está a medio leer, su conexión sigue viendo la
+        base como estaba al empezar. En la conexión del hilo eso dejaría
+        viejos la caché, version_datos() y las demás lecturas; así solo lo
+        ve este cursor. Quien lo termina cierra también cursor.connection.
+        """
+        conn = self.pool.conexion_aparte()
+        try:
+            return conn.execute(sql, parametros)
+        except Exception:
+            conn.close()
+            raise
+
+    def buscar(self, texto, limite=None):
+        sql, parametros = consulta_busqueda(texto, self.fts_disponible, limite)
+        return self._leer(sql, parametros)
+
+    def busqueda_en_cache(self, texto, limite):
+        """Todas las filas de la búsqueda si una búsqueda con `limite` ya
+        está en la caché y trajo menos (entonces es completa). None si no:
+        no consulta la base, para eso está cursor_busqueda."""
+        if self.cache is None:
+            return None
+        sql, parametros = consulta_busqueda(texto, self.fts_disponible, limite)
+        filas = self.cache.obtener(self.conexion(), sql, parametros)
+        return filas if filas is not None and len(filas) < limite else None
+
+    def paginador(self, tamanio):
+        """Paginador por clave sobre la conexión del hilo actual"""
+        return PaginadorKeyset(self.conexion(), tamanio, self.cache)
+
+    def recorrer_todos(self, tamanio_lote):
+        """Genera lotes con todas las columnas, en orden de id"""
+        cursor = self.conexion().execute(f"SELECT {COLUMNAS_COMPLETAS} FROM inscriptos ORDER BY id")
+        try:
+            while True:
+                lote = cursor.fetchmany(tamanio_lote)
+                if not lote:
+                    return
+                yield lote
+        finally:
+            cursor.close()
+
+    def recorrer_para_documentos(self, solo_presentes, tamanio_lote):
+        """Lotes (id, nombre, apellido, institucion) para credenciales o certificados"""
+        filtro = "WHERE asistencia = 1" if solo_presentes else ""
+        cursor = self.conexion().execute(
+            f"SELECT id, nombre, apellido, institucion FROM inscriptos {filtro} ORDER BY id")
+        try:
+            while True:
+                lote = cursor.fetchmany(tamanio_lote)
+                if not lote:
+                    return
+                yield lote
+        finally:
+            cursor.close()
+
+    def cursor_asistencia(self, desde_id=0):
+        """Datos que necesita el control de asistencia, desde cierto id"""
+        return self.conexion().execute('''
+            SELECT id, dni, nombre, apellido, institucion, asistencia
+            FROM inscriptos
+            WHERE id > ?
+            ORDER BY id
+        ''', (desde_id,))
+
+    def asistencia_registrada(self, id_inscripto):
+        """True si la base ya tiene la asistencia (p. ej. marcada en otro puesto)"""
+        fila = self.conexion().execute("SELECT asistencia FROM inscriptos WHERE id = ?",
+                                       (id_inscripto,)).fetchone()
+        return bool(fila and fila[0])
+
+    def marcar_asistencias(self, marcas):
+        """Guarda varias asistencias [(id, hora)] en una sola transacción"""
+        conn = self.conexion()
+        with conn:
+            conn.executemany(
+                "UPDATE inscriptos SET asistencia = 1, hora_asistencia = ? WHERE id = ? AND asistencia = 0",
+                [(hora, id_inscripto) for id_inscripto, hora in marcas]
+            )
+
+    # --- Sincronización entre puestos ---
+
+    def registrar_cambios(self, activo):
+        """Prende o apaga el registro de cambios para el central ([sincronizacion] activa).
+
+        Al prenderlo se anotan los registros locales que todavía no están
+        anotados y las asistencias, para que el central los reciba.
+        """
+        conn = self.conexion()
+        with conn:
+            antes = conn.execute("SELECT registrar FROM estado_sincronizacion WHERE id = 1").fetchone()[0]
+            if bool(antes) == activo:
+                return
+            conn.execute("UPDATE estado_sincronizacion SET registrar = ? WHERE id = 1", (int(activo),))
+            if not activo:
+                return
+            conn.execute('''
+                INSERT INTO cambios_locales (tipo, id_inscripto, dni, registrado_en)
+                SELECT 'alta', id, dni, COALESCE(fecha_inscripcion, '') || 'T00:00:00.000'
+                FROM inscriptos
+                WHERE origen IS NULL
+                  AND id NOT IN (SELECT id_inscripto FROM cambios_locales WHERE tipo = 'alta')
+            ''')
+            conn.execute('''
+                INSERT INTO cambios_locales (tipo, id_inscripto, dni, registrado_en)
+                SELECT 'asistencia', id, dni, strftime('%Y-%m-%dT%H:%M:%f', 'now')
+                FROM inscriptos WHERE asistencia = 1
+            ''')
+
+    def cambios_pendientes(self, limite):
+        """Cambios locales que el central todavía no confirmó, los más viejos primero.
+
+        Retorna (id, tipo, nombre, apellido, dni, email, telefono, fecha,
+        institucion, hora_asistencia, registrado_en); tipo es 'alta', 'baja'
+        o 'asistencia'. En las bajas los datos vienen en None.
+        """
+        return self.conexion().execute('''
+            SELECT c.id, c.tipo, i.nombre, i.apellido, c.dni, i.email, i.telefono,
+                   i.fecha_inscripcion, i.institucion, i.hora_asistencia, c.registrado_en
+            FROM cambios_locales c LEFT JOIN inscriptos i ON i.id = c.id_inscripto
+            ORDER BY c.id
+            LIMIT ?
+        ''', (limite,)).fetchall()
+
+    def contar_cambios_pendientes(self):
+        return self.conexion().execute("SELECT COUNT(*) FROM cambios_locales").fetchone()[0]
+
+    def confirmar_cambios(self, ids):
+        """Saca del registro de cambios los que el central ya procesó"""
+        conn = self.conexion()
+        with conn:
+            conn.executemany("DELETE FROM cambios_locales WHERE id = ?", [(i,) for i in ids])
+
+    def ultima_secuencia(self):
+        """Hasta qué secuencia del central ya se recibió"""
+        return self.conexion().execute(
+            "SELECT ultima_secuencia FROM estado_sincronizacion WHERE id = 1").fetchone()[0]
+
+    def aplicar_remotos(self, filas, puesto_local):
+        """Aplica las altas, bajas y asistencias que vienen del central, en una transacción.
+
+        filas: (secuencia, nombre, apellido, dni, email, telefono, fecha,
+        institucion, puesto, registrado_en, hora_asistencia, borrado_en). Si
+        un DNI ya existe acá, queda el registro más antiguo (desempata el
+        nombre del puesto), igual que en el central. Un registro local
+        descartado se guarda en conflictos_sincronizacion. Una asistencia
+        marcada en otro puesto se copia si acá todavía no estaba. Un registro
+        borrado en el central se borra acá, salvo que haya un alta local
+        posterior a la baja esperando para enviarse. Retorna (nuevos, conflictos).
+        """
+        if not filas:
+            return 0, 0
+        conn = self.conexion()
+        nuevos = conflictos = 0
+        with conn:
+            # Lo que llega del central no se anota para volver a enviarlo. Las
+            # demás conexiones no ven este 0: al hacer commit ya está restaurado
+            registrar = conn.execute("SELECT registrar FROM estado_sincronizacion WHERE id = 1").fetchone()[0]
+            conn.execute("UPDATE estado_sincronizacion SET registrar = 0 WHERE id = 1")
+            for secuencia, *datos, puesto, registrado_en, hora_asistencia, borrado_en in filas:
+                dni = datos[2]
+                local = conn.execute('''
+                    SELECT id, nombre, apellido, dni, email, telefono, fecha_inscripcion,
+                           institucion, origen
+                    FROM inscriptos WHERE dni = ?
+                ''', (dni,)).fetchone()
+                if borrado_en is not None:
+                    if local is not None:
+                        pendiente = conn.execute(
+                            "SELECT MIN(registrado_en) FROM cambios_locales WHERE id_inscripto = ? AND tipo = 'alta'",
+                            (local[0],)
+                        ).fetchone()[0]
+                        if pendiente is None or pendiente <= borrado_en:
+                            conn.execute("DELETE FROM inscriptos WHERE id = ?", (local[0],))
+                    continue
+                if local is None:
+                    if puesto == puesto_local:
+                        continue  # es nuestra y acá ya no está
+                    id_local = conn.execute(SQL_INSERTAR_REMOTO, (*datos, puesto)).lastrowid
+                    nuevos += 1
+                elif puesto == puesto_local:
+                    id_local = local[0]  # es nuestra y quedó en el central tal cual
+                else:
+                    id_local, *datos_locales, origen = local
+                    pendiente = conn.execute(
+                        "SELECT MIN(registrado_en) FROM cambios_locales WHERE id_inscripto = ? AND tipo = 'alta'",
+                        (id_local,)
+                    ).fetchone()[0]
+                    # Si la local es anterior, el central la va a aceptar al enviarla
+                    if pendiente is None or (pendiente, puesto_local) > (registrado_en, puesto):
+                        if origen is None and datos_locales != datos:
+                            conn.execute('''
+                                INSERT INTO conflictos_sincronizacion (dni, descartado, puesto_ganador, fecha)
+                                VALUES (?, ?, ?, strftime('%Y-%m-%dT%H:%M:%S', 'now'))
+                            ''', (dni, json.dumps(datos_locales, ensure_ascii=False), puesto))
+                            conflictos += 1
+                        conn.execute('''
+                            UPDATE inscriptos
+                            SET nombre = ?, apellido = ?, email = ?, telefono = ?,
+                                fecha_inscripcion = ?, institucion = ?, origen = ?
+                            WHERE id = ?
+                        ''', (datos[0], datos[1], *datos[3:], puesto, id_local))
+                        conn.execute("DELETE FROM cambios_locales WHERE id_inscripto = ? AND tipo = 'alta'",
+                                     (id_local,))
+                if hora_asistencia is not None:
+                    conn.execute(
+                        "UPDATE inscriptos SET asistencia = 1, hora_asistencia = ? WHERE id = ? AND asistencia = 0",
+                        (hora_asistencia, id_local))
+            conn.execute("UPDATE estado_sincronizacion SET ultima_secuencia = ?, registrar = ? WHERE id = 1",
+                         (filas[-1][0], registrar))
+        return nuevos, conflictos
+
+    # --- Duplicados ---
+
+    def pares_descartados(self):
+        """Pares (id menor, id mayor) ya revisados como personas distintas"""
+        return set(self.conexion().execute("SELECT id_a, id_b FROM duplicados_descartados"))
+
+    def descartar_par(self, id_a, id_b):
+        conn = self.conexion()
+        with conn:
+            conn.execute("INSERT OR IGNORE INTO duplicados_descartados (id_a, id_b) VALUES (?, ?)",
+                         (min(id_a, id_b), max(id_a, id_b)))
+
+    # --- Bandeja de salida de emails ---
+
+    def reclamar_notificaciones(self, limite):
+        """Toma hasta `limite` avisos pendientes cuyo turno ya llegó y los
+        marca 'enviando'. Retorna (id, id_inscripto, email, intentos,
+        nombre, apellido, dni)."""
+        conn = self.conexion()
+        with conn:
+            filas = conn.execute('''
+                SELECT n.id, n.id_inscripto, n.email, n.intentos, i.nombre, i.apellido, i.dni
+                FROM notificaciones n JOIN inscriptos i ON i.id = n.id_inscripto
+                WHERE n.estado = 'pendiente' AND n.proximo_intento <= strftime('%Y-%m-%dT%H:%M:%f', 'now')
+                ORDER BY n.proximo_intento
+                LIMIT ?
+            ''', (limite,)).fetchall()
+            conn.executemany('''
+                UPDATE notificaciones
+                SET estado = 'enviando', reclamado_en = strftime('%Y-%m-%dT%H:%M:%f', 'now')
+                WHERE id = ?
+            ''', [(fila[0],) for fila in filas])
+        return filas
+
+    def confirmar_notificaciones(self, ids):
+        conn = self.conexion()
+        with conn:
+            conn.executemany('''
+                UPDATE notificaciones
+                SET estado = 'enviado', enviado_en = strftime('%Y-%m-%dT%H:%M:%f', 'now'), ultimo_error = NULL
+                WHERE id = ?
+            ''', [(id_notificacion,) for id_notificacion in ids])
+
+    def reprogramar_notificaciones(self, reintentos):
+        """reintentos: [(id, segundos hasta el próximo intento o None si no se reintenta, error)]"""
+        conn = self.conexion()
+        with conn:
+            conn.executemany('''
+                UPDATE notificaciones
+                SET intentos = intentos + 1, ultimo_error = ?,
+                    estado = CASE WHEN ? IS NULL THEN 'fallido' ELSE 'pendiente' END,
+                    proximo_intento = strftime('%Y-%m-%dT%H:%M:%f', 'now', '+' || COALESCE(?, 0) || ' seconds')
+                WHERE id = ?
+            ''', [(error, espera, espera, id_notificacion) for id_notificacion, espera, error in reintentos])
+
+    def devolver_notificaciones(self, ids):
+        """Vuelve a 'pendiente' los avisos indicados sin contar el intento"""
+        conn = self.conexion()
+        with conn:
+            conn.executemany("UPDATE notificaciones SET estado = 'pendiente', reclamado_en = NULL WHERE id = ?",
+                             [(id_notificacion,) for id_notificacion in ids])
+
+    def devolver_reclamos_vencidos(self, segundos):
+        """Vuelve a 'pendiente' los avisos 'enviando' reclamados hace más de
+        `segundos` (su enviador se cortó a mitad). Retorna cuántos."""
+        conn = self.conexion()
+        with conn:
+            return conn.execute('''
+                UPDATE notificaciones SET estado = 'pendiente', reclamado_en = NULL
+                WHERE estado = 'enviando'
+                  AND (reclamado_en IS NULL
+                       OR reclamado_en < strftime('%Y-%m-%dT%H:%M:%f', 'now', '-' || ? || ' seconds'))
+            ''', (segundos,)).rowcount
+
+    def estado_notificaciones(self):
+        """{'pendiente': n, 'enviado': n, ...}"""
+        return dict(self.conexion().execute("SELECT estado, count(*) FROM notificaciones GROUP BY estado"))
+
+    # --- Agregados (tablas de resumen) ---
+
+    def total(self):
+        return self._leer(SQL_REPORTE_TOTAL)[0][0]
+
+    def contar_presentes(self):
+        return self._leer("SELECT count(*) FROM inscriptos WHERE asistencia = 1")[0][0]
+
+    def por_institucion(self):
+        return self._leer(SQL_REPORTE_INSTITUCIONES)
+
+    def por_dia(self):
+        return self._leer(SQL_REPORTE_DIARIO)
+
+    def _leer(self, sql, parametros=()):
+        """fetchall() pasando por la caché de consultas, si está activa"""
+        if self.cache is None:
+            return self.conexion().execute(sql, parametros).fetchall()
+        return self.cache.consultar(self.conexion(), sql, parametros)
+
+    def version_datos(self):
+        """Cambia cada vez que alguien (esta conexión u otra) hace commit"""
+        conn = self.conexion()
+        return conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes
+
+
+class EscritorAgrupado:
+    """Agrupa inserciones de varios pedidos en una sola transacción (group commit).
+
+    Cada insertar() devuelve un Future. Un hilo escritor espera unos pocos
+    milisegundos a que se junten más pedidos, los inserta todos y hace un
+    único commit. Un DNI repetido solo hace fallar su propio Future.
+    """
+
+    def __init__(self, repo, espera_ms=None):
+        agrupada = repo.config["escritura_agrupada"]
+        self.repo = repo
+        # Sin agrupación activa no se espera a nadie: solo se juntan los
+        # pedidos que ya estaban en la cola. espera_ms, si se da, manda
+        # sobre la configuración (p. ej. el servidor_api.py)
+        if espera_ms is None:
+            espera_ms = agrupada.getint("espera_ms") if agrupada.getboolean("activa") else 0
+        self.espera = espera_ms / 1000
+        self.max_lote = agrupada.getint("max_lote")
+        self._pedidos = queue.Queue()
+        self._hilo = threading.Thread(target=self._trabajar, daemon=True)
+        self._hilo.start()
+
+    def insertar(self, datos):
+        """Encola una fila para insertar; retorna un Future con el id nuevo"""
+        futuro = Future()
+        self._pedidos.put((datos, futuro))
+        return futuro
+
+    def detener(self):
+        """Escribe lo pendiente y termina el hilo"""
+        self._pedidos.put(None)
+        self._hilo.join()
+
+    def _juntar_lote(self, primero):
+        lote = [primero]
+        limite = time.monotonic() + self.espera
+        while len(lote) < self.max_lote:
+            restante = limite - time.monotonic()
+            try:
+                if restante > 0:
+                    pedido = self._pedidos.get(timeout=restante)
+                else:
+                    pedido = self._pedidos.get_nowait()
+            except queue.Empty:
+                break
+            if pedido is None:
+                self._pedidos.put(None)
+                break
+            lote.append(pedido)
+        return lote
+
+    def _trabajar(self):
+        try:
+            while True:
+                pedido = self._pedidos.get()
+                if pedido is None:
+                    break
+                lote = self._juntar_lote(pedido)
+                try:
+                    resultados = self.repo.insertar_varios([datos for datos, _ in lote])
+                except sqlite3.Error as e:
+                    # Falló el commit: ninguna fila del lote quedó guardada
+                    for _, futuro in lote:
+                        futuro.set_exception(e)
+                    continue
+                for (_, futuro), (id_nuevo, error) in zip(lote, resultados):
+                    if error is not None:
+                        futuro.set_exception(error)
+                    else:
+                        futuro.set_result(id_nuevo)
+        finally:
+            self.repo.liberar()
@@ -0,0 +1,110 @@
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QLabel,
+    QHeaderView, QMessageBox, QAbstractItemView
+)
+
+COLUMNAS = ["Puntaje", "Motivos", "Inscripto A", "Inscripto B"]
+
+
+def describir(fila):
+    """'Gómez, María - DNI 30123456 - maria@mail.com'"""
+    _, nombre, apellido, dni, email, telefono, _, _ = fila
+    partes = [f"{apellido}, {nombre}", f"DNI {dni}", email]
+    if telefono:
+        partes.append(f"Tel. {telefono}")
+    return " - ".join(partes)
+
+
+class RevisionDuplicados(QDialog):
+    """Lista los posibles duplicados para que alguien decida cada par.
+
+    "Son personas distintas" guarda el par para no volver a proponerlo;
+    "Conservar A" / "Conservar B" borran el otro registro.
+    """
+
+    def __init__(self, repo, pares, parent=None):
+        super().__init__(parent)
+        self.repo = repo
+        self.pares = list(pares)
+        self.borrados = []
+        self.setWindowTitle("Posibles duplicados")
+        self.resize(1100, 500)
+        layout = QVBoxLayout(self)
+
+        self.estado = QLabel()
+        layout.addWidget(self.estado)
+
+        self.tabla = QTableWidget(0, len(COLUMNAS))
+        self.tabla.setHorizontalHeaderLabels(COLUMNAS)
+        self.tabla.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.tabla.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
+        self.tabla.verticalHeader().setVisible(False)
+        self.tabla.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.tabla.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tabla.setSelectionMode(QAbstractItemView.SingleSelection)
+        layout.addWidget(self.tabla)
+
+        botones = QHBoxLayout()
+        distintas_btn = QPushButton("Son personas distintas")
+        distintas_btn.clicked.connect(self.marcar_distintas)
+        conservar_a_btn = QPushButton("Conservar A (borrar B)")
+        conservar_a_btn.clicked.connect(lambda: self.conservar(0))
+        conservar_b_btn = QPushButton("Conservar B (borrar A)")
+        conservar_b_btn.clicked.connect(lambda: self.conservar(1))
+        cerrar_btn = QPushButton("Cerrar")
+        cerrar_btn.clicked.connect(self.accept)
+        botones.addWidget(distintas_btn)
+        botones.addWidget(conservar_a_btn)
+        botones.addWidget(conservar_b_btn)
+        botones.addStretch()
+        botones.addWidget(cerrar_btn)
+        layout.addLayout(botones)
+
+        self.mostrar()
+
+    def mostrar(self):
+        self.estado.setText(f"Pares a revisar: {len(self.pares)}" if self.pares
+                            else "No quedan posibles duplicados")
+        self.tabla.setRowCount(len(self.pares))
+        for fila, par in enumerate(self.pares):
+            valores = [f"{par['puntaje']:.2f}", ", ".join(par["motivos"]),
+                       describir(par["a"]), describir(par["b"])]
+            for columna, valor in enumerate(valores):
+                self.tabla.setItem(fila, columna, QTableWidgetItem(valor))
+        if self.pares:
+            self.tabla.selectRow(0)
+
+    def par_seleccionado(self):
+        fila = self.tabla.currentRow()
+        if fila < 0 or fila >= len(self.pares):
+            return None
+        return fila
+
+    def marcar_distintas(self):
+        fila = self.par_seleccionado()
+        if fila is None:
+            return
+        par = self.pares.pop(fila)
+        self.repo.descartar_par(par["a"][0], par["b"][0])
+        self.mostrar()
+        self.tabla.selectRow(min(fila, len(self.pares) - 1))
+
+    def conservar(self, lado):
+        """Borra el registro que no se conserva y saca los pares que lo incluían"""
+        fila = self.par_seleccionado()
+        if fila is None:
+            return
+        par = self.pares[fila]
+        borrar = par["b"] if lado == 0 else par["a"]
+        respuesta = QMessageBox.question(
+            self, "Borrar duplicado",
+            f"¿Borrar este registro?\n\n{describir(borrar)}",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+        )
+        if respuesta != QMessageBox.Yes:
+            return
+        self.repo.eliminar(borrar[0])
+        self.borrados.append(borrar)
+        self.pares = [p for p in self.pares if borrar[0] not in (p["a"][0], p["b"][0])]
+        self.mostrar()
+        self.tabla.selectRow(min(fila, len(self.pares) - 1))
@@ -0,0 +1,227 @@
+"""API HTTP para la preinscripción en línea.
+
+    python inscripciones.py api --puerto 8080
+
+    POST /inscripciones           {"nombre", "apellido", "dni", "email",
+                                   "telefono", "institucion"} -> 201 {"id"}
+    GET  /inscripciones?q=texto   -> {"resultados": [...]}
+    GET  /reportes/total          -> {"total": n}
+    GET  /reportes/instituciones  -> {"instituciones": [{"institucion", "cantidad"}]}
+    GET  /reportes/dias           -> {"dias": [{"fecha", "cantidad"}]}
+
+Un solo hilo con asyncio atiende todas las conexiones (HTTP/1.1 con
+keep-alive). SQLite bloquea, así que:
+
+- Las altas van al EscritorAgrupado, el único que escribe: junta las que
+  llegan dentro de `espera_ms` y las guarda con un solo commit.
+- Las búsquedas y reportes corren en unos pocos hilos de lectura, cada
+  uno con su conexión (WAL: no esperan a las escrituras), y pasan por la
+  caché de consultas.
+
+Las reglas de validación son las del formulario de escritorio. No usa
+bibliotecas externas; carga_api.py sirve para medirla.
+"""
+import asyncio
+import json
+import sqlite3
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from registro import CAMPOS_LISTADO
+from repositorio import EscritorAgrupado
+from validaciones import validar_email, validar_numerico
+
+CAMPOS_ALTA = ("nombre", "apellido", "dni", "email", "telefono", "institucion")
+TIMEOUT_S = 30
+
+
+class ErrorHTTP(Exception):
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+def validar_alta(datos):
+    """Los mismos controles que registrar_participante(); retorna la fila
+    para insertar o lanza ErrorHTTP 400 con el motivo"""
+    if not isinstance(datos, dict):
+        raise ErrorHTTP(400, "Se esperaba un objeto JSON")
+    valores = {}
+    for campo in CAMPOS_ALTA:
+        valor = datos.get(campo) or ""
+        if not isinstance(valor, str):
+            raise ErrorHTTP(400, f"El campo {campo} debe ser texto")
+        valores[campo] = valor.strip()
+    if not all(valores[campo] for campo in ("nombre", "apellido", "dni", "email")):
+        raise ErrorHTTP(400, "Por favor complete todos los campos obligatorios")
+    if not validar_email(valores["email"]):
+        raise ErrorHTTP(400, "El email debe contener el símbolo @")
+    if not validar_numerico(valores["dni"]):
+        raise ErrorHTTP(400, "El DNI debe contener solo números")
+    if valores["telefono"] and not validar_numerico(valores["telefono"]):
+        raise ErrorHTTP(400, "El teléfono debe contener solo números")
+    return (valores["nombre"], valores["apellido"], valores["dni"], valores["email"],
+            valores["telefono"], date.today().isoformat(), valores["institucion"])
+
+
+class ServidorAPI:
+    def __init__(self, repo, host="127.0.0.1", puerto=8080, espera_ms=5, hilos_lectura=4,
+                 limite_busqueda=100, max_cuerpo_kb=16):
+        self.repo = repo
+        self.host = host
+        self.puerto = puerto
+        self.limite_busqueda = limite_busqueda
+        self.max_cuerpo = max_cuerpo_kb * 1024
+        self.escritor = EscritorAgrupado(repo, espera_ms)
+        self.lectores = ThreadPoolExecutor(hilos_lectura, thread_name_prefix="api-lectura")
+        self.rutas = {
+            ("POST", "/inscripciones"): self.registrar,
+            ("GET", "/inscripciones"): self.buscar,
+            ("GET", "/reportes/total"): self.reporte_total,
+            ("GET", "/reportes/instituciones"): self.reporte_instituciones,
+            ("GET", "/reportes/dias"): self.reporte_dias,
+        }
+
+    @classmethod
+    def desde_configuracion(cls, repo, host=None, puerto=None):
+        seccion = repo.config["api"]
+        return cls(repo, host or seccion["host"], puerto or seccion.getint("puerto"),
+                   espera_ms=seccion.getint("espera_ms"),
+                   hilos_lectura=seccion.getint("hilos_lectura"),
+                   limite_busqueda=seccion.getint("limite_busqueda"),
+                   max_cuerpo_kb=seccion.getint("max_cuerpo_kb"))
+
+    async def servir(self, listo=None):
+        """Atiende hasta que se cancele la tarea; `listo` (un Event) avisa que ya escucha"""
+        escucha = await asyncio.start_server(self.atender, self.host, self.puerto, backlog=1024)
+        self.puerto = escucha.sockets[0].getsockname()[1]
+        if listo is not None:
+            listo.set()
+        async with escucha:
+            await escucha.serve_forever()
+
+    def detener(self):
+        """Guarda las altas pendientes y cierra los hilos de lectura"""
+        self.escritor.detener()
+        self.lectores.shutdown(wait=True)
+
+    # --- Endpoints ---
+
+    async def registrar(self, consulta, cuerpo):
+        try:
+            datos = json.loads(cuerpo or b"null")
+        except (ValueError, UnicodeDecodeError):
+            raise ErrorHTTP(400, "JSON inválido")
+        fila = validar_alta(datos)
+        try:
+            id_nuevo = await asyncio.wrap_future(self.escritor.insertar(fila))
+        except sqlite3.IntegrityError:
+            raise ErrorHTTP(409, "El DNI ya está registrado")
+        return 201, {"id": id_nuevo}
+
+    async def buscar(self, consulta, cuerpo):
+        texto = consulta.get("q", [""])[0]
+        try:
+            limite = int(consulta.get("limite", [self.limite_busqueda])[0])
+        except ValueError:
+            raise ErrorHTTP(400, "limite debe ser un número")
+        if not 1 <= limite <= self.limite_busqueda:
+            raise ErrorHTTP(400, f"limite debe estar entre 1 y {self.limite_busqueda}")
+        filas = await self._leer(self.repo.buscar, texto, limite)
+        return 200, {"resultados": [dict(zip(CAMPOS_LISTADO, fila)) for fila in filas]}
+
+    async def reporte_total(self, consulta, cuerpo):
+        return 200, {"total": await self._leer(self.repo.total)}
+
+    async def reporte_instituciones(self, consulta, cuerpo):
+        filas = await self._leer(self.repo.por_institucion)
+        return 200, {"instituciones": [{"institucion": institucion, "cantidad": cantidad}
+                                       for institucion, cantidad in filas]}
+
+    async def reporte_dias(self, consulta, cuerpo):
+        filas = await self._leer(self.repo.por_dia)
+        return 200, {"dias": [{"fecha": fecha, "cantidad": cantidad} for fecha, cantidad in filas]}
+
+    async def _leer(self, funcion, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.lectores, funcion, *args)
+
+    # --- HTTP ---
+
+    async def atender(self, lector, escritor):
+        try:
+            while True:
+                try:
+                    encabezado = await asyncio.wait_for(lector.readuntil(b"\r\n\r\n"), TIMEOUT_S)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._responder(escritor, 431, {"error": "Encabezados demasiado largos"}, False)
+                    break
+                seguir = await self._procesar(encabezado, lector, escritor)
+                if not seguir:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _procesar(self, encabezado, lector, escritor):
+        """Atiende un pedido; retorna False si hay que cerrar la conexión"""
+        try:
+            linea, *lineas = encabezado.decode("latin-1").split("\r\n")
+            metodo, destino, version = linea.split(" ", 2)
+            encabezados = {}
+            for texto in lineas:
+                if texto:
+                    nombre, _, valor = texto.partition(":")
+                    encabezados[nombre.strip().lower()] = valor.strip()
+            largo = int(encabezados.get("content-length", 0))
+            if largo < 0:
+                raise ValueError(largo)
+        except ValueError:
+            await self._responder(escritor, 400, {"error": "Pedido HTTP inválido"}, False)
+            return False
+
+        conexion = encabezados.get("connection", "").lower()
+        seguir = conexion != "close" if version == "HTTP/1.1" else conexion == "keep-alive"
+        if largo > self.max_cuerpo:
+            await self._responder(escritor, 413, {"error": "Cuerpo demasiado grande"}, False)
+            return False
+        cuerpo = await lector.readexactly(largo) if largo else b""
+
+        url = urlsplit(destino)
+        funcion = self.rutas.get((metodo, url.path))
+        try:
+            if funcion is None:
+                metodos = [m for m, ruta in self.rutas if ruta == url.path]
+                if metodos:
+                    raise ErrorHTTP(405, f"Método no permitido (usar {', '.join(metodos)})")
+                raise ErrorHTTP(404, "No existe")
+            estado, respuesta = await funcion(parse_qs(url.query), cuerpo)
+        except ErrorHTTP as e:
+            estado, respuesta = e.estado, {"error": str(e)}
+        except sqlite3.Error as e:
+            print(f"API: {e}", file=sys.stderr)
+            estado, respuesta = 503, {"error": "Base de datos no disponible"}
+        except Exception:
+            # Un error de programación no debe cortar la conexión sin respuesta
+            print(f"API: error en {metodo} {url.path}", file=sys.stderr)
+            traceback.print_exc()
+            estado, respuesta = 500, {"error": "Error interno"}
+        await self._responder(escritor, estado, respuesta, seguir)
+        return seguir
+
+    async def _responder(self, escritor, estado, respuesta, seguir):
+        cuerpo = json.dumps(respuesta, ensure_ascii=False).encode()
+        escritor.write(
+            f"HTTP/1.1 {estado} {HTTPStatus(estado).phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(cuerpo)}\r\n"
+            f"Connection: {'keep-alive' if seguir else 'close'}\r\n"
+            f"\r\n".encode() + cuerpo
+        )
+        await escritor.drain()
@@ -0,0 +1,111 @@
+import socket
+import sqlite3
+import sys
+import threading
+
+from central import CentralSQLite
+
+ESPERA_MAXIMA_S = 60
+
+
+class Replicador:
+    """Sincroniza este puesto con el servidor central en segundo plano.
+
+    El formulario, la importación, el control de asistencia y la revisión
+    de duplicados escriben solo en la base local (triggers anotan cada
+    alta, asistencia y baja en cambios_locales), así que registrar nunca
+    espera a la red. Cada `intervalo` segundos un hilo envía los cambios
+    pendientes en lotes y trae los de los demás puestos. Si el central no
+    responde, los cambios esperan en la base local y se reintenta cada vez
+    más espaciado.
+    """
+
+    def __init__(self, repo, central, puesto, intervalo=2.0, max_lote=500):
+        self.repo = repo
+        self.central = central
+        self.puesto = puesto
+        self.intervalo = intervalo
+        self.max_lote = max_lote
+        self.ultimo_error = None
+        self.recibidos = 0
+        self.conflictos = 0
+        self._despertar = threading.Event()
+        self._detenido = threading.Event()
+        self._hilo = None
+
+    @classmethod
+    def desde_configuracion(cls, repo):
+        """Replicador según [sincronizacion] de configuracion.ini, o None si está apagada"""
+        seccion = repo.config["sincronizacion"]
+        if not seccion.getboolean("activa"):
+            return None
+        return cls(repo, CentralSQLite(seccion["central"]),
+                   seccion["puesto"] or socket.gethostname(),
+                   intervalo=seccion.getfloat("intervalo_s"),
+                   max_lote=seccion.getint("max_lote"))
+
+    def iniciar(self):
+        self._hilo = threading.Thread(target=self._trabajar, daemon=True)
+        self._hilo.start()
+
+    def detener(self):
+        """Hace una última ronda y termina el hilo"""
+        if self._hilo is None:
+            return
+        self._detenido.set()
+        self._despertar.set()
+        self._hilo.join()
+        self._hilo = None
+
+    def sincronizar_pronto(self):
+        """Adelanta la próxima ronda (p. ej. después de un registro)"""
+        self._despertar.set()
+
+    def sincronizar(self):
+        """Una ronda completa: enviar todo lo pendiente y recibir lo nuevo.
+
+        Retorna (enviados, rechazados, recibidos).
+        """
+        enviados = rechazados = 0
+        while True:
+            pendientes = self.repo.cambios_pendientes(self.max_lote)
+            if not pendientes:
+                break
+            aceptados = self.central.enviar(self.puesto, [fila[1:] for fila in pendientes])
+            # Los rechazados perdieron contra otro puesto: el registro
+            # ganador llega en la recepción y reemplaza al local
+            self.repo.confirmar_cambios([fila[0] for fila in pendientes])
+            enviados += len(pendientes)
+            rechazados += aceptados.count(False)
+
+        recibidos = 0
+        while True:
+            filas = self.central.cambios_desde(self.repo.ultima_secuencia(), self.max_lote)
+            if not filas:
+                break
+            nuevos, conflictos = self.repo.aplicar_remotos(filas, self.puesto)
+            recibidos += nuevos
+            self.conflictos += conflictos
+        self.recibidos += recibidos
+        return enviados, rechazados, recibidos
+
+    def _trabajar(self):
+        espera = self.intervalo
+        try:
+            while True:
+                self._despertar.wait(espera)
+                self._despertar.clear()
+                try:
+                    self.sincronizar()
+                    self.ultimo_error = None
+                    espera = self.intervalo
+                except (sqlite3.Error, OSError) as e:
+                    # Sin conexión con el central: se sigue trabajando en local
+                    self.ultimo_error = str(e)
+                    espera = min(espera * 2, ESPERA_MAXIMA_S)
+                    print(f"Sincronización: {e}", file=sys.stderr)
+                if self._detenido.is_set():
+                    break
+        finally:
+            self.central.cerrar()
+            self.repo.liberar()
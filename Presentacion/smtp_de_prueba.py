@@ -0,0 +1,107 @@
+"""Servidor SMTP de prueba: recibe los emails y los cuenta, sin mandarlos.
+
+    python smtp_de_prueba.py --puerto 8025 --fallar 0.1
+
+Con [notificaciones] servidor = localhost y puerto = 8025 en
+configuracion.ini, sirve para ver el envío sin tocar un servidor real.
+--fallar rechaza al azar esa proporción de mensajes con un error
+temporal (451), para ver los reintentos. Al cortarlo con Ctrl+C
+muestra cuántos mensajes recibió y cuántos llegaron repetidos (mismo
+Message-ID).
+"""
+import argparse
+import asyncio
+import random
+import sys
+from collections import Counter
+
+
+class ServidorDePrueba:
+    def __init__(self, fallar=0.0, demora_s=0.0):
+        self.fallar = fallar
+        self.demora_s = demora_s
+        self.recibidos = Counter()
+        self.rechazados = 0
+        self.conexiones = 0
+
+    async def atender(self, lector, escritor):
+        self.conexiones += 1
+
+        def responder(linea):
+            escritor.write(linea.encode() + b"\r\n")
+
+        responder("220 smtp de prueba")
+        try:
+            while True:
+                linea = await lector.readuntil(b"\r\n")
+                comando = linea.decode(errors="replace").strip()
+                verbo = comando[:4].upper()
+                if verbo in ("EHLO", "HELO"):
+                    responder("250-smtp de prueba")
+                    responder("250 AUTH PLAIN")
+                elif verbo == "AUTH":
+                    responder("235 autenticado")
+                elif verbo in ("MAIL", "RCPT", "RSET", "NOOP"):
+                    responder("250 ok")
+                elif verbo == "DATA":
+                    responder("354 terminar con <CRLF>.<CRLF>")
+                    datos = await lector.readuntil(b"\r\n.\r\n")
+                    if self.demora_s:
+                        await asyncio.sleep(self.demora_s)
+                    if random.random() < self.fallar:
+                        self.rechazados += 1
+                        responder("451 error temporal de prueba")
+                    else:
+                        self.recibidos[_message_id(datos)] += 1
+                        responder("250 recibido")
+                elif verbo == "QUIT":
+                    responder("221 chau")
+                    await escritor.drain()
+                    break
+                else:
+                    responder("502 comando no implementado")
+                await escritor.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+    def resumen(self):
+        repetidos = sum(veces - 1 for veces in self.recibidos.values())
+        return (f"Conexiones: {self.conexiones}, recibidos: {sum(self.recibidos.values())}, "
+                f"repetidos: {repetidos}, rechazados a propósito: {self.rechazados}")
+
+
+def _message_id(datos):
+    for linea in datos.split(b"\r\n"):
+        if linea.lower().startswith(b"message-id:"):
+            return linea[11:].strip().decode(errors="replace")
+    return None
+
+
+async def servir(servidor, puerto):
+    escucha = await asyncio.start_server(servidor.atender, "127.0.0.1", puerto)
+    async with escucha:
+        await escucha.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--puerto", type=int, default=8025)
+    parser.add_argument("--fallar", type=float, default=0.0,
+                        help="proporción de mensajes a rechazar con 451 (0.1 = 10%%)")
+    parser.add_argument("--demora", type=float, default=0.0, help="segundos que tarda cada mensaje")
+    args = parser.parse_args(argv)
+
+    servidor = ServidorDePrueba(args.fallar, args.demora)
+    print(f"Escuchando en 127.0.0.1:{args.puerto} (Ctrl+C para terminar)", file=sys.stderr)
+    try:
+        asyncio.run(servir(servidor, args.puerto))
+    except KeyboardInterrupt:
+        pass
+    print(servidor.resumen())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+from PySide6.QtCore import Qt, QRectF, QPointF
+from PySide6.QtGui import QPainter, QPixmap, QColor, QFont, QPen, QPolygonF
+from PySide6.QtWidgets import QWidget
+
+COLOR_FONDO = QColor("#ffffff")
+COLOR_TEXTO = QColor("#2c3e50")
+COLOR_SECUNDARIO = QColor("#7f8c8d")
+COLOR_BARRA = QColor("#27ae60")
+COLOR_LINEA = QColor("#3498db")
+COLOR_GRILLA = QColor("#ecf0f1")
+
+MAX_BARRAS = 10
+
+
+class TableroReportes(QWidget):
+    """Tablero con totales, barras por institución y línea de inscripciones por día.
+
+    El dibujo se hace fuera de pantalla sobre un QPixmap y solo se rehace
+    cuando cambian los datos o el tamaño; paintEvent solo copia la imagen.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(360)
+        self._datos = None
+        self._imagen = None
+
+    def actualizar(self, total, instituciones, diario):
+        """Recibe los agregados; si no cambiaron no se redibuja nada"""
+        datos = (total, tuple(instituciones), tuple(diario))
+        if datos == self._datos:
+            return False
+        self._datos = datos
+        self._renderizar()
+        self.update()
+        return True
+
+    # --- Dibujo fuera de pantalla ---
+
+    def _renderizar(self):
+        if self._datos is None or self.width() <= 0 or self.height() <= 0:
+            self._imagen = None
+            return
+        escala = self.devicePixelRatioF()
+        imagen = QPixmap(int(self.width() * escala), int(self.height() * escala))
+        imagen.setDevicePixelRatio(escala)
+        imagen.fill(COLOR_FONDO)
+
+        pintor = QPainter(imagen)
+        pintor.setRenderHint(QPainter.Antialiasing)
+        total, instituciones, diario = self._datos
+
+        ancho = self.width()
+        alto = self.height()
+        margen = 20
+
+        # Total
+        pintor.setPen(COLOR_TEXTO)
+        pintor.setFont(QFont(self.font().family(), 20, QFont.Bold))
+        pintor.drawText(QRectF(margen, 10, ancho - 2 * margen, 40),
+                        Qt.AlignLeft | Qt.AlignVCenter, f"Total de inscriptos: {total}")
+
+        area_graficos = QRectF(margen, 60, ancho - 2 * margen, alto - 60 - margen)
+        mitad = area_graficos.width() / 2
+        self._dibujar_barras(pintor, QRectF(area_graficos.left(), area_graficos.top(),
+                                            mitad - margen / 2, area_graficos.height()),
+                             instituciones)
+        self._dibujar_linea(pintor, QRectF(area_graficos.left() + mitad + margen / 2, area_graficos.top(),
+                                           mitad - margen / 2, area_graficos.height()),
+                            diario)
+        pintor.end()
+        self._imagen = imagen
+
+    def _dibujar_titulo(self, pintor, rect, texto):
+        pintor.setPen(COLOR_TEXTO)
+        pintor.setFont(QFont(self.font().family(), 12, QFont.Bold))
+        pintor.drawText(QRectF(rect.left(), rect.top(), rect.width(), 24), Qt.AlignLeft, texto)
+        return QRectF(rect.left(), rect.top() + 30, rect.width(), rect.height() - 30)
+
+    def _dibujar_barras(self, pintor, rect, instituciones):
+        rect = self._dibujar_titulo(pintor, rect, "Inscriptos por institución")
+        filas = sorted(instituciones, key=lambda fila: fila[1], reverse=True)
+        if len(filas) > MAX_BARRAS:
+            otras = sum(cantidad for _, cantidad in filas[MAX_BARRAS - 1:])
+            filas = filas[:MAX_BARRAS - 1] + [("Otras", otras)]
+        if not filas:
+            return
+
+        maximo = max(cantidad for _, cantidad in filas) or 1
+        ancho_etiqueta = rect.width() * 0.4
+        alto_fila = min(rect.height() / len(filas), 34)
+        pintor.setFont(QFont(self.font().family(), 10))
+        for i, (institucion, cantidad) in enumerate(filas):
+            y = rect.top() + i * alto_fila
+            pintor.setPen(COLOR_TEXTO)
+            pintor.drawText(QRectF(rect.left(), y, ancho_etiqueta - 8, alto_fila),
+                            Qt.AlignRight | Qt.AlignVCenter,
+                            pintor.fontMetrics().elidedText(institucion or "Sin institución",
+                                                            Qt.ElideRight, int(ancho_etiqueta - 8)))
+            largo = (rect.width() - ancho_etiqueta - 50) * cantidad / maximo
+            barra = QRectF(rect.left() + ancho_etiqueta, y + alto_fila * 0.15, largo, alto_fila * 0.7)
+            pintor.fillRect(barra, COLOR_BARRA)
+            pintor.setPen(COLOR_SECUNDARIO)
+            pintor.drawText(QRectF(barra.right() + 4, y, 50, alto_fila),
+                            Qt.AlignLeft | Qt.AlignVCenter, str(cantidad))
+
+    def _dibujar_linea(self, pintor, rect, diario):
+        rect = self._dibujar_titulo(pintor, rect, "Inscripciones por día")
+        puntos_datos = [(fecha, cantidad) for fecha, cantidad in diario if fecha]
+        if not puntos_datos:
+            return
+
+        grafico = QRectF(rect.left() + 40, rect.top(), rect.width() - 50, rect.height() - 30)
+        maximo = max(cantidad for _, cantidad in puntos_datos) or 1
+
+        # Grilla y escala
+        pintor.setFont(QFont(self.font().family(), 9))
+        for paso in range(5):
+            y = grafico.bottom() - grafico.height() * paso / 4
+            pintor.setPen(COLOR_GRILLA)
+            pintor.drawLine(QPointF(grafico.left(), y), QPointF(grafico.right(), y))
+            pintor.setPen(COLOR_SECUNDARIO)
+            pintor.drawText(QRectF(rect.left(), y - 8, 36, 16), Qt.AlignRight | Qt.AlignVCenter,
+                            str(round(maximo * paso / 4)))
+
+        n = len(puntos_datos)
+        poligono = QPolygonF()
+        for i, (_, cantidad) in enumerate(puntos_datos):
+            x = grafico.left() + (grafico.width() * i / (n - 1) if n > 1 else grafico.width() / 2)
+            y = grafico.bottom() - grafico.height() * cantidad / maximo
+            poligono.append(QPointF(x, y))
+        pintor.setPen(QPen(COLOR_LINEA, 2))
+        pintor.drawPolyline(poligono)
+
+        # Primera y última fecha como referencia
+        pintor.setPen(COLOR_SECUNDARIO)
+        pintor.drawText(QRectF(grafico.left(), grafico.bottom() + 6, 100, 20),
+                        Qt.AlignLeft, puntos_datos[0][0])
+        pintor.drawText(QRectF(grafico.right() - 100, grafico.bottom() + 6, 100, 20),
+                        Qt.AlignRight, puntos_datos[-1][0])
+
+    # --- Eventos de Qt ---
+
+    def resizeEvent(self, event):
+        self._renderizar()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if self._imagen is None:
+            return
+        pintor = QPainter(self)
+        pintor.drawPixmap(0, 0, self._imagen)
+        pintor.end()
@@ -0,0 +1,51 @@
+import threading
+
+from PySide6.QtCore import QObject, Signal
+
+
+class TareaEnSegundoPlano(QObject):
+    """Corre una función larga en otro hilo y avisa el avance con señales.
+
+    La función recibe como argumentos con nombre progreso(actual, total) y
+    cancelado (threading.Event), además de los que se pasen al crear la tarea.
+    Si se indica liberar, se llama dentro del hilo al terminar (por ejemplo
+    repo.liberar para cerrar la conexión que usó ese hilo).
+    """
+
+    progreso = Signal(int, int)
+    terminado = Signal(object)
+    fallo = Signal(str)
+
+    def __init__(self, funcion, *args, parent=None, liberar=None, **kwargs):
+        super().__init__(parent)
+        self.funcion = funcion
+        self.liberar = liberar
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelado = threading.Event()
+        self._hilo = threading.Thread(target=self._correr, daemon=True)
+
+    def iniciar(self):
+        self._hilo.start()
+
+    def cancelar(self):
+        self.cancelado.set()
+
+    def esperar(self, timeout=None):
+        self._hilo.join(timeout)
+
+    def _correr(self):
+        try:
+            resultado = self.funcion(
+                *self.args,
+                progreso=self.progreso.emit,
+                cancelado=self.cancelado,
+                **self.kwargs
+            )
+        except Exception as e:
+            self.fallo.emit(str(e))
+        else:
+            self.terminado.emit(resultado)
+        finally:
+            if self.liberar is not None:
+                self.liberar()
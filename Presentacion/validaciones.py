@@ -0,0 +1,8 @@
+def validar_email(email):
+    """Valida que el email contenga @"""
+    return '@' in email
+
+
+def validar_numerico(texto):
+    """Valida que el texto contenga solo números"""
+    return texto.isdigit() if texto else True
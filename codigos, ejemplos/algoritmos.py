@@ -1,3 +1,7 @@
+# Para muchos participantes conviene RegistrantStore (almacen_inscriptos.py):
+# busca por DNI con un diccionario y mantiene índices ordenados.
+# Comparación: python benchmark_almacen.py
+
 # Ejemplo de Búsqueda Secuencial
 def buscar_por_dni(lista, dni_buscado):
     for persona in lista:
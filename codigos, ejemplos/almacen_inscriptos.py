@@ -0,0 +1,118 @@
+# Almacén de inscriptos en memoria con índices
+# Reemplaza la búsqueda secuencial y el ordenamiento burbuja de algoritmos.py
+# cuando la cantidad de participantes es grande.
+import unicodedata
+from bisect import bisect_left, bisect_right, insort
+
+
+def clave_texto(texto):
+    """Clave para ordenar texto sin distinguir mayúsculas ni tildes"""
+    descompuesto = unicodedata.normalize("NFKD", texto or "")
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).casefold()
+
+
+# Campo -> función que arma la clave de orden de ese campo
+CLAVES = {
+    "dni": lambda p: p["dni"].zfill(12),   # "9" antes que "10"
+    "apellido": lambda p: clave_texto(p.get("apellido")),
+    "nombre": lambda p: clave_texto(p.get("nombre")),
+    "fecha": lambda p: p.get("fecha") or "",
+}
+
+
+class RegistrantStore:
+    """Inscriptos en memoria con un índice hash por DNI y listas ordenadas.
+
+    - buscar_por_dni: O(1) (diccionario)
+    - agregar / quitar: O(log n) para ubicar + desplazamiento de la lista
+    - ordenados_por: recorre un índice ya ordenado, sin volver a ordenar
+    """
+
+    INDICES = ("dni", "apellido", "fecha")
+
+    def __init__(self, participantes=None):
+        self._por_dni = {}
+        # campo -> lista ordenada de (clave, dni)
+        self._indices = {campo: [] for campo in self.INDICES}
+        # dni -> claves con las que entró a cada índice: el participante se
+        # puede modificar por fuera (buscar_por_dni lo entrega tal cual)
+        self._claves = {}
+        if participantes:
+            self.cargar(participantes)
+
+    def __len__(self):
+        return len(self._por_dni)
+
+    def __contains__(self, dni):
+        return dni in self._por_dni
+
+    def cargar(self, participantes):
+        """Carga muchos participantes juntos: ordena una vez en lugar de n inserciones.
+
+        Si algún DNI está repetido no carga ninguno (el almacén queda como estaba).
+        """
+        nuevos = {}
+        for participante in participantes:
+            dni = participante["dni"]
+            if dni in self._por_dni or dni in nuevos:
+                raise ValueError(f"DNI repetido: {dni}")
+            nuevos[dni] = participante
+        self._por_dni.update(nuevos)
+        for dni, participante in nuevos.items():
+            self._claves[dni] = self._claves_de(participante)
+        for posicion, campo in enumerate(self.INDICES):
+            self._indices[campo] = sorted((claves[posicion], dni) for dni, claves in self._claves.items())
+
+    def agregar(self, participante):
+        dni = participante["dni"]
+        if dni in self._por_dni:
+            raise ValueError(f"DNI repetido: {dni}")
+        self._por_dni[dni] = participante
+        self._claves[dni] = claves = self._claves_de(participante)
+        for campo, clave in zip(self.INDICES, claves):
+            insort(self._indices[campo], (clave, dni))
+
+    def quitar(self, dni):
+        participante = self._por_dni.pop(dni)
+        for campo, clave in zip(self.INDICES, self._claves.pop(dni)):
+            indice = self._indices[campo]
+            del indice[bisect_left(indice, (clave, dni))]
+        return participante
+
+    def _claves_de(self, participante):
+        return tuple(CLAVES[campo](participante) for campo in self.INDICES)
+
+    def buscar_por_dni(self, dni):
+        """Equivalente a algoritmos.buscar_por_dni, pero O(1)"""
+        return self._por_dni.get(dni)
+
+    def ordenados_por(self, *campos):
+        """Participantes ordenados por uno o más campos (p. ej. "apellido", "nombre").
+
+        El primer campo debe tener índice; los siguientes desempatan.
+        """
+        principal, *resto = campos
+        indice = self._indices[principal]
+        if not resto:
+            return [self._por_dni[dni] for _, dni in indice]
+
+        claves_resto = [CLAVES[campo] for campo in resto]
+        resultado = []
+        inicio = 0
+        while inicio < len(indice):
+            # Grupo de empatados en el campo principal
+            fin = bisect_right(indice, (indice[inicio][0], "\uffff"))
+            grupo = [self._por_dni[dni] for _, dni in indice[inicio:fin]]
+            if len(grupo) > 1:
+                grupo.sort(key=lambda p: tuple(clave(p) for clave in claves_resto))
+            resultado.extend(grupo)
+            inicio = fin
+        return resultado
+
+    def rango(self, campo, desde, hasta):
+        """Participantes con desde <= campo <= hasta (por ejemplo fechas)"""
+        indice = self._indices[campo]
+        clave = CLAVES[campo]
+        inicio = bisect_left(indice, (clave({campo: desde, "dni": desde}),))
+        fin = bisect_right(indice, (clave({campo: hasta, "dni": hasta}), "\uffff"))
+        return [self._por_dni[dni] for _, dni in indice[inicio:fin]]
@@ -0,0 +1,91 @@
+# Compara la búsqueda secuencial y el ordenamiento burbuja de algoritmos.py
+# con el almacén indexado de almacen_inscriptos.py
+#
+#   python benchmark_almacen.py                  (10.000, 100.000 y 1.000.000)
+#   python benchmark_almacen.py 10000 50000
+import random
+import sys
+import time
+
+from algoritmos import buscar_por_dni, ordenar_por_dni
+from almacen_inscriptos import RegistrantStore
+
+TAMANIOS = [10_000, 100_000, 1_000_000]
+BUSQUEDAS = 200
+# Arriba de esto el burbuja tardaría minutos u horas: se estima con n²
+MAX_BURBUJA = 5_000
+
+NOMBRES = ["Ana", "Juan", "María", "José", "Lucía", "Martín", "Sofía", "Diego", "Valentina", "Tomás"]
+APELLIDOS = ["González", "Rodríguez", "Fernández", "López", "Martínez", "Pérez", "Gómez", "Díaz",
+             "Álvarez", "Romero", "Sosa", "Benítez", "Acosta", "Medina", "Suárez"]
+
+
+def generar_participantes(n, aleatorio):
+    dnis = aleatorio.sample(range(10_000_000, 50_000_000), n)
+    participantes = []
+    for dni in dnis:
+        nombre = aleatorio.choice(NOMBRES)
+        participantes.append({
+            'nombre': nombre,
+            'apellido': aleatorio.choice(APELLIDOS),
+            'dni': str(dni),
+            'email': f"{nombre.lower()}{dni}@mail.com",
+            'fecha': f"2025-{aleatorio.randint(1, 12):02d}-{aleatorio.randint(1, 28):02d}",
+            'asistencia': False,
+        })
+    return participantes
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def mostrar(descripcion, segundos, estimado=False):
+    marca = " (estimado)" if estimado else ""
+    print(f"  {descripcion:<52} {segundos * 1000:12.3f} ms{marca}")
+
+
+def comparar(n, aleatorio):
+    print(f"\n{n} participantes")
+    participantes = generar_participantes(n, aleatorio)
+    buscados = [aleatorio.choice(participantes)['dni'] for _ in range(BUSQUEDAS)]
+
+    # Búsqueda: promedio por DNI buscado
+    tiempo = medir(lambda: [buscar_por_dni(participantes, dni) for dni in buscados])
+    mostrar("buscar_por_dni (secuencial)", tiempo / BUSQUEDAS)
+
+    almacen = RegistrantStore()
+    mostrar("RegistrantStore.cargar (índices)", medir(lambda: almacen.cargar(participantes)))
+    tiempo = medir(lambda: [almacen.buscar_por_dni(dni) for dni in buscados])
+    mostrar("RegistrantStore.buscar_por_dni", tiempo / BUSQUEDAS)
+
+    # Ordenamiento por DNI
+    if n <= MAX_BURBUJA:
+        mostrar("ordenar_por_dni (burbuja)", medir(lambda: ordenar_por_dni(list(participantes))))
+    else:
+        muestra = participantes[:MAX_BURBUJA]
+        tiempo = medir(lambda: ordenar_por_dni(list(muestra)))
+        mostrar("ordenar_por_dni (burbuja)", tiempo * (n / MAX_BURBUJA) ** 2, estimado=True)
+    mostrar("sorted() por DNI", medir(lambda: sorted(participantes, key=lambda p: p['dni'])))
+    mostrar("RegistrantStore.ordenados_por('dni')", medir(lambda: almacen.ordenados_por("dni")))
+    mostrar("RegistrantStore.ordenados_por('apellido', 'nombre')",
+            medir(lambda: almacen.ordenados_por("apellido", "nombre")))
+
+    # Altas sueltas con los índices ya armados
+    nuevos = generar_participantes(1000, aleatorio)
+    nuevos = [p for p in nuevos if p['dni'] not in almacen]
+    tiempo = medir(lambda: [almacen.agregar(p) for p in nuevos])
+    mostrar("RegistrantStore.agregar (por alta)", tiempo / len(nuevos))
+
+
+def main(argv):
+    tamanios = [int(valor) for valor in argv] or TAMANIOS
+    aleatorio = random.Random(0)
+    for n in tamanios:
+        comparar(n, aleatorio)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])